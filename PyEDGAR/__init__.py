@@ -1,3 +1,7 @@
+from . import aio
 from . import company
 from . import filings
+from . import index
+from . import store
 from . import util
+from . import xbrl
@@ -0,0 +1,9 @@
+from .cik_tools import getCIK
+from .company import getCompanyProfile
+from .company import getInfo
+from .filings import getAllFilings
+from .session import AsyncEdgarSession
+from .session import AsyncRateLimiter
+from .session import configureSession
+from .session import getSession
+from .session import setSession
@@ -0,0 +1,46 @@
+from ..util.cik_tools import CIK_URL, __cikParams, __matchCIK
+from ..util.memo import memoized
+from ..util.ticker_index import getTickerIndex
+from .session import getSession
+
+from requests import exceptions
+import logging
+
+
+@memoized
+async def getCIK(ticker: str, use_index: bool=True) -> str:
+    """Function to get the Central Index Key (CIK) for a given ticker,
+    without blocking the event loop. See `PyEDGAR.util.getCIK`.
+    
+    Arguments:
+        ticker {str} -- Ticker to be matched.
+    
+    Keyword Arguments:
+        use_index {bool} -- Flag to look up the ticker in the shared ticker
+                            index first (default: {True}).
+    
+    Raises:
+        exceptions.RequestException -- Thrown if the request fails.
+        LookupError -- Thrown if a CIK match is not found, or if there is more
+                       than one CIK corresponding to the candidate ticker.
+    
+    Returns:
+        str -- Corresponding CIK of the ticker.
+    """
+
+    # Looking up ticker in local index
+    index = getTickerIndex() if use_index else None
+    if index is not None and ticker in index:
+        return index.getCIK(ticker=ticker)
+
+    # Making request
+    r = await getSession().get(url=CIK_URL, params=__cikParams(ticker=ticker),
+                               endpoint='cik')
+
+    # Handling failed request
+    if not r.ok:
+        logging.warning('Request failed: CIK lookup for ticker {0} with '
+                        'error {1}'.format(ticker, r.status_code))
+        raise exceptions.RequestException('Request failed')
+
+    return __matchCIK(ticker=ticker, page_text=r.text)
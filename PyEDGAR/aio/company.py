@@ -0,0 +1,87 @@
+from ..company.parser import __parseFeedInfo, __parseHTML
+from ..filings.container import Filings
+from ..filings.parser import __parseHTML as __parseFilingsHTML
+from ..util.memo import memoized
+from .downloader import __downloadFilings, __downloadInfoPage
+
+import logging
+
+
+@memoized
+async def getInfo(cik: str, includeRaw: bool=False,
+                  engine: str='regex') -> dict:
+    """Function to get company information, given a company CIK, without
+    blocking the event loop. See `PyEDGAR.company.getInfo`.
+    
+    Arguments:
+        cik {str} -- CIK of the target company.
+    
+    Keyword Arguments:
+        includeRaw {bool} -- Flag to include raw HTML (default: {False}).
+        engine {str} -- Page parsing engine, 'regex' or 'bs4'
+                        (default: {'regex'}).
+    
+    Returns:
+        dict -- Dictionary of company infomation. See user guide for more info.
+    """
+
+    logging.info('Getting company info for CIK {0}'.format(cik))
+
+    # Getting page HTML
+    page_html = await __downloadInfoPage(cik=cik)
+
+    # Parsing page HTML
+    company_parsed = __parseHTML(page_html=page_html, engine=engine)
+    # Reattaching CIK
+    company_parsed['cik'] = cik
+
+    # Raw page HTML
+    if includeRaw: company_parsed['_raw'] = [page_html]
+
+    return company_parsed
+
+
+@memoized
+async def getCompanyProfile(cik: str, max_workers: int=1,
+                            engine: str='etree',
+                            columnar: bool=False) -> dict:
+    """Function to get both company information and filings, given a company
+    CIK, from the listings pages alone, without blocking the event loop. See
+    `PyEDGAR.company.getCompanyProfile`.
+    
+    Arguments:
+        cik {str} -- CIK of the target company.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of listings pages requested
+                             concurrently (default: {1}).
+        engine {str} -- Listings parsing engine, 'etree' or 'bs4'
+                        (default: {'etree'}).
+        columnar {bool} -- Flag to return filings in a columnar `Filings`
+                           container instead of a list; requires NumPy
+                           (default: {False}).
+    
+    Raises:
+        LookupError -- Raised if the listings have no company information.
+    
+    Returns:
+        dict -- Dictionary with the company 'info' and 'filings'.
+    """
+
+    logging.info('Getting company profile for CIK {0}'.format(cik))
+
+    # Getting page XML for filings
+    pages_html = await __downloadFilings(cik=cik, max_workers=max_workers)
+
+    # Parsing company information from the first page
+    company_parsed = __parseFeedInfo(page_xml=pages_html[0])
+    # Reattaching CIK
+    company_parsed['cik'] = cik
+
+    # Parsing filings
+    filings_parsed = __parseFilingsHTML(pages_html=pages_html, engine=engine)
+
+    if columnar:
+        filings_parsed = Filings.fromRecords(filings=filings_parsed)
+
+    return {'info': company_parsed, 'filings': filings_parsed}
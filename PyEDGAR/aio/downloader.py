@@ -0,0 +1,136 @@
+from ..company.downloader import INFO_URL, __infoParams
+from ..filings.downloader import LISTINGS_URL, __hasNextPage, __listingsParams
+from .session import getSession
+
+from collections import deque
+from requests import exceptions
+import asyncio
+import logging
+
+
+async def __downloadFilings(cik: str, max_workers: int=1,
+                            filing_type: str='', before: str='') -> list:
+    """Function to download the XML text of listings pages for a given CIK
+    from the EDGAR database, without blocking the event loop.
+
+    Up to `max_workers` pages are requested concurrently ahead of the last
+    page known to exist. Requests past the end of the listing, and all
+    outstanding requests if the download is cancelled, are cancelled.
+
+    Arguments:
+        cik {str} -- Target CIK.
+
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of concurrent page requests
+                             (default: {1}).
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
+
+    Returns:
+        list -- List of page XML, comprising full listing metadata for CIK.
+    """
+
+    count = 100  # Number of results per page (limited by SEC)
+
+    pages = []
+    in_flight = deque()  # Requests in flight, in page order
+    next_idx = 0  # Start index of the next page to request
+
+    def request(start_idx: int) -> asyncio.Future:
+        return asyncio.ensure_future(__makeRequest(
+            cik=cik, start_idx=start_idx, count=count,
+            filing_type=filing_type, before=before))
+
+    try:
+        for _ in range(max(1, max_workers)):
+            in_flight.append(request(start_idx=next_idx))
+            next_idx += count
+
+        while in_flight:
+            # Waiting for the earliest outstanding page
+            page_text = await in_flight.popleft()
+            pages.append(page_text)
+
+            if not __hasNextPage(page_text=page_text):
+                break
+
+            # Keeping the window full
+            in_flight.append(request(start_idx=next_idx))
+            next_idx += count
+    finally:
+        # Dropping speculative (or, if cancelled, all) requests
+        for task in in_flight:
+            task.cancel()
+
+    return pages
+
+
+async def __makeRequest(cik: str, start_idx: int, count: int,
+                        filing_type: str='', before: str='') -> str:
+    """Function to make a request to the EDGAR system to retrieve XML with
+    listings for a given CIK.
+
+    Arguments:
+        cik {str} -- Target CIK.
+        start_idx {int} -- Start index (for pagination).
+        count {int} -- Count of results per page.
+
+    Keyword Arguments:
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
+
+    Raises:
+        exceptions.RetryError -- Raised if the request still fails after the
+                                 shared session's retries.
+
+    Returns:
+        str -- Page text with XML listing metadata for the target CIK.
+    """
+
+    # Building parameters for request
+    params = __listingsParams(cik=cik, start_idx=start_idx, count=count,
+                              filing_type=filing_type, before=before)
+
+    # Making request; retried by the shared session on transient failures
+    r = await getSession().get(url=LISTINGS_URL, params=params,
+                               endpoint='filings')
+
+    # Raise Exception if the request still doesn't work
+    if not r.ok:
+        logging.error('Listings request failed for CIK {0}, error {1}'
+                      .format(cik, r.status_code))
+        raise exceptions.RetryError('Listings request retry failed for CIK {0}'
+                                    .format(cik))
+
+    return r.text
+
+
+async def __downloadInfoPage(cik: str) -> str:
+    """Function to download the company page from EDGAR, given a target CIK,
+    without blocking the event loop.
+
+    Arguments:
+        cik {str} -- CIK of target company.
+
+    Raises:
+        exceptions.RequestException -- Raised if page load fails.
+
+    Returns:
+        str -- Page HTML.
+    """
+
+    # Making request
+    r = await getSession().get(url=INFO_URL, params=__infoParams(cik=cik),
+                               endpoint='info')
+
+    # Handling failed request
+    if not r.ok:
+        logging.warning('Request failed: Information lookup for CIK {0}, '
+                        'error {1}'.format(cik, r.status_code))
+        raise exceptions.RequestException('Request Failed')
+
+    return r.text
@@ -0,0 +1,45 @@
+from ..filings.container import Filings
+from ..filings.parser import __parseHTML
+from ..util.memo import memoized
+from .downloader import __downloadFilings
+
+from typing import Union
+import logging
+
+
+@memoized
+async def getAllFilings(cik: str, max_workers: int=1, engine: str='etree',
+                        columnar: bool=False) -> Union[list, Filings]:
+    """Function to get a list of SEC filings, given a company CIK, without
+    blocking the event loop. See `PyEDGAR.filings.getAllFilings`.
+    
+    Arguments:
+        cik {str} -- CIK of the target company.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of listings pages requested
+                             concurrently (default: {1}).
+        engine {str} -- Listings parsing engine, 'etree' or 'bs4'
+                        (default: {'etree'}).
+        columnar {bool} -- Flag to return a columnar `Filings` container
+                           instead of a list; requires NumPy
+                           (default: {False}).
+    
+    Returns:
+        Union[list, Filings] -- Structured list of dictionaries with filing
+                                information for a given company, or a
+                                `Filings` container if `columnar` is set.
+    """
+
+    logging.info('Getting filings from EDGAR for CIK {0}'.format(cik))
+
+    # Getting page HTML for filings
+    pages_html = await __downloadFilings(cik=cik, max_workers=max_workers)
+
+    # Parsing HTML
+    filings_parsed = __parseHTML(pages_html=pages_html, engine=engine)
+
+    if columnar:
+        return Filings.fromRecords(filings=filings_parsed)
+
+    return filings_parsed
@@ -0,0 +1,393 @@
+from ..util import instrumentation
+from ..util.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from ..util.session import DEFAULT_USER_AGENT, EDGAR_BASE_URL
+from ..util.session import EDGAR_MAX_RATE, rebaseURL
+
+from requests import exceptions, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib.parse import urlsplit
+import asyncio
+import logging
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncRateLimiter(object):
+    """Token bucket rate limiter for coroutines sharing an event loop.
+
+    Tokens are replenished continuously at `rate` tokens per second, up to a
+    maximum of `burst` tokens. Each call to `acquire` consumes one token,
+    waiting until one is available. Waiting coroutines are served in order,
+    and a cancelled coroutine consumes no token.
+
+    The limiter may be used from successive event loops (e.g. successive
+    `asyncio.run` calls), but not from several event loops at once.
+    """
+
+    def __init__(self, rate: float=EDGAR_MAX_RATE, burst: int=1):
+        """Constructor for the rate limiter.
+
+        Keyword Arguments:
+            rate {float} -- Tokens replenished per second
+                            (default: {EDGAR_MAX_RATE}).
+            burst {int} -- Maximum number of tokens that may accumulate
+                           (default: {1}).
+
+        Raises:
+            ValueError -- Raised if the rate or burst are not positive.
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError('Rate and burst must be positive')
+
+        self.rate = float(rate)
+        self.burst = burst
+        self.__tokens = float(burst)
+        self.__last = time.monotonic()
+        self.__lock = None  # Created in the running event loop on use
+        self.__loop = None
+
+    def pause(self, duration: float):
+        """Function to stop handing out tokens for a period of time, e.g.
+        while the server is throttling requests. Overlapping pauses are
+        extended to the latest end time.
+
+        Arguments:
+            duration {float} -- Pause duration, in seconds.
+        """
+
+        now = time.monotonic()
+        # Tokens are replenished from the end of the pause
+        self.__tokens = 0.0
+        self.__last = max(self.__last, now + duration)
+
+    async def acquire(self) -> float:
+        """Function to acquire a single token, waiting until available.
+
+        Returns:
+            float -- Time spent waiting for the token, in seconds.
+        """
+
+        # Locks are bound to the event loop they are first used in
+        loop = asyncio.get_running_loop()
+        if self.__loop is not loop:
+            self.__lock, self.__loop = asyncio.Lock(), loop
+
+        start = time.monotonic()
+
+        # Only the first waiter sleeps; the others queue on the lock
+        async with self.__lock:
+            while True:
+                now = time.monotonic()
+                # Replenishing tokens for elapsed time; none while paused
+                self.__tokens = min(self.burst, self.__tokens
+                                    + max(0.0, now - self.__last) * self.rate)
+                self.__last = max(self.__last, now)
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return time.monotonic() - start
+
+                # Time until the next token is available
+                await asyncio.sleep((self.__last - now)
+                                    + (1 - self.__tokens) / self.rate)
+
+
+class AsyncEdgarSession(object):
+    """Transport for requests made to EDGAR from coroutines, with the same
+    rate limiting and retry behaviour as `EdgarSession`.
+
+    Wraps a pooled `aiohttp.ClientSession` per event loop, created in the
+    running loop on first use and closed when the loop shuts down (e.g. at
+    the end of `asyncio.run`), and a shared `AsyncRateLimiter`. Responses are
+    returned as fully read `requests.Response` objects, so that they are
+    handled exactly as those of the blocking session. The response cache is
+    not used.
+    """
+
+    def __init__(self, user_agent: str=DEFAULT_USER_AGENT,
+                 max_rate: float=EDGAR_MAX_RATE, pool_size: int=10,
+                 timeout: float=60.0, retry_policy: RetryPolicy=None,
+                 circuit_breaker: CircuitBreaker=None,
+                 base_url: str=EDGAR_BASE_URL):
+        """Constructor for the asynchronous EDGAR session.
+
+        Keyword Arguments:
+            user_agent {str} -- User-Agent header sent with each request
+                                (default: {DEFAULT_USER_AGENT}).
+            max_rate {float} -- Maximum requests per second; capped at
+                                `EDGAR_MAX_RATE` (default: {EDGAR_MAX_RATE}).
+            pool_size {int} -- Maximum number of open connections
+                               (default: {10}).
+            timeout {float} -- Total timeout of each request attempt, in
+                               seconds (default: {60.0}).
+            retry_policy {RetryPolicy} -- Policy for retrying failed
+                                          requests; the default policy if
+                                          None (default: {None}).
+            circuit_breaker {CircuitBreaker} -- Per-host circuit breaker; the
+                                                default breaker if None
+                                                (default: {None}).
+            base_url {str} -- Base URL to which EDGAR requests are sent
+                              (default: {EDGAR_BASE_URL}).
+
+        Raises:
+            ImportError -- Raised if aiohttp is not installed.
+        """
+
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for asynchronous requests')
+
+        if max_rate > EDGAR_MAX_RATE:
+            logging.warning('Request rate {0}/s exceeds the EDGAR limit; '
+                            'capping at {1}/s'.format(max_rate,
+                                                      EDGAR_MAX_RATE))
+            max_rate = EDGAR_MAX_RATE
+
+        self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.limiter = AsyncRateLimiter(rate=max_rate)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.base_url = base_url
+        self.__sessions = dict()  # Event loop to client session and closer
+
+    async def get(self, url: str, params: dict=None, endpoint: str=None,
+                  **kwargs) -> Response:
+        """Function to make a rate-limited GET request, retrying it on
+        throttling, transient errors and connection failures.
+
+        Arguments:
+            url {str} -- Target URL.
+
+        Keyword Arguments:
+            params {dict} -- Query parameters (default: {None}).
+            endpoint {str} -- Name of the endpoint (e.g. 'filings'), reported
+                              to instrumentation hooks (default: {None}).
+            **kwargs -- Passed through to `aiohttp.ClientSession.get`.
+
+        Raises:
+            CircuitOpenError -- Raised if the circuit breaker for the host is
+                                open.
+            exceptions.RequestException -- Raised if the request still fails
+                                           to connect after all retries.
+
+        Returns:
+            Response -- Response to the request; the last response if all
+                        retries failed.
+        """
+
+        # Sending EDGAR requests to the configured base URL
+        url = rebaseURL(url=url, base_url=self.base_url)
+
+        host = urlsplit(url).netloc
+        attempt = 0
+        throttles, throttled = 0, 0.0
+
+        while True:
+            if not self.circuit_breaker.allow(host=host):
+                raise CircuitOpenError('Circuit open for host {0}'
+                                       .format(host))
+
+            r = None
+            try:
+                r = await self.__sendOnce(url=url, params=params,
+                                          endpoint=endpoint,
+                                          retries=attempt + throttles,
+                                          **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            else:
+                if self.retry_policy.isThrottled(response=r):
+                    delay = self.retry_policy.throttleDelay(
+                        throttles=throttles, waited=throttled, response=r)
+
+                    # Waited too long on throttling; returning the response
+                    if delay is None:
+                        return r
+
+                    logging.warning('Request to {0} throttled ({1}); pausing '
+                                    'requests for {2:.2f}s'
+                                    .format(url, r.status_code, delay))
+
+                    # Pausing all requests to EDGAR, not just this one; the
+                    # host is up, so the circuit breaker is left as is
+                    self.limiter.pause(duration=delay)
+                    throttles += 1
+                    throttled += delay
+                    continue
+
+                if not self.retry_policy.isRetryable(response=r):
+                    self.circuit_breaker.recordSuccess(host=host)
+                    return r
+
+            self.circuit_breaker.recordFailure(host=host)
+            delay = self.retry_policy.delay(attempt=attempt, response=r)
+
+            # Retries exhausted; returning the failed response, if any
+            if delay is None:
+                if r is None:
+                    raise exceptions.ConnectionError(repr(error)) from error
+                return r
+
+            logging.warning('Request to {0} failed ({1}); retrying in '
+                            '{2:.2f}s'.format(url, r.status_code if r
+                                              is not None else repr(error),
+                                              delay))
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __sendOnce(self, url: str, params: dict, endpoint: str,
+                         retries: int, **kwargs) -> Response:
+        """Function to make a single rate-limited GET request, reading the
+        full response and reporting it to instrumentation hooks.
+
+        Arguments:
+            url {str} -- Target URL.
+            params {dict} -- Query parameters.
+            endpoint {str} -- Name of the endpoint.
+            retries {int} -- Number of previous attempts of this request.
+            **kwargs -- Passed through to `aiohttp.ClientSession.get`.
+
+        Returns:
+            Response -- Response to the request.
+        """
+
+        session = await self.__clientSession()
+
+        # Query parameters are sent as strings, in order
+        if params is not None:
+            params = [(k, str(v)) for k, v in params.items()]
+
+        wait = await self.limiter.acquire()
+        start = time.perf_counter()
+
+        async with session.get(url, params=params, **kwargs) as ar:
+            content = await ar.read()
+
+        # Building an equivalent response of the blocking session
+        r = Response()
+        r.status_code = ar.status
+        r.url = str(ar.url)
+        r.reason = ar.reason
+        r.headers = CaseInsensitiveDict(ar.headers)
+        r.encoding = get_encoding_from_headers(r.headers)
+        r._content = content
+
+        if instrumentation.enabled():
+            instrumentation.emit(instrumentation.RequestEvent(
+                endpoint=endpoint, url=r.url, status=r.status_code,
+                bytes=len(content), latency=time.perf_counter() - start,
+                retries=retries, wait=wait, from_cache=False))
+
+        return r
+
+    async def __clientSession(self) -> 'aiohttp.ClientSession':
+        """Function to get the client session of the running event loop,
+        creating it if it does not yet exist or was closed.
+
+        Returns:
+            aiohttp.ClientSession -- Client session of the running loop.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        # Forgetting sessions of event loops that have since closed
+        for other in [l for l in self.__sessions if l.is_closed()]:
+            del self.__sessions[other]
+
+        session, _ = self.__sessions.get(loop, (None, None))
+
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': self.user_agent,
+                         'Accept-Encoding': 'gzip, deflate'})
+
+            # Async generators are finalized by the loop before it closes
+            closer = self.__closeOnShutdown(session=session)
+            await closer.asend(None)
+            self.__sessions[loop] = (session, closer)
+
+        return session
+
+    @staticmethod
+    async def __closeOnShutdown(session: 'aiohttp.ClientSession'):
+        """Async generator closing a client session when it is finalized,
+        i.e. by `loop.shutdown_asyncgens` when its event loop shuts down.
+
+        Arguments:
+            session {aiohttp.ClientSession} -- Client session to close.
+        """
+
+        try:
+            yield
+        finally:
+            await session.close()
+
+    async def close(self):
+        """Function to close all pooled connections of the running event
+        loop.
+        """
+
+        session, closer = self.__sessions.pop(asyncio.get_running_loop(),
+                                              (None, None))
+
+        if session is not None:
+            await closer.aclose()
+
+
+# Shared session used by all asynchronous functions; created lazily
+_session = None
+
+
+def getSession() -> AsyncEdgarSession:
+    """Function to get the shared asynchronous EDGAR session, creating it
+    with the default configuration if it does not yet exist.
+
+    Returns:
+        AsyncEdgarSession -- Shared asynchronous EDGAR session.
+    """
+
+    global _session
+
+    if _session is None:
+        _session = AsyncEdgarSession()
+
+    return _session
+
+
+def setSession(session: AsyncEdgarSession):
+    """Function to replace the shared asynchronous EDGAR session. Passing
+    `None` restores the default session on next use. The previous session is
+    not closed; see `AsyncEdgarSession.close`.
+
+    Arguments:
+        session {AsyncEdgarSession} -- New shared session.
+    """
+
+    global _session
+
+    _session = session
+
+
+def configureSession(**kwargs) -> AsyncEdgarSession:
+    """Function to create a new shared asynchronous EDGAR session with the
+    given configuration. See `AsyncEdgarSession` for the accepted keyword
+    arguments.
+
+    Returns:
+        AsyncEdgarSession -- Newly configured shared session.
+    """
+
+    session = AsyncEdgarSession(**kwargs)
+    setSession(session=session)
+
+    return session
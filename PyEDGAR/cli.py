@@ -0,0 +1,436 @@
+from .company.info import getCompanyProfile, getInfo
+from .filings.container import FIELDS
+from .filings.filings import getAllFilings, getFilingByType
+from .util.batch import __runBatch
+from .util.cache import ResponseCache
+from .util.cik_tools import getCIK
+from .util.session import configureSession, DEFAULT_USER_AGENT
+from .util.session import EDGAR_BASE_URL
+from .util.ticker_index import loadTickerIndex, refreshTickerIndex
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+
+# Suffix of checkpoint files, appended to the output path by default
+CHECKPOINT_SUFFIX = '.checkpoint'
+
+# Columns of Parquet output; company columns followed by listing fields
+PARQUET_COLUMNS = ('input', 'cik', 'company', 'sic',
+                   'incorporation_state') + FIELDS
+
+
+class JSONLWriter(object):
+    """Writer of export results as JSON lines, one object per company. Each
+    line is flushed to disk as soon as it is written, so results are durable
+    as they arrive.
+    """
+
+    def __init__(self, path: str):
+        """Constructor for the JSONL writer. Existing output is appended to,
+        after removing an incomplete last line, if any.
+
+        Arguments:
+            path {str} -- Path of the output file.
+        """
+
+        # Inputs written by a previous run
+        self.written = list()
+
+        if os.path.exists(path):
+            with open(path, 'rb+') as f:
+                end = 0
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    self.written += [json.loads(line)['input']]
+                    end += len(line)
+                # Removing an incomplete line, from an interrupted write
+                f.truncate(end)
+
+        self.__file = open(path, 'a')
+
+    def write(self, result: dict) -> list:
+        """Function to write the result for an input.
+
+        Arguments:
+            result {dict} -- Export result.
+
+        Returns:
+            list -- Inputs whose results are now durable.
+        """
+
+        self.__file.write(json.dumps(result) + '\n')
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+        return [result['input']]
+
+    def close(self) -> list:
+        """Function to close the output file.
+
+        Returns:
+            list -- Inputs whose results are now durable.
+        """
+
+        self.__file.close()
+
+        return list()
+
+
+class ParquetWriter(object):
+    """Writer of export results as a Parquet dataset, one row per filing.
+
+    Rows are written to numbered part files in the output directory. Each
+    part file is written under a temporary name and renamed once complete,
+    after every `rows_per_file` rows, so that an interrupted run never
+    leaves a corrupt part file in the dataset.
+    """
+
+    def __init__(self, path: str, rows_per_file: int=100000):
+        """Constructor for the Parquet writer. Existing part files are kept,
+        and new part files are numbered after them; incomplete part files,
+        from an interrupted run, are removed.
+
+        Arguments:
+            path {str} -- Path of the output directory.
+
+        Keyword Arguments:
+            rows_per_file {int} -- Number of rows after which a part file is
+                                   completed (default: {100000}).
+
+        Raises:
+            ImportError -- Raised if pyarrow is not installed.
+        """
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.__pa, self.__pq = pa, pq
+        self.path = path
+        self.rows_per_file = rows_per_file
+        self.schema = pa.schema([(k, pa.string()) for k in PARQUET_COLUMNS])
+
+        os.makedirs(path, exist_ok=True)
+        for f in os.listdir(path):
+            if f.endswith('.parquet.tmp'):
+                os.remove(os.path.join(path, f))
+        parts = [os.path.join(path, f) for f in sorted(os.listdir(path))
+                 if f.endswith('.parquet')]
+
+        # Inputs written by a previous run
+        self.written = list()
+        for part in parts:
+            self.written += pq.read_table(part, columns=['input']) \
+                .column('input').unique().to_pylist()
+
+        self.__part = len(parts)
+        self.__writer = None
+        self.__rows = 0
+        self.__pending = list()  # Inputs in the current part file
+
+    def write(self, result: dict) -> list:
+        """Function to write the result for an input.
+
+        Arguments:
+            result {dict} -- Export result.
+
+        Returns:
+            list -- Inputs whose results are now durable.
+        """
+
+        info = result.get('info') or dict()
+        company = {'input': result['input'],
+                   'cik': result.get('cik'),
+                   'company': info.get('name'),
+                   'sic': info.get('metadata', dict()).get('sic'),
+                   'incorporation_state': info.get('metadata', dict())
+                   .get('incorporation_state')}
+        rows = [dict(company, **filing)
+                for filing in result.get('filings') or list()]
+
+        if rows:
+            if self.__writer is None:
+                self.__writer = self.__pq.ParquetWriter(
+                    self.__partPath() + '.tmp', self.schema)
+            self.__writer.write_table(self.__pa.Table.from_pylist(
+                rows, schema=self.schema))
+            self.__rows += len(rows)
+
+        self.__pending += [result['input']]
+
+        if self.__rows >= self.rows_per_file:
+            return self.close()
+
+        return list()
+
+    def close(self) -> list:
+        """Function to complete the current part file.
+
+        Returns:
+            list -- Inputs whose results are now durable.
+        """
+
+        if self.__writer is not None:
+            self.__writer.close()
+            with open(self.__partPath() + '.tmp', 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(self.__partPath() + '.tmp', self.__partPath())
+            self.__writer = None
+            self.__part += 1
+            self.__rows = 0
+
+        durable, self.__pending = self.__pending, list()
+
+        return durable
+
+    def __partPath(self) -> str:
+        """Function to get the path of the current part file.
+
+        Returns:
+            str -- Path of the current part file.
+        """
+
+        return os.path.join(self.path,
+                            'part-{0:05d}.parquet'.format(self.__part))
+
+
+def main(argv: list=None):
+    """Function to run the command-line exporter.
+
+    Reads tickers or CIKs, one per line, resolves them to CIKs, and fetches
+    their company information and filings concurrently, streaming results to
+    a JSONL file (one object per company) or a Parquet dataset (one row per
+    filing) as they arrive. Completed inputs are recorded in a checkpoint
+    file, so that an interrupted run can be resumed by running the same
+    command again, e.g.:
+
+        python -m PyEDGAR tickers.txt -o filings.jsonl --types 10-K,10-Q
+
+    Keyword Arguments:
+        argv {list} -- Command-line arguments; `sys.argv` if None
+                       (default: {None}).
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m PyEDGAR',
+        description='Export company information and filings from EDGAR.')
+    parser.add_argument('input',
+                        help="file of tickers or CIKs, one per line; '-' for "
+                             'standard input')
+    parser.add_argument('-o', '--output', required=True,
+                        help='path of the JSONL file or Parquet directory')
+    parser.add_argument('--format', choices=('jsonl', 'parquet'),
+                        help='output format; inferred from the output path '
+                             'if not given')
+    parser.add_argument('--fetch', choices=('both', 'info', 'filings'),
+                        default='both', help='what to fetch per company')
+    parser.add_argument('--types', default='',
+                        help='comma-separated filing types to fetch, e.g. '
+                             '10-K,10-Q; all if not given')
+    parser.add_argument('--exact', action='store_true',
+                        help='match filing types exactly, excluding e.g. '
+                             'amendments')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='number of companies fetched concurrently')
+    parser.add_argument('--cache',
+                        help='path of a persistent response cache')
+    parser.add_argument('--ticker-index', nargs='?', const='',
+                        help='resolve tickers with the bulk ticker index, '
+                             'loaded from this path if given (and '
+                             'downloaded otherwise)')
+    parser.add_argument('--user-agent', default=DEFAULT_USER_AGENT,
+                        help='User-Agent sent to EDGAR')
+    parser.add_argument('--base-url', default=EDGAR_BASE_URL,
+                        help='base URL of EDGAR, e.g. that of a local '
+                             'stand-in server')
+    parser.add_argument('--checkpoint',
+                        help='path of the checkpoint file (default: output '
+                             'path with a {0} suffix)'
+                             .format(CHECKPOINT_SUFFIX))
+    parser.add_argument('--restart', action='store_true',
+                        help='discard the checkpoint and previous output, '
+                             'and fetch all inputs')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='log progress')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose
+                        else logging.WARNING)
+
+    output_format = args.format or ('parquet' if args.output.rstrip('/')
+                                    .endswith('.parquet') else 'jsonl')
+    if output_format == 'parquet' and args.fetch == 'info':
+        parser.error('Parquet output has one row per filing; use JSONL to '
+                     'export company information only')
+
+    # Configuring shared session
+    cache = ResponseCache(path=args.cache) if args.cache else None
+    configureSession(user_agent=args.user_agent, cache=cache,
+                     base_url=args.base_url)
+
+    if args.ticker_index is not None:
+        if args.ticker_index and os.path.exists(args.ticker_index):
+            loadTickerIndex(path=args.ticker_index)
+        else:
+            refreshTickerIndex(path=args.ticker_index or None)
+
+    # Reading inputs, skipping those completed by a previous run
+    if args.input == '-':
+        inputs = [line.strip() for line in sys.stdin]
+    else:
+        with open(args.input) as f:
+            inputs = [line.strip() for line in f]
+    inputs = list(dict.fromkeys(i for i in inputs if i))
+
+    checkpoint = args.checkpoint or args.output.rstrip('/') + \
+        CHECKPOINT_SUFFIX
+    done = set()
+    if args.restart:
+        # Starting over; discarding previous output
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        __removeOutput(path=args.output, output_format=output_format)
+    elif os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            done = set(line.strip() for line in f)
+        logging.info('Resuming; skipping {0} completed inputs'
+                     .format(len(done)))
+    elif __outputFiles(path=args.output, output_format=output_format):
+        # Appending would duplicate the results of the previous run
+        parser.error('{0} already contains output, but has no checkpoint; '
+                     'use --restart to replace it'.format(args.output))
+
+    types = [t.strip() for t in args.types.split(',') if t.strip()]
+
+    def export(entry: str) -> dict:
+        return __exportCompany(entry=entry, fetch=args.fetch, types=types,
+                               exact=args.exact)
+
+    if output_format == 'parquet':
+        writer = ParquetWriter(path=args.output)
+    else:
+        writer = JSONLWriter(path=args.output)
+
+    exported = failed = 0
+
+    with open(checkpoint, 'a') as checkpoint_file:
+        def record(durable: list):
+            for entry in durable:
+                checkpoint_file.write(entry + '\n')
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+        # Recording inputs written before an interruption, but not recorded
+        written = [w for w in writer.written if w not in done]
+        if written:
+            logging.info('Recovering {0} written inputs missing from the '
+                         'checkpoint'.format(len(written)))
+            record(durable=written)
+            done.update(written)
+
+        try:
+            for entry, result in __runBatch(
+                    func=export, keys=[i for i in inputs if i not in done],
+                    max_workers=args.workers):
+                if isinstance(result, Exception):
+                    # Failed inputs are not checkpointed, and are retried on
+                    # the next run
+                    failed += 1
+                    continue
+                exported += 1
+                record(durable=writer.write(result=result))
+        finally:
+            record(durable=writer.close())
+
+    logging.log(logging.WARNING if failed else logging.INFO,
+                'Exported {0} companies ({1} failed, {2} skipped)'.format(
+                    exported, failed, len(done & set(inputs))))
+
+    if failed:
+        sys.exit(1)
+
+
+def __outputFiles(path: str, output_format: str) -> list:
+    """Function to list the existing output files of an export.
+
+    Arguments:
+        path {str} -- Path of the JSONL file or Parquet directory.
+        output_format {str} -- Output format, 'jsonl' or 'parquet'.
+
+    Returns:
+        list -- Paths of existing output files, including incomplete Parquet
+                part files.
+    """
+
+    if output_format == 'parquet':
+        if not os.path.isdir(path):
+            return list()
+        return [os.path.join(path, f) for f in sorted(os.listdir(path))
+                if f.endswith(('.parquet', '.parquet.tmp'))]
+
+    return [path] if os.path.isfile(path) and os.path.getsize(path) else \
+        list()
+
+
+def __removeOutput(path: str, output_format: str):
+    """Function to remove the existing output files of an export.
+
+    Arguments:
+        path {str} -- Path of the JSONL file or Parquet directory.
+        output_format {str} -- Output format, 'jsonl' or 'parquet'.
+    """
+
+    for output_file in __outputFiles(path=path, output_format=output_format):
+        os.remove(output_file)
+
+
+def __exportCompany(entry: str, fetch: str='both', types: list=None,
+                    exact: bool=False) -> dict:
+    """Function to fetch the company information and filings for an input.
+
+    Arguments:
+        entry {str} -- Ticker or CIK.
+
+    Keyword Arguments:
+        fetch {str} -- What to fetch, 'both', 'info' or 'filings'
+                       (default: {'both'}).
+        types {list} -- Filing types to fetch; all if empty
+                        (default: {None}).
+        exact {bool} -- Flag to match filing types exactly
+                        (default: {False}).
+
+    Returns:
+        dict -- Dictionary of the input, its CIK, and its company 'info' and
+                'filings' (None if not fetched).
+    """
+
+    cik = entry.zfill(10) if entry.isdigit() else getCIK(ticker=entry)
+
+    result = {'input': entry, 'cik': cik, 'info': None, 'filings': None}
+
+    if fetch == 'both' and not types:
+        # Company information is read from the listings pages
+        result.update(getCompanyProfile(cik=cik))
+        return result
+
+    if fetch in ('both', 'info'):
+        result['info'] = getInfo(cik=cik)
+
+    if fetch in ('both', 'filings'):
+        if types:
+            # Filings matching several types are only included once
+            filings = dict()
+            for filing_type in types:
+                for filing in getFilingByType(cik=cik,
+                                              filing_type=filing_type,
+                                              exact=exact):
+                    filings.setdefault(filing['accession-number'], filing)
+            result['filings'] = list(filings.values())
+        else:
+            result['filings'] = getAllFilings(cik=cik)
+
+    return result
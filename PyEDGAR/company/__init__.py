@@ -1 +1,3 @@
 from .info import getInfo
+from .info import getInfoBatch
+from .info import getCompanyProfile
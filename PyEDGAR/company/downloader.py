@@ -1,6 +1,13 @@
-from requests import exceptions, get
+from ..util.session import getSession
+
+from requests import exceptions
 import logging
 
+
+# URL of the EDGAR company browsing endpoint, serving company pages
+INFO_URL = 'https://www.sec.gov/cgi-bin/browse-edgar'
+
+
 def __downloadInfoPage(cik: str) -> str:
     """Function to download listings page from EDGAR, given a target CIK.
     
@@ -14,23 +21,32 @@ def __downloadInfoPage(cik: str) -> str:
         str -- Page HTML.
     """
 
-    base_url = 'https://sec.gov/cgi-bin/browse-edgar'
-
-    # Building request parameters
-    # Note: Order of parameters here is important
-    params = {
-        'CIK': cik,
-        'owner': 'exclude',
-        'action': 'getcompany'
-    }
-
     # Making request
-    r = get(url=base_url, params=params)
+    r = getSession().get(url=INFO_URL, params=__infoParams(cik=cik),
+                         endpoint='info')
 
     # Handling failed request
     if not r.ok:
-        logging.warn('Request failed: Information lookup for CIK {0}, error {1}'
-            .format(cik, r.status_code))
+        logging.warning('Request failed: Information lookup for CIK {0}, '
+                        'error {1}'.format(cik, r.status_code))
         raise exceptions.RequestException('Request Failed')
 
     return r.text
+
+
+def __infoParams(cik: str) -> dict:
+    """Function to build the query parameters of a company page request.
+    
+    Arguments:
+        cik {str} -- CIK of target company.
+    
+    Returns:
+        dict -- Query parameters of the request.
+    """
+
+    # Note: Order of parameters here is important
+    return {
+        'CIK': cik,
+        'owner': 'exclude',
+        'action': 'getcompany'
+    }
@@ -1,12 +1,18 @@
+from ..filings.container import Filings
+from ..filings.downloader import __downloadFilings
+from ..filings.parser import __parseHTML as __parseFilingsHTML
+from ..util.batch import __runBatch
+from ..util.memo import memoized
+from ..util.pipeline import __runPipeline
 from .downloader import __downloadInfoPage
-from .parser import __parseHTML
+from .parser import __parseFeedInfo, __parseHTML
 
-from bs4 import BeautifulSoup
-from requests import exceptions, get
+from typing import Iterable, Iterator
 import logging
 
 
-def getInfo(cik: str, includeRaw: bool=False) -> dict:
+@memoized
+def getInfo(cik: str, includeRaw: bool=False, engine: str='regex') -> dict:
     """Function to get company information, given a company CIK.
     
     Arguments:
@@ -14,6 +20,8 @@ def getInfo(cik: str, includeRaw: bool=False) -> dict:
     
     Keyword Arguments:
         includeRaw {bool} -- Flag to include raw HTML (default: {False}).
+        engine {str} -- Page parsing engine, 'regex' or 'bs4'
+                        (default: {'regex'}).
     
     Returns:
         dict -- Dictionary of company infomation. See user guide for more info.
@@ -25,7 +33,7 @@ def getInfo(cik: str, includeRaw: bool=False) -> dict:
     page_html = __downloadInfoPage(cik=cik)
 
     # Parsing page HTML
-    company_parsed = __parseHTML(page_html=page_html)
+    company_parsed = __parseHTML(page_html=page_html, engine=engine)
     # Reattaching CIK
     company_parsed['cik'] = cik
 
@@ -33,3 +41,111 @@ def getInfo(cik: str, includeRaw: bool=False) -> dict:
     if includeRaw: company_parsed['_raw'] = [page_html]
 
     return company_parsed
+
+
+@memoized
+def getCompanyProfile(cik: str, max_workers: int=1, engine: str='etree',
+                      columnar: bool=False) -> dict:
+    """Function to get both company information and filings, given a company
+    CIK, from the listings pages alone. The first listings page carries the
+    company information, so this saves the company page request and parse
+    made by calling `getInfo` and `getAllFilings` separately.
+
+    Company information is returned in the structure of `getInfo`. Former
+    names are dated by the date of the name change given in the listings.
+    
+    Arguments:
+        cik {str} -- CIK of the target company.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of listings pages requested
+                             concurrently (default: {1}).
+        engine {str} -- Listings parsing engine, 'etree' or 'bs4'
+                        (default: {'etree'}).
+        columnar {bool} -- Flag to return filings in a columnar `Filings`
+                           container instead of a list; requires NumPy
+                           (default: {False}).
+    
+    Raises:
+        LookupError -- Raised if the listings have no company information.
+    
+    Returns:
+        dict -- Dictionary with the company 'info' and 'filings'.
+    """
+
+    logging.info('Getting company profile for CIK {0}'.format(cik))
+
+    # Getting page XML for filings
+    pages_html = __downloadFilings(cik=cik, max_workers=max_workers)
+
+    # Parsing company information from the first page
+    company_parsed = __parseFeedInfo(page_xml=pages_html[0])
+    # Reattaching CIK
+    company_parsed['cik'] = cik
+
+    # Parsing filings
+    filings_parsed = __parseFilingsHTML(pages_html=pages_html, engine=engine)
+
+    if columnar:
+        filings_parsed = Filings.fromRecords(filings=filings_parsed)
+
+    return {'info': company_parsed, 'filings': filings_parsed}
+
+
+def getInfoBatch(ciks: Iterable, max_workers: int=4,
+                 parse_workers: int=0) -> Iterator[tuple]:
+    """Function to get company information for many companies concurrently.
+    All requests share the global EDGAR rate limit.
+
+    If `parse_workers` is set, company pages are parsed in a pool of that
+    many processes while further pages are downloaded, so that parsing is
+    spread across CPU cores.
+    
+    Arguments:
+        ciks {Iterable} -- CIKs of the target companies.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of companies fetched concurrently
+                             (default: {4}).
+        parse_workers {int} -- Number of parsing processes; pages are parsed
+                               on the download threads if 0 (default: {0}).
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(cik, info)` tuples, in order of
+                           completion (or in the order of `ciks` if
+                           `parse_workers` is set). If the information for a
+                           CIK could not be retrieved, the exception is given
+                           in place of the info.
+    """
+
+    if parse_workers <= 0:
+        return __runBatch(func=getInfo, keys=ciks, max_workers=max_workers)
+
+    return __getInfoPipeline(ciks=ciks, max_workers=max_workers,
+                             parse_workers=parse_workers)
+
+
+def __getInfoPipeline(ciks: Iterable, max_workers: int,
+                      parse_workers: int) -> Iterator[tuple]:
+    """Function to get company information for many companies, parsing pages
+    in a process pool. See `getInfoBatch`.
+    
+    Arguments:
+        ciks {Iterable} -- CIKs of the target companies.
+        max_workers {int} -- Maximum number of companies fetched
+                             concurrently.
+        parse_workers {int} -- Number of parsing processes.
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(cik, info)` tuples, in the order of
+                           `ciks`.
+    """
+
+    for cik, info in __runPipeline(download=__downloadInfoPage,
+                                   parse=__parseHTML, keys=ciks,
+                                   max_workers=max_workers,
+                                   parse_workers=parse_workers):
+        # Reattaching CIK
+        if not isinstance(info, Exception):
+            info['cik'] = cik
+        yield cik, info
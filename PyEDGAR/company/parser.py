@@ -1,11 +1,98 @@
+from ..util import instrumentation
+
 from bs4 import BeautifulSoup
+from xml.etree import ElementTree
 import html
 import logging
 import re
 
 
-def __parseHTML(page_html: str) -> dict:
+# RegEx for phone numbers in the following formats:
+#   1. (###) ###-####
+#   2. ###-###-####
+#   3. ##########
+PHONE_NUMBER_RE = re.compile(
+    r'(\(\d{3}\) \d{3}-\d{4}|\d{3}-\d{3}-\d{4}|\d{10})')
+# RegEx for non-digit characters
+NON_DIGIT_RE = re.compile(r'[^0-9]')
+# RegEx for former name sentence
+FORMER_SENTENCE_RE = re.compile(r'(formerly:.+?\(filings through .+?\))')
+# RegEx for former name and filings-through date extraction
+NAME_AND_DATE_RE = re.compile(r'formerly:(.*)\(.*(\d{4}-\d{2}-\d{2})')
+# RegEx for SIC and SIC type
+SIC_RE = re.compile(r'SIC.+?:.+?(\d+?)<\/a> -(.+?)<br')
+# RegEx for company location (state)
+LOCATION_RE = re.compile(r'State location:.+?>(\w+?)<\/a>')
+# RegEx for state of incorporation
+INCORP_STATE_RE = re.compile(r'State of Inc\.:.+?>(\w+?)<\/strong>')
+# RegEx for end of fiscal year
+FISCAL_YEAR_RE = re.compile(r'Fiscal Year End:.+?(\d{4})')
+
+# RegEx for the regions of the page containing company information
+COMPANY_NAME_RE = re.compile(r'<span class="companyName">(.*?)</span>', re.S)
+IDENT_INFO_RE = re.compile(r'<p class="identInfo">.*?</p>', re.S)
+MAILER_RE = re.compile(r'<div class="mailer">(.*?)</div>', re.S)
+# RegEx for splitting HTML into tags and text
+TAG_RE = re.compile(r'(<[^>]*>)')
+
+# Address types in the listings feed, and corresponding company page labels
+ADDRESS_TYPES = {'mailing': 'Mailing Address',
+                 'business': 'Business Address'}
+
+# HTML elements without a closing tag
+VOID_ELEMENTS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img',
+                           'input', 'link', 'meta', 'param', 'source',
+                           'track', 'wbr'])
+
+# Available parsing engines
+ENGINES = ('regex', 'bs4')
+
+
+def __parseHTML(page_html: str, engine: str='regex') -> dict:
     """Function to parse EDGAR page HTML, returning a dict of company info.
+
+    The 'regex' engine extracts only the company name, identification and
+    address regions of the page with precompiled patterns, making one pass
+    over each region. It falls back to the 'bs4' engine (BeautifulSoup) if a
+    region cannot be found. Both engines produce identical output.
+    
+    Arguments:
+        page_html {str} -- Raw HTML of page.
+    
+    Keyword Arguments:
+        engine {str} -- Parsing engine, one of `ENGINES` (default: {'regex'}).
+    
+    Raises:
+        ValueError -- Raised if the parsing engine is not recognized.
+    
+    Returns:
+        dict -- Structured dictionary of company attributes.
+    """
+
+    if engine not in ENGINES:
+        raise ValueError('Unknown parsing engine {0}'.format(engine))
+
+    with instrumentation.measureParse(stage='company') as parse:
+        company_info = None
+
+        if engine == 'regex':
+            try:
+                company_info = __parseHTMLRegions(page_html=page_html)
+            except (LookupError, ValueError) as e:
+                logging.warning('Company page regions not found ({0!r}); '
+                                'falling back to BeautifulSoup'.format(e))
+
+        if company_info is None:
+            company_info = __parseHTMLTree(page_html=page_html)
+
+        parse.entries = 1
+
+    return company_info
+
+
+def __parseHTMLTree(page_html: str) -> dict:
+    """Function to parse EDGAR page HTML into a BeautifulSoup tree, and
+    extract company information from it.
     
     Arguments:
         page_html {str} -- Raw HTML of page.
@@ -31,6 +118,90 @@ def __parseHTML(page_html: str) -> dict:
 
     return company_info
 
+
+def __parseHTMLRegions(page_html: str) -> dict:
+    """Function to parse EDGAR page HTML by extracting only the regions of the
+    page containing company information, without building a document tree.
+    
+    Arguments:
+        page_html {str} -- Raw HTML of page.
+    
+    Raises:
+        LookupError -- Raised if a region of the page cannot be found.
+    
+    Returns:
+        dict -- Structured dictionary of company attributes.
+    """
+
+    # Extracting regions
+    name_match = COMPANY_NAME_RE.search(page_html)
+    ident_match = IDENT_INFO_RE.search(page_html)
+
+    if name_match is None or ident_match is None:
+        raise LookupError('Company information not found')
+
+    ident_html = ident_match.group(0)
+
+    # Dict for final output
+    company_info = dict()
+
+    # Getting company addresses
+    company_info['addresses'] = [
+        __parseAddress(address_text=__htmlText(page_html=m))
+        for m in MAILER_RE.findall(page_html)]
+    # Getting company name (first raw text instance)
+    company_info['name'] = __htmlText(page_html=name_match.group(1),
+                                      top_level=True)[0].strip()
+    # Getting former company names
+    company_info['former_names'] = __parseFormerNames(
+        ident_text=__htmlText(page_html=ident_html))
+    # Getting company metadata
+    company_info['metadata'] = __parseCompanyMetadata(metadata_str=ident_html)
+
+    return company_info
+
+
+def __htmlText(page_html: str, top_level: bool=False):
+    """Function to extract the text from an HTML fragment, equivalent to the
+    `text` attribute of the corresponding BeautifulSoup element.
+    
+    Arguments:
+        page_html {str} -- HTML fragment.
+    
+    Keyword Arguments:
+        top_level {bool} -- Flag to return a list of the text instances that
+                            are direct children of the fragment, instead of
+                            all text (default: {False}).
+    
+    Returns:
+        str or list -- Text of the fragment, or list of top-level text
+                       instances.
+    """
+
+    if not top_level:
+        return html.unescape(''.join(TAG_RE.split(page_html)[::2]))
+
+    # Text instances outside of any nested element
+    texts = list()
+    depth = 0
+
+    for i, token in enumerate(TAG_RE.split(page_html)):
+        if i % 2 == 0:
+            if depth == 0 and token:
+                texts += [html.unescape(token)]
+            continue
+
+        # Tracking nesting depth from tags
+        name = token[1:-1].strip().split(' ')[0].lower()
+        if name.startswith('/'):
+            depth -= 1
+        elif not (name.startswith('!') or token.endswith('/>')
+                  or name in VOID_ELEMENTS):
+            depth += 1
+
+    return texts
+
+
 def __getAddresses(parsed: BeautifulSoup) -> list:
     """Function to extract company addresses from the parsed HTML EDGAR page.
     Searches for address information in divs with class name 'mailer'.
@@ -45,53 +216,53 @@ def __getAddresses(parsed: BeautifulSoup) -> list:
     # Addresses container
     address_divs = parsed.find_all('div', class_='mailer')
 
-    # Building RegEx for phone number
-    # The following RegEx extracts phone numbers in the following formats:
-    #   1. (###) ###-####
-    #   2. ###-###-####
-    #   3. ##########
-    phone_number_regex = re.compile(
-        r'(\(\d{3}\) \d{3}-\d{4}|\d{3}-\d{3}-\d{4}|\d{10})')
-
-    # List for final addresses
-    addresses = list()
-
-    for address in address_divs:
-        # Create dict for address
-        address_parsed = dict()
-        # Split text by newline
-        address_items = address.text.split('\n')
-        # Removing leading and trailing spaces
-        address_items = [i.strip() for i in address_items]
-
-        # Variable to store street address
-        street_address = ''
-
-        # Iterate through each line
-        for idx, address_item in enumerate(address_items):
-            # First line is address type
-            if idx == 0:
-                address_parsed['type'] = address_item
-                continue
+    return [__parseAddress(address_text=address.text)
+            for address in address_divs]
 
-            # Check if line has phone number
-            phone_matches = phone_number_regex.findall(address_item)
-            if len(phone_matches) == 1:
-                # Stripping non-digit characters from phone number
-                phone_number = re.sub('[^0-9]', '', phone_matches[0])
-                address_parsed['phone'] = phone_number
-                continue
-            
-            # If no number, add to address line
-            street_address += address_item.strip() + ' '
+
+def __parseAddress(address_text: str) -> dict:
+    """Function to parse the text of a company address.
+    
+    Arguments:
+        address_text {str} -- Text of an address, with the address type on
+                              the first line.
     
-        # Adding street address to parsed address
-        address_parsed['street_address'] = street_address.strip()
+    Returns:
+        dict -- Parsed address.
+    """
+
+    # Create dict for address
+    address_parsed = dict()
+    # Split text by newline
+    address_items = address_text.split('\n')
+    # Removing leading and trailing spaces
+    address_items = [i.strip() for i in address_items]
+
+    # Variable to store street address
+    street_address = ''
+
+    # Iterate through each line
+    for idx, address_item in enumerate(address_items):
+        # First line is address type
+        if idx == 0:
+            address_parsed['type'] = address_item
+            continue
 
-        # Adding parsed address to addresses master list
-        addresses += [address_parsed]
+        # Check if line has phone number
+        phone_matches = PHONE_NUMBER_RE.findall(address_item)
+        if len(phone_matches) == 1:
+            # Stripping non-digit characters from phone number
+            phone_number = NON_DIGIT_RE.sub('', phone_matches[0])
+            address_parsed['phone'] = phone_number
+            continue
+        
+        # If no number, add to address line
+        street_address += address_item.strip() + ' '
 
-    return addresses
+    # Adding street address to parsed address
+    address_parsed['street_address'] = street_address.strip()
+
+    return address_parsed
 
 
 def __getCompanyName(parsed: BeautifulSoup) -> str:
@@ -131,19 +302,29 @@ def __getFormerNames(parsed: BeautifulSoup) -> list:
     # Former names container
     former_container = parsed.find('p', class_='identInfo')
 
+    return __parseFormerNames(ident_text=former_container.text)
+
+
+def __parseFormerNames(ident_text: str) -> list:
+    """Function to extract former company names, and filings-through dates
+    from the text of the company identification section.
+    
+    Arguments:
+        ident_text {str} -- Text of the company identification section.
+    
+    Returns:
+        list -- List of former names (if any), empty list otherwise.
+    """
+
     # List for former names
     former_names = list()
 
-    # Building RegEx for former name sentence
-    former_sentence_re = re.compile(r'(formerly:.+?\(filings through .+?\))')
     # Getting sentence matches
-    former_sentences = former_sentence_re.findall(former_container.text)
+    former_sentences = FORMER_SENTENCE_RE.findall(ident_text)
     
-    # Building RegEx for name and filings-through date extraction
-    name_and_date_re = re.compile(r'formerly:(.*)\(.*(\d{4}-\d{2}-\d{2})')
     # Extracting former name and filings-through date for each sentence
     for sentence in former_sentences:
-        matches = name_and_date_re.findall(sentence)
+        matches = NAME_AND_DATE_RE.findall(sentence)
         former_name = dict()
         former_name['former_name'] = matches[0][0].strip()
         former_name['filings_through'] = matches[0][1]
@@ -172,37 +353,153 @@ def __getCompanyMetadata(parsed: BeautifulSoup) -> dict:
     # String representation of HTML (used in RegEx)
     metadata_str = str(metadata_container)
 
+    return __parseCompanyMetadata(metadata_str=metadata_str)
+
+
+def __parseCompanyMetadata(metadata_str: str) -> dict:
+    """Function to extract company metadata from the HTML of the company
+    identification section, using regular expressions.
+    
+    Arguments:
+        metadata_str {str} -- HTML of the company identification section.
+    
+    Returns:
+        dict -- Company metadata with keys `sic`, `sic_type`, `location`,
+                `incorporation_state`, and `fiscal_year_end`.
+    """
+
     # Dictionary for company metadata
     company_metadata = dict()
 
-    # RegEx for extracting SIC and SIC type
-    sic_re = re.compile(r'SIC.+?:.+?(\d+?)<\/a> -(.+?)<br')
     # Getting SIC and SIC type match
-    sic_matches = sic_re.findall(metadata_str)
+    sic_matches = SIC_RE.findall(metadata_str)
     # Saving SIC and stripped, HTML-parsed SIC type
     company_metadata['sic'] = sic_matches[0][0]
     company_metadata['sic_type'] = html.unescape(sic_matches[0][1]).strip()
 
-    # RegEx for extracting company location (state)
-    location_re = re.compile(r'State location:.+?>(\w+?)<\/a>')
     # Getting company location
-    location_matches = location_re.findall(metadata_str)
+    location_matches = LOCATION_RE.findall(metadata_str)
     # Saving company location
     company_metadata['location'] = location_matches[0].strip()
 
-    # RegEx for extracting state of incorporation
-    incorp_state_re = re.compile(r'State of Inc\.:.+?>(\w+?)<\/strong>')
     # Getting state of incorporation
-    incorp_match = incorp_state_re.findall(metadata_str)[0]
+    incorp_match = INCORP_STATE_RE.findall(metadata_str)[0]
     # Saving state of incorporation
     company_metadata['incorporation_state'] = incorp_match.strip()
 
-    # RegEx for extracting end of fiscal year
-    fiscal_year_re = re.compile(r'Fiscal Year End:.+?(\d{4})')
     # Getting end of fiscal year
-    fiscal_year_match = fiscal_year_re.findall(metadata_str)[0]
+    fiscal_year_match = FISCAL_YEAR_RE.findall(metadata_str)[0]
     # Saving end of fiscal year (in mm-dd format)
     fy_formatted = fiscal_year_match[0:2] + '-' + fiscal_year_match[2:]
     company_metadata['fiscal_year_end'] = fy_formatted
 
     return company_metadata
+
+
+def __parseFeedInfo(page_xml: str, chunk_size: int=65536) -> dict:
+    """Function to extract company information from the company-info block
+    of an EDGAR atom listings page, in the same structure as `__parseHTML`.
+    The page is parsed incrementally, and parsing stops at the end of the
+    block, before the filing entries.
+    
+    Arguments:
+        page_xml {str} -- Raw XML of listings page.
+    
+    Keyword Arguments:
+        chunk_size {int} -- Number of characters fed to the XML parser at a
+                            time (default: {65536}).
+    
+    Raises:
+        ElementTree.ParseError -- Raised if the page is not well-formed XML.
+        LookupError -- Raised if the page has no company-info block.
+    
+    Returns:
+        dict -- Structured dictionary of company attributes.
+    """
+
+    with instrumentation.measureParse(stage='company') as parse:
+        parser = ElementTree.XMLPullParser(events=('end',))
+        info_element = None
+
+        for i in range(0, len(page_xml), chunk_size):
+            parser.feed(page_xml[i:i + chunk_size])
+
+            for _, element in parser.read_events():
+                # Removing namespace from tag
+                if element.tag.rpartition('}')[2] == 'company-info':
+                    info_element = element
+                    break
+
+            if info_element is not None:
+                break
+
+        if info_element is None:
+            raise LookupError('Company information not found')
+
+        # Dict for final output
+        company_info = dict()
+
+        # Getting company addresses
+        company_info['addresses'] = list()
+        for address in info_element.iter():
+            if address.tag.rpartition('}')[2] != 'address':
+                continue
+            address_parsed = {'type': ADDRESS_TYPES.get(
+                address.get('type'), address.get('type', ''))}
+            # Stripping non-digit characters from phone number
+            phone = NON_DIGIT_RE.sub('', __childText(element=address,
+                                                     tag='phone'))
+            if phone:
+                address_parsed['phone'] = phone
+            # Street lines, followed by city, state and zip code
+            lines = [__childText(element=address, tag=t)
+                     for t in ('street1', 'street2', 'city', 'state', 'zip')]
+            address_parsed['street_address'] = ' '.join(l for l in lines if l)
+            company_info['addresses'] += [address_parsed]
+
+        # Getting company name
+        company_info['name'] = __childText(element=info_element,
+                                           tag='conformed-name')
+
+        # Getting former company names
+        company_info['former_names'] = [
+            {'former_name': __childText(element=names, tag='name'),
+             'filings_through': __childText(element=names, tag='date')}
+            for names in info_element.iter()
+            if names.tag.rpartition('}')[2] == 'names']
+
+        # Getting company metadata; end of fiscal year in mm-dd format
+        fiscal_year = __childText(element=info_element, tag='fiscal-year-end')
+        company_info['metadata'] = {
+            'sic': __childText(element=info_element, tag='assigned-sic'),
+            'sic_type': __childText(element=info_element,
+                                    tag='assigned-sic-desc'),
+            'location': __childText(element=info_element,
+                                    tag='state-location'),
+            'incorporation_state': __childText(element=info_element,
+                                               tag='state-of-incorporation'),
+            'fiscal_year_end': fiscal_year[0:2] + '-' + fiscal_year[2:]
+            if fiscal_year else ''}
+
+        parse.entries = 1
+
+    return company_info
+
+
+def __childText(element: ElementTree.Element, tag: str) -> str:
+    """Function to get the stripped text of the first child of an XML element
+    with a given tag, ignoring namespaces.
+    
+    Arguments:
+        element {ElementTree.Element} -- Parent element.
+        tag {str} -- Tag of the child, without namespace.
+    
+    Returns:
+        str -- Text of the child, or an empty string if there is none.
+    """
+
+    for child in element:
+        if child.tag.rpartition('}')[2] == tag:
+            return (child.text or '').strip()
+
+    return ''
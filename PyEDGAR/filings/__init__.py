@@ -1,3 +1,12 @@
 from .filings import getAllFilings
 from .filings import get10K
 from .filings import get10Q
+from .filings import getFilingByType
+from .filings import getAllFilingsBatch
+from .filings import getNewFilings
+from .filings import getNewFilingsBatch
+from .filings import iterFilings
+from .container import Filings
+from .documents import downloadDocuments
+from .manifest import getManifest
+from .manifest import getManifests
@@ -0,0 +1,333 @@
+from typing import Iterable, Iterator
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Output fields of the listings parser, in order
+FIELDS = ('accession-number', 'type', 'url', 'date', 'act', 'file_number',
+          'file_number_url', 'film_number', 'name', 'description', 'size')
+
+# Fields unique to each filing, stored as fixed-width byte string arrays
+BYTES_FIELDS = ('accession-number', 'url', 'film_number')
+
+# Fields repeated across filings, stored as integer codes into a list of
+# the distinct values (dictionary encoded)
+CODED_FIELDS = ('type', 'act', 'file_number', 'file_number_url', 'name',
+                'description')
+
+# Units used by EDGAR for filing sizes, in increasing order
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# RegEx for extracting filing size, its decimals and unit (e.g. '1.5 MB')
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.(\d+))?)\s*([KMGT]?B)\s*$')
+
+
+class Filings(object):
+    """Compact columnar container of filings.
+
+    Filing dates are stored as a `datetime64[D]` array and sizes as an
+    `int64` array of bytes. Accession numbers, URLs and film numbers are
+    stored as fixed-width byte string arrays (e.g. `S20` for accession
+    numbers), and the fields repeated across filings (form types, names,
+    descriptions and file numbers) as `int32` codes into lists of their
+    distinct values. No Python object is kept per filing. Filtering is
+    vectorized, and columns may be exported to NumPy, pandas or Arrow
+    without copying the typed arrays. Iterating yields the same dictionaries
+    as `getAllFilings`.
+    """
+
+    def __init__(self, columns: dict, dictionaries: dict):
+        """Constructor for the filings container. See `fromRecords` to build
+        a container from filing dictionaries.
+
+        Arguments:
+            columns {dict} -- Dictionary of equal length NumPy arrays, with
+                              the keys of `BYTES_FIELDS`, a '<field>_code'
+                              key for each of `CODED_FIELDS`, and 'date',
+                              'size', 'size_unit' and 'size_decimals'.
+            dictionaries {dict} -- Dictionary mapping each of `CODED_FIELDS`
+                                   to the values corresponding to its codes.
+
+        Raises:
+            ImportError -- Raised if NumPy is not installed.
+        """
+
+        if np is None:
+            raise ImportError('NumPy is required for the columnar Filings '
+                              'container')
+
+        self.columns = columns
+        self.dictionaries = dictionaries
+
+    @classmethod
+    def fromRecords(cls, filings: Iterable) -> 'Filings':
+        """Function to build a columnar container from filing dictionaries.
+
+        Arguments:
+            filings {Iterable} -- Dictionaries of filing information, as
+                                  returned by `getAllFilings`.
+
+        Raises:
+            ImportError -- Raised if NumPy is not installed.
+
+        Returns:
+            Filings -- Columnar container of the filings.
+        """
+
+        if np is None:
+            raise ImportError('NumPy is required for the columnar Filings '
+                              'container')
+
+        strings = {k: list() for k in BYTES_FIELDS}
+        codes = {k: list() for k in CODED_FIELDS}
+        values = {k: dict() for k in CODED_FIELDS}  # Value to code
+        dates, sizes, size_units, size_decimals = (list(), list(), list(),
+                                                   list())
+
+        for filing in filings:
+            for k in BYTES_FIELDS:
+                strings[k] += [filing[k].encode('utf-8')]
+            for k in CODED_FIELDS:
+                codes[k] += [values[k].setdefault(filing[k],
+                                                  len(values[k]))]
+            dates += [filing['date'] or 'NaT']
+            size, unit, decimals = cls.__parseSize(size=filing['size'])
+            sizes += [size]
+            size_units += [unit]
+            size_decimals += [decimals]
+
+        # Byte strings are as wide as the longest value of each field
+        columns = {k: np.array(v, dtype=np.bytes_)
+                   for k, v in strings.items()}
+        for k in CODED_FIELDS:
+            columns[k + '_code'] = np.array(codes[k], dtype=np.int32)
+        columns['date'] = np.array(dates, dtype='datetime64[D]')
+        columns['size'] = np.array(sizes, dtype=np.int64)
+        columns['size_unit'] = np.array(size_units, dtype=np.int8)
+        columns['size_decimals'] = np.array(size_decimals, dtype=np.int8)
+
+        return cls(columns=columns,
+                   dictionaries={k: list(v) for k, v in values.items()})
+
+    def __len__(self) -> int:
+        return len(self.columns['date'])
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self.__record(i)
+
+    def __getitem__(self, key):
+        """Function to get a single filing by position, or a subset of filings
+        by slice, boolean mask or array of positions.
+
+        Arguments:
+            key -- Position, slice, boolean mask or array of positions.
+
+        Returns:
+            dict or Filings -- Filing dictionary for a single position, or a
+                               container of the selected filings otherwise.
+        """
+
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError('Filing index out of range')
+            return self.__record(key)
+
+        columns = {k: v[key] for k, v in self.columns.items()}
+
+        return Filings(columns=columns, dictionaries=self.dictionaries)
+
+    def __repr__(self) -> str:
+        return '<Filings: {0} filings, {1} form types>'.format(
+            len(self), len(self.categories))
+
+    @property
+    def categories(self) -> list:
+        """Form types corresponding to each code in 'type_code'.
+        """
+
+        return self.dictionaries['type']
+
+    @property
+    def type(self) -> 'np.ndarray':
+        """Form types of the filings, as an array of strings.
+        """
+
+        categories = np.array(self.categories, dtype=object)
+
+        return categories[self.columns['type_code']]
+
+    @property
+    def date(self) -> 'np.ndarray':
+        """Filing dates, as a `datetime64[D]` array.
+        """
+
+        return self.columns['date']
+
+    @property
+    def size(self) -> 'np.ndarray':
+        """Filing sizes in bytes, as an `int64` array; -1 if unavailable.
+        """
+
+        return self.columns['size']
+
+    def filterType(self, filing_type: str, exact: bool=False) -> 'Filings':
+        """Function to select filings by form type.
+
+        Arguments:
+            filing_type {str} -- Target filing type.
+
+        Keyword Arguments:
+            exact {bool} -- Flag to only match the filing type exactly;
+                            otherwise all types starting with `filing_type`
+                            match (default: {False}).
+
+        Returns:
+            Filings -- Container of the matching filings.
+        """
+
+        codes = [code for code, category in enumerate(self.categories)
+                 if category == filing_type
+                 or (not exact and category.startswith(filing_type))]
+
+        return self[np.isin(self.columns['type_code'], codes)]
+
+    def filterDate(self, since: str=None, before: str=None) -> 'Filings':
+        """Function to select filings by filing date.
+
+        Keyword Arguments:
+            since {str} -- Only include filings on or after this date,
+                           formatted YYYY-MM-DD (default: {None}).
+            before {str} -- Only include filings on or before this date,
+                            formatted YYYY-MM-DD (default: {None}).
+
+        Returns:
+            Filings -- Container of the matching filings.
+        """
+
+        mask = np.ones(len(self), dtype=bool)
+
+        if since is not None:
+            mask &= self.columns['date'] >= np.datetime64(since, 'D')
+        if before is not None:
+            mask &= self.columns['date'] <= np.datetime64(before, 'D')
+
+        return self[mask]
+
+    def toNumpy(self) -> dict:
+        """Function to export the filings as NumPy arrays, without copying.
+        Fields repeated across filings are given as codes in '<field>_code';
+        see `dictionaries`. Byte strings are UTF-8 encoded.
+
+        Returns:
+            dict -- Dictionary of column name to NumPy array.
+        """
+
+        return dict(self.columns)
+
+    def toPandas(self) -> 'pandas.DataFrame':
+        """Function to export the filings as a pandas DataFrame, with the
+        fields repeated across filings as categorical columns.
+
+        Raises:
+            ImportError -- Raised if pandas is not installed.
+
+        Returns:
+            pandas.DataFrame -- DataFrame of filings.
+        """
+
+        import pandas as pd
+
+        data = {k: np.char.decode(self.columns[k], 'utf-8').astype(object)
+                for k in BYTES_FIELDS}
+        for k in CODED_FIELDS:
+            data[k] = pd.Categorical.from_codes(
+                codes=self.columns[k + '_code'],
+                categories=self.dictionaries[k])
+        data['date'] = self.columns['date']
+        data['size'] = self.columns['size']
+
+        return pd.DataFrame(data, columns=list(FIELDS), copy=False)
+
+    def toArrow(self) -> 'pyarrow.Table':
+        """Function to export the filings as an Arrow table, with the fields
+        repeated across filings as dictionary-encoded columns.
+
+        Raises:
+            ImportError -- Raised if pyarrow is not installed.
+
+        Returns:
+            pyarrow.Table -- Arrow table of filings.
+        """
+
+        import pyarrow as pa
+
+        arrays = dict()
+        for k in FIELDS:
+            if k in CODED_FIELDS:
+                arrays[k] = pa.DictionaryArray.from_arrays(
+                    indices=pa.array(self.columns[k + '_code']),
+                    dictionary=pa.array(self.dictionaries[k],
+                                        type=pa.string()))
+            elif k in BYTES_FIELDS:
+                arrays[k] = pa.array(self.columns[k]).cast(pa.string())
+            else:
+                arrays[k] = pa.array(self.columns[k])
+
+        return pa.table(arrays)
+
+    def __record(self, i: int) -> dict:
+        """Function to rebuild the filing dictionary at a given position.
+
+        Arguments:
+            i {int} -- Position of the filing.
+
+        Returns:
+            dict -- Dictionary of filing information.
+        """
+
+        record = {k: self.columns[k][i].decode('utf-8')
+                  for k in BYTES_FIELDS}
+        for k in CODED_FIELDS:
+            record[k] = self.dictionaries[k][self.columns[k + '_code'][i]]
+
+        date = self.columns['date'][i]
+        record['date'] = '' if np.isnat(date) else str(date)
+
+        size = int(self.columns['size'][i])
+        unit = int(self.columns['size_unit'][i])
+        decimals = int(self.columns['size_decimals'][i])
+        record['size'] = '' if size < 0 else '{0:.{1}f} {2}'.format(
+            size / 1024 ** unit, decimals, SIZE_UNITS[unit])
+
+        return {k: record[k] for k in FIELDS}
+
+    @staticmethod
+    def __parseSize(size: str) -> tuple:
+        """Function to parse an EDGAR filing size string (e.g. '11 MB' or
+        '1.5 MB').
+
+        Arguments:
+            size {str} -- Filing size string.
+
+        Returns:
+            tuple -- Tuple of the size in bytes (-1 if it cannot be
+                     parsed), the index of its unit in `SIZE_UNITS`, and its
+                     number of decimals.
+        """
+
+        match = SIZE_RE.match(size)
+
+        if match is None:
+            return -1, 0, 0
+
+        unit = SIZE_UNITS.index(match.group(3))
+        decimals = len(match.group(2) or '')
+
+        return round(float(match.group(1)) * 1024 ** unit), unit, decimals
@@ -0,0 +1,237 @@
+from ..util.batch import __runBatch
+from ..util.session import getSession
+
+from requests import exceptions
+from typing import Callable, Iterable, Iterator
+from urllib.parse import urlsplit
+import hashlib
+import logging
+import os
+
+
+# Suffixes of filing index page URLs, as linked by EDGAR listings
+INDEX_SUFFIXES = ('-index.htm', '-index.html')
+
+# Suffix of partially downloaded files
+PART_SUFFIX = '.part'
+
+# Suffix of checksum files, written next to completed downloads
+CHECKSUM_SUFFIX = '.sha256'
+
+
+def downloadDocuments(filings: Iterable, directory: str, max_workers: int=4,
+                      progress: Callable=None, chunk_size: int=1 << 16,
+                      verify: bool=False) -> Iterator[tuple]:
+    """Function to download the full submission text files of many filings
+    concurrently. All requests share the global EDGAR rate limit.
+
+    Documents are streamed to disk in chunks, and never held in memory as a
+    whole. Interrupted downloads are resumed from their partial file, and
+    documents already downloaded (with the size recorded in their checksum
+    file, or also a matching checksum if `verify` is set) are skipped.
+    Documents whose size the server did not give cannot be verified, and
+    are downloaded again on every run. Files are saved as
+    `<directory>/<cik>/<accession-number>.txt`.
+    
+    Arguments:
+        filings {Iterable} -- Dictionaries with filing information, as
+                              returned by `getAllFilings`.
+        directory {str} -- Directory to save documents in.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of documents downloaded
+                             concurrently (default: {4}).
+        progress {Callable} -- Function called with the document URL, the
+                               bytes downloaded so far and the total size
+                               (or None if unknown) after each chunk; called
+                               from worker threads (default: {None}).
+        chunk_size {int} -- Size of chunks written to disk, in bytes
+                            (default: {65536}).
+        verify {bool} -- Flag to re-hash downloaded documents before
+                         skipping them (default: {False}).
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(accession_number, path)` tuples, in
+                           order of completion. If a document could not be
+                           downloaded, the exception is given in place of the
+                           path.
+    """
+
+    def downloadFiling(filing: dict) -> str:
+        url = __documentURL(url=filing['url'])
+        # URL path ends with '<cik>/<accession, no dashes>/<filename>'
+        cik, _, filename = urlsplit(url).path.split('/')[-3:]
+        path = os.path.join(directory, cik, filename)
+        return __downloadDocument(url=url, path=path, progress=progress,
+                                  chunk_size=chunk_size, verify=verify)
+
+    for filing, path in __runBatch(func=downloadFiling, keys=filings,
+                                   max_workers=max_workers):
+        yield filing['accession-number'], path
+
+
+def __documentURL(url: str) -> str:
+    """Function to get the URL of the full submission text file of a filing,
+    given the URL of its index page.
+    
+    Arguments:
+        url {str} -- URL of the filing index page, e.g.
+                     '.../000032019323000106/0000320193-23-000106-index.htm'.
+    
+    Raises:
+        ValueError -- Raised if the URL is not a filing index page URL.
+    
+    Returns:
+        str -- URL of the full submission text file, e.g.
+               '.../000032019323000106/0000320193-23-000106.txt'.
+    """
+
+    for suffix in INDEX_SUFFIXES:
+        if url.endswith(suffix):
+            return url[:-len(suffix)] + '.txt'
+
+    raise ValueError('Not a filing index page URL: {0}'.format(url))
+
+
+def __downloadDocument(url: str, path: str, progress: Callable=None,
+                       chunk_size: int=1 << 16, verify: bool=False) -> str:
+    """Function to stream a document to disk, resuming a partial download if
+    one exists, and skipping the download if the document is complete.
+
+    The document is written to `<path>.part`, and renamed to `path` once
+    complete. If its size was given by the server, and matches, a
+    `<path>.sha256` file of its checksum and size is written along with it.
+    
+    Arguments:
+        url {str} -- URL of the document.
+        path {str} -- Path to save the document at.
+    
+    Keyword Arguments:
+        progress {Callable} -- Progress callback; see `downloadDocuments`
+                               (default: {None}).
+        chunk_size {int} -- Size of chunks written to disk, in bytes
+                            (default: {65536}).
+        verify {bool} -- Flag to re-hash a downloaded document before
+                         skipping it (default: {False}).
+    
+    Raises:
+        exceptions.RequestException -- Raised if the download fails.
+    
+    Returns:
+        str -- Path of the document.
+    """
+
+    if __isComplete(path=path, verify=verify):
+        logging.info('Skipping complete document {0}'.format(path))
+        return path
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    part_path = path + PART_SUFFIX
+
+    # Hashing the partial download, if any, to resume from its end
+    checksum = hashlib.sha256()
+    offset = 0
+    if os.path.exists(part_path):
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                checksum.update(chunk)
+                offset += len(chunk)
+
+    # Unencoded, so that the size of the document is known, and byte ranges
+    # refer to it
+    headers = {'Accept-Encoding': 'identity'}
+    if offset:
+        headers['Range'] = 'bytes={0}-'.format(offset)
+
+    r = getSession().get(url=url, endpoint='documents', stream=True,
+                         headers=headers)
+
+    try:
+        if r.status_code == 416:
+            # Partial file is not a prefix of the document; starting over
+            logging.warning('Cannot resume download of {0}; restarting'
+                            .format(url))
+            r.close()
+            os.remove(part_path)
+            return __downloadDocument(url=url, path=path, progress=progress,
+                                      chunk_size=chunk_size, verify=verify)
+
+        if not r.ok:
+            logging.warning('Request failed: Document download from {0}, '
+                            'error {1}'.format(url, r.status_code))
+            raise exceptions.RequestException('Request failed')
+
+        if r.status_code != 206 and offset:
+            # Range ignored by the server; starting over
+            checksum = hashlib.sha256()
+            offset = 0
+
+        total = None
+        if 'Content-Length' in r.headers and \
+            'Content-Encoding' not in r.headers:
+            total = offset + int(r.headers['Content-Length'])
+
+        with open(part_path, 'ab' if offset else 'wb') as f:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+                checksum.update(chunk)
+                offset += len(chunk)
+                if progress is not None:
+                    progress(url, offset, total)
+    finally:
+        r.close()
+
+    if total is not None and offset != total:
+        raise exceptions.RequestException('Incomplete download of {0}: {1} '
+                                          'of {2} bytes'.format(url, offset,
+                                                                total))
+
+    # Completing download; the checksum file of a previous download, if any,
+    # no longer applies
+    if os.path.exists(path + CHECKSUM_SUFFIX):
+        os.remove(path + CHECKSUM_SUFFIX)
+    os.replace(part_path, path)
+
+    if total is None:
+        logging.warning('Size of {0} not given; cannot verify the download'
+                        .format(url))
+        return path
+
+    with open(path + CHECKSUM_SUFFIX, 'w') as f:
+        f.write('{0} {1}\n'.format(checksum.hexdigest(), offset))
+
+    return path
+
+
+def __isComplete(path: str, verify: bool=False) -> bool:
+    """Function to check if a document has been downloaded completely, by
+    comparing its size, and optionally its checksum, with its checksum file.
+    
+    Arguments:
+        path {str} -- Path of the document.
+    
+    Keyword Arguments:
+        verify {bool} -- Flag to also compare the checksum, re-hashing the
+                         document (default: {False}).
+    
+    Returns:
+        bool -- True if the document is complete, False otherwise.
+    """
+
+    try:
+        with open(path + CHECKSUM_SUFFIX) as f:
+            expected_digest, expected_size = f.read().split()
+        if os.path.getsize(path) != int(expected_size):
+            return False
+    except (OSError, ValueError):
+        return False
+
+    if not verify:
+        return True
+
+    checksum = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            checksum.update(chunk)
+
+    return checksum.hexdigest() == expected_digest
@@ -1,38 +1,158 @@
-from requests import exceptions, get
+from ..util.session import getSession
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests import exceptions
+from typing import Iterator
 import logging
 
 
-def __downloadFilings(cik: str) -> list:
+# URL of the EDGAR company browsing endpoint, serving listings pages
+LISTINGS_URL = 'https://www.sec.gov/cgi-bin/browse-edgar'
+
+
+def __downloadFilings(cik: str, max_workers: int=1, filing_type: str='',
+                      before: str='') -> list:
     """Function to download the XML text of listings pages for a given CIK
     from the EDGAR database.
+
+    If `max_workers` is greater than one, up to `max_workers` pages are
+    requested concurrently ahead of the last page known to exist. Pages
+    requested past the end of the listing are discarded.
     
     Arguments:
         cik {str} -- Target CIK.
     
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of concurrent page requests
+                             (default: {1}).
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
+    
     Returns:
         list -- List of page XML, comprising full listing metadata for CIK.
     """
 
-    idx = 0  # Current page index
-    end = False  # Flags for loop
     count = 100  # Number of results per page (limited by SEC)
 
-    # Text indicating next page exists
-    next_page_text = 'rel="next" type="application/atom+xml" />'
+    if max_workers > 1:
+        return __downloadFilingsConcurrent(cik=cik, count=count,
+                                           max_workers=max_workers,
+                                           filing_type=filing_type,
+                                           before=before)
 
-    pages = []
+    return list(__iterPages(cik=cik, count=count, filing_type=filing_type,
+                            before=before))
+
+
+def __iterPages(cik: str, count: int=100, filing_type: str='',
+                before: str='') -> Iterator[str]:
+    """Function to lazily download the XML text of listings pages for a given
+    CIK, one page at a time. The next page is only requested once the
+    previous one has been consumed, so callers may stop early.
+    
+    Arguments:
+        cik {str} -- Target CIK.
+    
+    Keyword Arguments:
+        count {int} -- Count of results per page (default: {100}).
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
+    
+    Returns:
+        Iterator[str] -- Iterator of page XML, newest filings first.
+    """
+
+    idx = 0  # Current page index
+    end = False  # Flags for loop
 
     while not end:
         # Making request
-        page_text = __makeRequest(cik=cik, start_idx=idx, count=count)
-        end = (page_text.find(next_page_text) == -1)  # Update end flag
+        page_text = __makeRequest(cik=cik, start_idx=idx, count=count,
+                                  filing_type=filing_type, before=before)
+        end = not __hasNextPage(page_text=page_text)  # Update end flag
         idx += count  # Increment index for next page
-        pages.append(page_text)  # Save page text
+        yield page_text
+
+
+def __downloadFilingsConcurrent(cik: str, count: int, max_workers: int,
+                                filing_type: str='', before: str='') -> list:
+    """Function to download listings pages for a given CIK, speculatively
+    requesting up to `max_workers` pages ahead. Pages are consumed in order,
+    and requests past the last page are cancelled or discarded.
+    
+    Arguments:
+        cik {str} -- Target CIK.
+        count {int} -- Count of results per page.
+        max_workers {int} -- Maximum number of concurrent page requests.
+    
+    Keyword Arguments:
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
+    
+    Returns:
+        list -- List of page XML, comprising full listing metadata for CIK.
+    """
+
+    pages = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Requests in flight, in page order
+        in_flight = deque()
+        next_idx = 0  # Start index of the next page to request
+
+        for _ in range(max_workers):
+            in_flight.append(executor.submit(__makeRequest, cik=cik,
+                                             start_idx=next_idx, count=count,
+                                             filing_type=filing_type,
+                                             before=before))
+            next_idx += count
+
+        while in_flight:
+            # Waiting for the earliest outstanding page
+            page_text = in_flight.popleft().result()
+            pages.append(page_text)
+
+            if not __hasNextPage(page_text=page_text):
+                # Last page reached; dropping speculative requests
+                for future in in_flight:
+                    future.cancel()
+                break
+
+            # Keeping the window full
+            in_flight.append(executor.submit(__makeRequest, cik=cik,
+                                             start_idx=next_idx, count=count,
+                                             filing_type=filing_type,
+                                             before=before))
+            next_idx += count
 
     return pages
 
-def __makeRequest(cik: str, start_idx: int, count: int, retry: bool=False) \
-    -> str:
+
+def __hasNextPage(page_text: str) -> bool:
+    """Function to check if a listings page links to a next page.
+    
+    Arguments:
+        page_text {str} -- Page text with XML listing metadata.
+    
+    Returns:
+        bool -- True if a next page exists, False otherwise.
+    """
+
+    # Text indicating next page exists
+    next_page_text = 'rel="next" type="application/atom+xml" />'
+
+    return page_text.find(next_page_text) != -1
+
+
+def __makeRequest(cik: str, start_idx: int, count: int, filing_type: str='',
+                  before: str='') -> str:
     """Function to make a request to the EDGAR system to retrieve XML with
     listings for a given CIK.
     
@@ -42,44 +162,91 @@ def __makeRequest(cik: str, start_idx: int, count: int, retry: bool=False) \
         count {int} -- Count of results per page.
     
     Keyword Arguments:
-        retry {bool} -- Flag for auto-retry (default: {False}).
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
     
     Raises:
-        exceptions.RetryError -- Raised if the request retry fails.
+        exceptions.RetryError -- Raised if the request still fails after the
+                                 shared session's retries.
     
     Returns:
         str -- Page text with XML listing metadata for the target CIK.
     """
 
+    # Building parameters for request
+    params = __listingsParams(cik=cik, start_idx=start_idx, count=count,
+                              filing_type=filing_type, before=before)
+
+    # Making request; retried by the shared session on transient failures
+    r = getSession().get(url=LISTINGS_URL, params=params, endpoint='filings')
+
+    # Raise Exception if the request still doesn't work
+    if not r.ok:
+        logging.error('Listings request failed for CIK {0}, error {1}'
+                      .format(cik, r.status_code))
+        raise exceptions.RetryError('Listings request retry failed for CIK {0}'
+                                    .format(cik))
+
+    return r.text
+
+
+def __listingsParams(cik: str, start_idx: int, count: int,
+                     filing_type: str='', before: str='') -> dict:
+    """Function to build the query parameters of a listings page request.
     
-    base_url = 'https://sec.gov/cgi-bin/browse-edgar'
+    Arguments:
+        cik {str} -- Target CIK.
+        start_idx {int} -- Start index (for pagination).
+        count {int} -- Count of results per page.
+    
+    Keyword Arguments:
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD or YYYYMMDD; all if empty (default: {''}).
+    
+    Returns:
+        dict -- Query parameters of the request.
+    """
 
-    # Building parameters for request wit hticker
     # Note: Order of parameters here is important; null params are
     #       necessary cuz the SEC is silly
-    params = {
+    return {
         'action': 'getcompany',
         'CIK': cik,
-        'type': '',
-        'dateb': '',
+        'type': filing_type,
+        'dateb': before.replace('-', ''),
         'owner': 'exclude',
         'start': start_idx,
         'count': count,
         'output': 'atom'
     }
 
-    # Making request
-    r = get(url=base_url, params=params)
-
-    # Retry request if it fails; raise Exception if it still doesn't work
-    if (not r.ok) and (not retry):
-        logging.warn('Listings request failed for CIK {0}. Trying again...'
-                     .format(cik))
-        return __makeRequest(cik=cik, start_idx=start_idx, count=count,
-                             retry=True)
-    elif not r.ok:
-        logging.error('Listings request failed for CIK {0}'.format(cik))
-        raise exceptions.RetryError('Listings request retry failed for CIK {0}'
-                                    .format(cik))
+
+def __downloadIndexPage(url: str) -> str:
+    """Function to download the index page of a filing from EDGAR.
+    
+    Arguments:
+        url {str} -- URL of the filing index page, as given in the `url`
+                     field of a filing.
+    
+    Raises:
+        exceptions.RequestException -- Raised if page load fails.
+    
+    Returns:
+        str -- Page HTML.
+    """
+
+    # Making request; retried by the shared session on transient failures
+    r = getSession().get(url=url, endpoint='manifest')
+
+    # Handling failed request
+    if not r.ok:
+        logging.error('Filing index request failed for {0}, error {1}'
+                      .format(url, r.status_code))
+        raise exceptions.RequestException('Filing index request failed for '
+                                          '{0}'.format(url))
 
     return r.text
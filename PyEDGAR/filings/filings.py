@@ -1,77 +1,288 @@
 import logging
+import re
 import requests
 
-from .downloader import __downloadFilings
+from ..util.batch import __runBatch
+from ..util.memo import memoized
+from ..util.pipeline import __runPipeline
+from .container import Filings
+from .downloader import __downloadFilings, __iterPages
 from .parser import __parseHTML
 
+from typing import Iterable, Iterator, Union
 
-def getAllFilings(cik: str) -> list:
+
+# RegEx for a filing date, as opposed to an accession number
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+@memoized
+def getAllFilings(cik: str, max_workers: int=1, engine: str='etree',
+                  columnar: bool=False) -> Union[list, Filings]:
     """Function to get a list of SEC filings, given a company CIK.
     
     Arguments:
         cik {str} -- CIK of the target company.
     
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of listings pages requested
+                             concurrently (default: {1}).
+        engine {str} -- Listings parsing engine, 'etree' or 'bs4'
+                        (default: {'etree'}).
+        columnar {bool} -- Flag to return a columnar `Filings` container
+                           instead of a list; requires NumPy
+                           (default: {False}).
+    
     Returns:
-        list -- Structured list of dictionaries with filing information for a
-                given company. See user guide for more info.
+        Union[list, Filings] -- Structured list of dictionaries with filing
+                                information for a given company, or a
+                                `Filings` container if `columnar` is set. See
+                                user guide for more info.
     """
 
     logging.info('Getting filings from EDGAR for CIK {0}'.format(cik))
     
     # Getting page HTML for filings
-    pages_html = __downloadFilings(cik=cik)
+    pages_html = __downloadFilings(cik=cik, max_workers=max_workers)
 
     # Parsing HTML
-    filings_parsed = __parseHTML(pages_html=pages_html)
+    filings_parsed = __parseHTML(pages_html=pages_html, engine=engine)
+
+    if columnar:
+        return Filings.fromRecords(filings=filings_parsed)
 
     return filings_parsed
 
 
-def getFilingByType(cik: str, filing_type: str) -> list:
+def iterFilings(cik: str, engine: str='etree', filing_type: str='',
+                before: str='') -> Iterator[dict]:
+    """Function to lazily iterate through SEC filings, given a company CIK.
+    Each listings page is downloaded and parsed only when the filings of the
+    previous page have been consumed, so memory use does not grow with the
+    number of filings, and callers may stop early.
+    
+    Arguments:
+        cik {str} -- CIK of the target company.
+    
+    Keyword Arguments:
+        engine {str} -- Listings parsing engine, 'etree' or 'bs4'
+                        (default: {'etree'}).
+        filing_type {str} -- Filing type prefix to filter by on the server;
+                             all types if empty (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYY-MM-DD; all if empty (default: {''}).
+    
+    Returns:
+        Iterator[dict] -- Iterator of dictionaries with filing information,
+                          newest first, as in `getAllFilings`.
+    """
+
+    logging.info('Iterating filings from EDGAR for CIK {0}'.format(cik))
+
+    for page_html in __iterPages(cik=cik, filing_type=filing_type,
+                                 before=before):
+        yield from __parseHTML(pages_html=[page_html], engine=engine)
+
+
+def getAllFilingsBatch(ciks: Iterable, max_workers: int=4,
+                       parse_workers: int=0) -> Iterator[tuple]:
+    """Function to get lists of SEC filings for many companies concurrently.
+    All requests share the global EDGAR rate limit.
+
+    If `parse_workers` is set, listings pages are parsed in a pool of that
+    many processes while further pages are downloaded, so that parsing is
+    spread across CPU cores.
+    
+    Arguments:
+        ciks {Iterable} -- CIKs of the target companies.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of companies fetched concurrently
+                             (default: {4}).
+        parse_workers {int} -- Number of parsing processes; pages are parsed
+                               on the download threads if 0 (default: {0}).
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(cik, filings)` tuples, in order of
+                           completion (or in the order of `ciks` if
+                           `parse_workers` is set). If the filings for a CIK
+                           could not be retrieved, the exception is given in
+                           place of the filings.
+    """
+
+    if parse_workers > 0:
+        return __runPipeline(download=__downloadFilings, parse=__parseHTML,
+                             keys=ciks, max_workers=max_workers,
+                             parse_workers=parse_workers)
+
+    return __runBatch(func=getAllFilings, keys=ciks, max_workers=max_workers)
+
+
+def getNewFilings(cik: str, last_accession: str=None, since: str=None) \
+    -> list:
+    """Function to get filings made since the last known filing, for a given
+    company CIK. Listings pages are requested newest first, and pagination
+    stops as soon as a known filing is reached, so that an up-to-date company
+    usually costs a single request. Results are never memoized, so that each
+    call sees the latest filings.
+    
+    Arguments:
+        cik {str} -- CIK of the target company.
+    
+    Keyword Arguments:
+        last_accession {str} -- Accession number of the newest known filing;
+                                it and all older filings are excluded
+                                (default: {None}).
+        since {str} -- Date of the newest known filing, formatted YYYY-MM-DD;
+                       filings dated before it are excluded. Filings on this
+                       date are included, as not all of them may be known
+                       (default: {None}).
+    
+    Returns:
+        list -- Structured list of dictionaries with new filing information,
+                newest first.
+    """
+
+    logging.info('Getting new filings from EDGAR for CIK {0}'.format(cik))
+
+    new_filings = list()
+
+    for filing in iterFilings(cik=cik):
+        # Stopping at the first known filing
+        if filing['accession-number'] == last_accession:
+            break
+        if since is not None and filing['date'] < since:
+            break
+
+        new_filings += [filing]
+
+    return new_filings
+
+
+def getNewFilingsBatch(last_known: dict, max_workers: int=4) \
+    -> Iterator[tuple]:
+    """Function to get new filings for many companies concurrently. See
+    `getNewFilings`.
+
+    The newest known filing of each company may be given by its accession
+    number, by its date (formatted YYYY-MM-DD), or by a dictionary with the
+    keys 'accession' and/or 'since', passed to `getNewFilings` as
+    `last_accession` and `since`.
+    
+    Arguments:
+        last_known {dict} -- Dictionary mapping each target CIK to the
+                             accession number, date or dictionary of its
+                             newest known filing (or None if no filings are
+                             known).
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of companies fetched concurrently
+                             (default: {4}).
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(cik, new_filings)` tuples, in order
+                           of completion. If the filings for a CIK could not
+                           be retrieved, the exception is given in place of
+                           the filings.
+    """
+
+    def getNewFilingsForCIK(cik: str) -> list:
+        known = last_known[cik]
+
+        if isinstance(known, dict):
+            return getNewFilings(cik=cik,
+                                 last_accession=known.get('accession'),
+                                 since=known.get('since'))
+        if known is not None and DATE_RE.match(known):
+            return getNewFilings(cik=cik, since=known)
+
+        return getNewFilings(cik=cik, last_accession=known)
+
+    return __runBatch(func=getNewFilingsForCIK, keys=last_known,
+                      max_workers=max_workers)
+
+
+@memoized
+def getFilingByType(cik: str, filing_type: str, exact: bool=False,
+                    since: str=None, before: str=None) -> list:
     """Function to get filings by type, for a given company CIK.
+
+    The type and date filters are sent to EDGAR with the listings request, so
+    only matching filings are downloaded. As listings are ordered newest
+    first, pagination stops at the first filing older than `since`.
     
     Arguments:
         cik {str} -- CIK of target company.
         filing_type {str} -- Target filing type.
     
+    Keyword Arguments:
+        exact {bool} -- Flag to only match the filing type exactly (e.g.
+                        '10-K' but not '10-K/A'); otherwise all types
+                        starting with `filing_type` match (default: {False}).
+        since {str} -- Only include filings on or after this date, formatted
+                       YYYY-MM-DD (default: {None}).
+        before {str} -- Only include filings on or before this date, formatted
+                        YYYY-MM-DD (default: {None}).
+    
     Returns:
         list -- Structured list of dictionaries with target filing information.
     """
 
-    # Getting all filings
-    filings = getAllFilings(cik=cik)
-
     # Separating target filings
     target_filings = list()
 
-    for filing in filings:
-        if filing_type in filing['type']:
-            target_filings += [filing]
+    for filing in iterFilings(cik=cik, filing_type=filing_type,
+                              before=before or ''):
+        # Stopping at the first filing before the target date range
+        if since is not None and filing['date'] < since:
+            break
+
+        if exact and filing['type'] != filing_type:
+            continue
+        if not filing['type'].startswith(filing_type):
+            continue
+
+        target_filings += [filing]
     
     return target_filings
 
 
-def get10K(cik: str) -> list:
+@memoized
+def get10K(cik: str, exact: bool=False, since: str=None) -> list:
     """Function to get 10-K filings for a target company CIK.
     
     Arguments:
         cik {str} -- CIK of target company.
     
+    Keyword Arguments:
+        exact {bool} -- Flag to exclude amendments and variants, e.g. '10-K/A'
+                        (default: {False}).
+        since {str} -- Only include filings on or after this date, formatted
+                       YYYY-MM-DD (default: {None}).
+    
     Returns:
         list -- Structured list of dictionaries with 10-K filings.
     """
 
-    return getFilingByType(cik=cik, filing_type='10-K')
+    return getFilingByType(cik=cik, filing_type='10-K', exact=exact,
+                           since=since)
 
 
-def get10Q(cik: str) -> list:
+@memoized
+def get10Q(cik: str, exact: bool=False, since: str=None) -> list:
     """Function to get 10-Q filings for a target company CIK.
     
     Arguments:
         cik {str} -- CIK of target company.
     
+    Keyword Arguments:
+        exact {bool} -- Flag to exclude amendments and variants, e.g. '10-Q/A'
+                        (default: {False}).
+        since {str} -- Only include filings on or after this date, formatted
+                       YYYY-MM-DD (default: {None}).
+    
     Returns:
         list -- Structured list of dictionaries with 10-Q filings.
     """
 
-    return getFilingByType(cik=cik, filing_type='10-Q')
+    return getFilingByType(cik=cik, filing_type='10-Q', exact=exact,
+                           since=since)
@@ -0,0 +1,107 @@
+from ..util.batch import __runBatch
+from ..util.memo import memoized
+from .downloader import __downloadIndexPage
+from .parser import __parseIndexPage
+
+from typing import Iterable, Iterator
+import logging
+
+
+
+def getManifest(filing: dict, use_cache: bool=True) -> dict:
+    """Function to get the manifest of the documents in a filing, from its
+    filing index page.
+
+    If memoization is enabled (see `PyEDGAR.util.configureMemo`), manifests
+    are memoized by accession number, and concurrent requests for the same
+    filing share a single download.
+    
+    Arguments:
+        filing {dict} -- Dictionary with filing information, as returned by
+                         `getAllFilings`.
+    
+    Keyword Arguments:
+        use_cache {bool} -- Flag to use memoized manifests, if memoization
+                            is enabled (default: {True}).
+    
+    Raises:
+        exceptions.RequestException -- Raised if the index page request
+                                       fails.
+        LookupError -- Raised if the index page lists no documents.
+    
+    Returns:
+        dict -- Dictionary of the filing 'accession-number', index page
+                'url', 'form', 'filing_date', 'period' and 'documents'. See
+                `__parseIndexPage` in the `parser` module.
+    """
+
+    if not use_cache:
+        return __fetchManifest(accession_number=filing['accession-number'],
+                               url=filing['url'])
+
+    return __memoizedManifest(accession_number=filing['accession-number'],
+                              url=filing['url'])
+
+
+def getManifests(filings: Iterable, max_workers: int=4) -> Iterator[tuple]:
+    """Function to get the manifests of the documents in many filings
+    concurrently. All requests share the global EDGAR rate limit, and
+    manifests are memoized as in `getManifest`.
+    
+    Arguments:
+        filings {Iterable} -- Dictionaries with filing information, as
+                              returned by `getAllFilings`.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of index pages requested
+                             concurrently (default: {4}).
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(accession_number, manifest)` tuples,
+                           in order of completion. If a manifest could not be
+                           retrieved, the exception is given in place of the
+                           manifest.
+    """
+
+    for filing, manifest in __runBatch(func=getManifest, keys=filings,
+                                       max_workers=max_workers):
+        yield filing['accession-number'], manifest
+
+
+@memoized
+def __memoizedManifest(accession_number: str, url: str) -> dict:
+    """Function to get the manifest of a filing, memoized by its accession
+    number and index page URL.
+    
+    Arguments:
+        accession_number {str} -- Accession number of the filing.
+        url {str} -- URL of the filing index page.
+    
+    Returns:
+        dict -- Manifest of the filing. See `getManifest`.
+    """
+
+    return __fetchManifest(accession_number=accession_number, url=url)
+
+
+def __fetchManifest(accession_number: str, url: str) -> dict:
+    """Function to download and parse the index page of a filing.
+    
+    Arguments:
+        accession_number {str} -- Accession number of the filing.
+        url {str} -- URL of the filing index page.
+    
+    Returns:
+        dict -- Manifest of the filing. See `getManifest`.
+    """
+
+    logging.info('Getting manifest of filing {0}'.format(accession_number))
+
+    # Getting page HTML
+    page_html = __downloadIndexPage(url=url)
+
+    # Parsing page HTML
+    manifest = {'accession-number': accession_number, 'url': url}
+    manifest.update(__parseIndexPage(page_html=page_html))
+
+    return manifest
@@ -1,32 +1,165 @@
+from ..util import instrumentation
+from ..util.session import EDGAR_BASE_URL
+
 from bs4 import BeautifulSoup
+from xml.etree import ElementTree
 import html
 import logging
+import re
+
+
+# Required fields and corresponding XML tag (misspelling is intentional)
+REQUIRED_FIELDS = {'accession-number': 'accession-nunber',
+                   'type': 'filing-type',
+                   'url': 'filing-href',
+                   'date': 'filing-date'}
+# Optional fields and corresponding XML tag
+OPTIONAL_FIELDS = {'act': 'act',
+                   'file_number': 'file-number',
+                   'file_number_url': 'file-number-href',
+                   'film_number': 'film-number',
+                   'name': 'form-name',
+                   'description': 'items-desc',
+                   'size': 'size'}
+
+# Available parsing engines
+ENGINES = ('etree', 'bs4')
+
+# RegEx for the regions of filing index pages containing filing information
+FORM_NAME_RE = re.compile(r'<div id="formName">\s*<strong>(.*?)</strong>',
+                          re.S)
+INFO_RE = re.compile(r'<div class="infoHead">(.*?)</div>\s*'
+                     r'<div class="info">(.*?)</div>', re.S)
+# RegEx for document tables, and their rows and cells
+TABLE_RE = re.compile(r'<table class="tableFile"[^>]*>(.*?)</table>', re.S)
+ROW_RE = re.compile(r'<tr[^>]*>(.*?)</tr>', re.S)
+CELL_RE = re.compile(r'<td[^>]*>(.*?)</td>', re.S)
+# RegEx for the first link in a cell, and its text
+LINK_RE = re.compile(r'<a href="([^"]*)"[^>]*>(.*?)</a>', re.S)
+# RegEx for splitting HTML into tags and text
+TAG_RE = re.compile(r'<[^>]*>')
 
+# Prefix of links to documents opened in the inline XBRL viewer
+IX_VIEWER_PREFIX = '/ix?doc='
 
-def __parseHTML(pages_html: list) -> list:
+# Document fields, in the order of the columns of document tables
+DOCUMENT_FIELDS = ('seq', 'description', 'document', 'type', 'size')
+
+
+def __parseHTML(pages_html: list, engine: str='etree') -> list:
     """Function to parse raw HTML filings from EDGAR, and return a structured
     list of dictionaries with filing information.
+
+    The 'etree' engine parses the Atom XML of each page incrementally with
+    `xml.etree`, falling back to the 'bs4' engine (BeautifulSoup) for pages
+    that are not well-formed XML. Both engines produce identical output.
     
     Arguments:
         pages_html {list} -- Raw HTML of listings pages.
     
+    Keyword Arguments:
+        engine {str} -- Parsing engine, one of `ENGINES` (default: {'etree'}).
+    
+    Raises:
+        ValueError -- Raised if the parsing engine is not recognized.
+    
     Returns:
         list -- Structured list of dictionaries of filing information.
     """
 
-    filings = list()
+    if engine not in ENGINES:
+        raise ValueError('Unknown parsing engine {0}'.format(engine))
+
+    with instrumentation.measureParse(stage='filings',
+                                      pages=len(pages_html)) as parse:
+        filings = list()
+
+        for page in pages_html:
+            if engine == 'etree':
+                try:
+                    # Getting filings for each page
+                    filings += __parsePageFilingsXML(page_xml=page)
+                    continue
+                except ElementTree.ParseError as e:
+                    logging.warning('Listings page is not well-formed XML '
+                                    '({0}); falling back to BeautifulSoup'
+                                    .format(e))
+
+            # Parsing page with BeautifulSoup
+            page_parsed = BeautifulSoup(page, features='html.parser')
+            # Getting filings for each page
+            page_filings = __parsePageFilings(page_parsed=page_parsed)
+            # Adding page filing to list
+            filings += page_filings
 
-    for page in pages_html:
-        # Parsing page with BeautifulSoup
-        page_parsed = BeautifulSoup(page, features='html.parser')
-        # Getting filings for each page
-        page_filings = __parsePageFilings(page_parsed=page_parsed)
-        # Adding page filing to list
-        filings += page_filings
+        parse.entries = len(filings)
     
     return filings
 
 
+def __parsePageFilingsXML(page_xml: str, chunk_size: int=65536) -> list:
+    """Function to extract filings from the raw XML of an EDGAR listings page,
+    in a single incremental pass. Each entry is processed and discarded as
+    soon as it has been read, reading each of its elements once.
+    
+    Arguments:
+        page_xml {str} -- Raw XML of listings page.
+    
+    Keyword Arguments:
+        chunk_size {int} -- Number of characters fed to the XML parser at a
+                            time (default: {65536}).
+    
+    Raises:
+        ElementTree.ParseError -- Raised if the page is not well-formed XML.
+        ValueError -- Raised if an entry is missing a required field.
+    
+    Returns:
+        list -- Structured list of dictionaries of filing information.
+    """
+
+    # Mapping of XML tag to output field
+    tag_fields = {v: k for k, v in REQUIRED_FIELDS.items()}
+    tag_fields.update({v: k for k, v in OPTIONAL_FIELDS.items()})
+
+    # Filing information container
+    filings_parsed = list()
+
+    parser = ElementTree.XMLPullParser(events=('end',))
+
+    for i in range(0, len(page_xml), chunk_size):
+        parser.feed(page_xml[i:i + chunk_size])
+
+        for _, element in parser.read_events():
+            # Removing namespace from tag
+            if element.tag.rpartition('}')[2] != 'entry':
+                continue
+
+            f_parsed = dict()
+            # Reading each descendant once; first match of a tag wins
+            for child in element.iter():
+                field = tag_fields.get(child.tag.rpartition('}')[2])
+                if field is not None and field not in f_parsed:
+                    f_parsed[field] = ''.join(child.itertext())
+
+            # Checking all required fields are present
+            for k in REQUIRED_FIELDS:
+                if k not in f_parsed:
+                    raise ValueError('Filing is missing field {0}'.format(k))
+            # Optional fields (empty string if not available)
+            for k in OPTIONAL_FIELDS:
+                f_parsed.setdefault(k, '')
+
+            # Adding to list of filings, in the same key order as BeautifulSoup
+            filings_parsed += [{k: f_parsed[k] for k in tag_fields.values()}]
+
+            # Discarding parsed entry
+            element.clear()
+
+    parser.close()
+
+    return filings_parsed
+
+
 def __parsePageFilings(page_parsed: BeautifulSoup) -> list:
     """Function to extract filings from a parsed HTML EDGAR listings page.
     
@@ -43,28 +176,14 @@ def __parsePageFilings(page_parsed: BeautifulSoup) -> list:
     # Filing information container
     filings_parsed = list()
 
-    # Required fields and corresponding XML tag (misspelling is intentional)
-    required_fields = {'accession-number': 'accession-nunber',
-                       'type': 'filing-type',
-                       'url': 'filing-href',
-                       'date': 'filing-date'}
-    # Optional fields and corresponding XML tag
-    optional_fields = {'act': 'act',
-                       'file_number': 'file-number',
-                       'file_number_url': 'file-number-href',
-                       'film_number': 'film-number',
-                       'name': 'form-name',
-                       'description': 'items-desc',
-                       'size': 'size'}
-
     # Iterating through each filing, extracting information
     for filing in filings:
         f_parsed = dict()
         # Getting all required fields
-        for k, v in required_fields.items():
+        for k, v in REQUIRED_FIELDS.items():
             f_parsed[k] = filing.find(v).text
         # Getting optional fields (empty string if not available)
-        for k, v in optional_fields.items():
+        for k, v in OPTIONAL_FIELDS.items():
             try:
                 f_parsed[k] = filing.find(v).text
             except:
@@ -74,3 +193,94 @@ def __parsePageFilings(page_parsed: BeautifulSoup) -> list:
         filings_parsed += [f_parsed]
 
     return filings_parsed
+
+
+def __parseIndexPage(page_html: str) -> dict:
+    """Function to parse the HTML of a filing index page (`-index.htm`),
+    returning the manifest of the documents in the filing.
+
+    Only the form name, the information fields and the document tables are
+    extracted, with precompiled patterns and without building a document
+    tree. Documents are listed in page order: the document format files
+    (primary document, exhibits and complete submission text file), followed
+    by the data files (e.g. XBRL instance and schemas).
+    
+    Arguments:
+        page_html {str} -- Raw HTML of filing index page.
+    
+    Raises:
+        LookupError -- Raised if the page has no document tables.
+    
+    Returns:
+        dict -- Dictionary of the filing 'form', 'filing_date' and 'period'
+                (empty strings if not available), and the list of
+                'documents', each with the keys `seq`, `description`,
+                `document`, `url`, `type` and `size` (in bytes, or None).
+    """
+
+    with instrumentation.measureParse(stage='manifest') as parse:
+        tables = TABLE_RE.findall(page_html)
+
+        if not tables:
+            raise LookupError('Filing documents not found')
+
+        documents = list()
+
+        for table in tables:
+            for row in ROW_RE.findall(table):
+                cells = CELL_RE.findall(row)
+                # Skipping header rows
+                if len(cells) != len(DOCUMENT_FIELDS):
+                    continue
+
+                document = {k: __cellText(cell_html=c)
+                            for k, c in zip(DOCUMENT_FIELDS, cells)}
+
+                # Document name and URL, outside of the inline XBRL viewer
+                link = LINK_RE.search(cells[2])
+                url = ''
+                if link is not None:
+                    url = html.unescape(link.group(1))
+                    document['document'] = __cellText(cell_html=link.group(2))
+                if url.startswith(IX_VIEWER_PREFIX):
+                    url = url[len(IX_VIEWER_PREFIX):]
+                if url.startswith('/'):
+                    url = EDGAR_BASE_URL + url
+                document['url'] = url
+
+                # Size in bytes
+                document['size'] = int(document['size']) \
+                    if document['size'].isdigit() else None
+
+                documents += [document]
+
+        # Getting filing information
+        info = {__cellText(cell_html=k): __cellText(cell_html=v)
+                for k, v in INFO_RE.findall(page_html)}
+        form_match = FORM_NAME_RE.search(page_html)
+        form = __cellText(cell_html=form_match.group(1)) if form_match else ''
+
+        manifest = {'form': form[len('Form '):] if form.startswith('Form ')
+                    else form,
+                    'filing_date': info.get('Filing Date', ''),
+                    'period': info.get('Period of Report', ''),
+                    'documents': documents}
+
+        parse.entries = len(documents)
+
+    return manifest
+
+
+def __cellText(cell_html: str) -> str:
+    """Function to extract the stripped text from an HTML fragment.
+    
+    Arguments:
+        cell_html {str} -- HTML fragment, e.g. a table cell.
+    
+    Returns:
+        str -- Text of the fragment, with non-breaking spaces removed.
+    """
+
+    text = html.unescape(TAG_RE.sub('', cell_html))
+
+    return text.replace('\xa0', ' ').strip()
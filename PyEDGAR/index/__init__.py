@@ -0,0 +1,3 @@
+from .index import getFullIndex
+from .index import iterFullIndex
+from .index import iterIndex
@@ -0,0 +1,89 @@
+from ..util.session import getSession
+
+from contextlib import contextmanager, ExitStack
+from requests import exceptions
+from typing import Iterator
+import gzip
+import io
+import logging
+
+
+# Base URL of the quarterly full-index files
+FULL_INDEX_URL = 'https://www.sec.gov/Archives/edgar/full-index'
+
+# Magic bytes at the start of gzip files
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def __fullIndexURL(year: int, quarter: int, index_type: str='form',
+                   compressed: bool=True) -> str:
+    """Function to build the URL of a quarterly full-index file.
+    
+    Arguments:
+        year {int} -- Year of the index.
+        quarter {int} -- Quarter of the index, from 1 to 4.
+    
+    Keyword Arguments:
+        index_type {str} -- Index file, 'form', 'master' or 'company'
+                            (default: {'form'}).
+        compressed {bool} -- Flag to use the gzipped file (default: {True}).
+    
+    Raises:
+        ValueError -- Raised if the quarter or index type are not valid.
+    
+    Returns:
+        str -- URL of the index file.
+    """
+
+    if quarter not in (1, 2, 3, 4):
+        raise ValueError('Quarter must be between 1 and 4')
+    if index_type not in ('form', 'master', 'company'):
+        raise ValueError('Unknown index type {0}'.format(index_type))
+
+    return '{0}/{1}/QTR{2}/{3}.{4}'.format(FULL_INDEX_URL, year, quarter,
+                                           index_type,
+                                           'gz' if compressed else 'idx')
+
+
+@contextmanager
+def __openIndex(source: str) -> Iterator[io.TextIOBase]:
+    """Function to open an index file for streaming, from a local path or a
+    URL. Gzipped files are detected and decompressed on the fly, so that the
+    file is never held in memory as a whole. Used as a context manager, which
+    closes the file or connection on exit.
+    
+    Arguments:
+        source {str} -- Local path or URL of the index file.
+    
+    Raises:
+        exceptions.RequestException -- Raised if the download fails.
+    
+    Returns:
+        Iterator[io.TextIOBase] -- Context manager of the text stream of the
+                                   index file.
+    """
+
+    with ExitStack() as stack:
+        if source.startswith(('http://', 'https://')):
+            # Streaming download; the body is read as it is parsed
+            r = getSession().get(url=source, endpoint='index', stream=True)
+            stack.callback(r.close)
+
+            if not r.ok:
+                logging.warning('Request failed: Index download from {0}, '
+                                'error {1}'.format(source, r.status_code))
+                raise exceptions.RequestException('Request failed')
+
+            # Undoing any transfer encoding (not the gzip file format)
+            r.raw.decode_content = True
+            stream = io.BufferedReader(r.raw)
+        else:
+            stream = stack.enter_context(open(source, 'rb'))
+
+        # Checking for gzip file format
+        if stream.peek(2)[:2] == GZIP_MAGIC:
+            stream = stack.enter_context(gzip.GzipFile(fileobj=stream,
+                                                       mode='rb'))
+
+        # Index files are plain ASCII, with occasional Latin-1 company names
+        yield io.TextIOWrapper(stream, encoding='latin-1')
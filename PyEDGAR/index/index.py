@@ -0,0 +1,114 @@
+from ..filings.container import Filings
+from .downloader import __fullIndexURL, __openIndex
+from .parser import __parseIndex
+
+from typing import Iterator, Union
+import logging
+
+
+def iterIndex(source: str, filing_type: str='',
+              exact: bool=False) -> Iterator[dict]:
+    """Function to lazily iterate through the filings of an EDGAR full-index
+    file ('master', 'form' or 'company', plain or gzipped), from a local path
+    or a URL. The file is streamed and parsed row by row, so memory use does
+    not grow with its size.
+    
+    Arguments:
+        source {str} -- Local path or URL of the index file.
+    
+    Keyword Arguments:
+        filing_type {str} -- Only include filings of types starting with this
+                             type; all if empty (default: {''}).
+        exact {bool} -- Flag to only match the filing type exactly (e.g.
+                        '10-K' but not '10-K/A') (default: {False}).
+    
+    Raises:
+        exceptions.RequestException -- Raised if the download fails.
+        ValueError -- Raised if the index file is malformed.
+    
+    Returns:
+        Iterator[dict] -- Iterator of dictionaries with filing information,
+                          as in `getAllFilings`, with the 'cik' and 'company'
+                          name of each filer, in index order.
+    """
+
+    logging.info('Reading EDGAR full index from {0}'.format(source))
+
+    with __openIndex(source=source) as lines:
+        for filing in __parseIndex(lines=lines):
+            if exact and filing['type'] != filing_type:
+                continue
+            if not filing['type'].startswith(filing_type):
+                continue
+
+            yield filing
+
+
+def iterFullIndex(year: int, quarter: int, index_type: str='form',
+                  filing_type: str='', exact: bool=False) -> Iterator[dict]:
+    """Function to lazily iterate through all filings made in a quarter, from
+    the EDGAR quarterly full-index. A single (gzipped) download replaces the
+    listings requests of every company that filed in the quarter.
+    
+    Arguments:
+        year {int} -- Year of the index.
+        quarter {int} -- Quarter of the index, from 1 to 4.
+    
+    Keyword Arguments:
+        index_type {str} -- Index file, 'form' (sorted by form type),
+                            'master' or 'company' (sorted by company)
+                            (default: {'form'}).
+        filing_type {str} -- Only include filings of types starting with this
+                             type; all if empty (default: {''}).
+        exact {bool} -- Flag to only match the filing type exactly (e.g.
+                        '10-K' but not '10-K/A') (default: {False}).
+    
+    Raises:
+        exceptions.RequestException -- Raised if the download fails.
+        ValueError -- Raised if the quarter or index type are not valid.
+    
+    Returns:
+        Iterator[dict] -- Iterator of dictionaries with filing information,
+                          as in `iterIndex`.
+    """
+
+    url = __fullIndexURL(year=year, quarter=quarter, index_type=index_type)
+
+    return iterIndex(source=url, filing_type=filing_type, exact=exact)
+
+
+def getFullIndex(year: int, quarter: int, index_type: str='form',
+                 filing_type: str='', exact: bool=False,
+                 columnar: bool=False) -> Union[list, Filings]:
+    """Function to get all filings made in a quarter, from the EDGAR
+    quarterly full-index. See `iterFullIndex`.
+    
+    Arguments:
+        year {int} -- Year of the index.
+        quarter {int} -- Quarter of the index, from 1 to 4.
+    
+    Keyword Arguments:
+        index_type {str} -- Index file, 'form', 'master' or 'company'
+                            (default: {'form'}).
+        filing_type {str} -- Only include filings of types starting with this
+                             type; all if empty (default: {''}).
+        exact {bool} -- Flag to only match the filing type exactly
+                        (default: {False}).
+        columnar {bool} -- Flag to return a columnar `Filings` container
+                           instead of a list; requires NumPy
+                           (default: {False}).
+    
+    Returns:
+        Union[list, Filings] -- Structured list of dictionaries with filing
+                                information, or a `Filings` container of the
+                                `getAllFilings` fields if `columnar` is set.
+    """
+
+    filings = iterFullIndex(year=year, quarter=quarter,
+                            index_type=index_type, filing_type=filing_type,
+                            exact=exact)
+
+    if columnar:
+        return Filings.fromRecords(filings=filings)
+
+    return list(filings)
@@ -0,0 +1,184 @@
+from ..filings.parser import OPTIONAL_FIELDS
+from ..util import instrumentation
+
+from typing import Iterable, Iterator
+
+
+# Base URL of filing archives
+ARCHIVES_URL = 'https://www.sec.gov/Archives'
+
+# Column headers of the fixed-width 'form' and 'company' index files
+FORM_COLUMN = 'Form Type'
+COMPANY_COLUMN = 'Company Name'
+
+
+def __parseIndex(lines: Iterable[str]) -> Iterator[dict]:
+    """Function to lazily parse the lines of an EDGAR full-index file, in
+    the pipe-delimited 'master' format or the fixed-width 'form' and
+    'company' formats, into dictionaries of filing information.
+
+    Records have the same fields as those of `getAllFilings`, and the CIK
+    and name of the filer. Fields not in the index are empty strings.
+    
+    Arguments:
+        lines {Iterable[str]} -- Lines of the index file, including the
+                                 header.
+    
+    Raises:
+        ValueError -- Raised if the index header or a row is malformed.
+    
+    Returns:
+        Iterator[dict] -- Iterator of dictionaries of filing information, in
+                          index order.
+    """
+
+    lines = iter(lines)
+
+    # Finding the column header line, above the dashed separator
+    header = None
+    for line in lines:
+        if line.startswith('---'):
+            break
+        if line.strip():
+            header = line
+    else:
+        raise ValueError('Index header not found')
+
+    if header is None:
+        raise ValueError('Index header not found')
+
+    if '|' in header:
+        parse_line = __parseMasterLine
+        columns = None
+    else:
+        # Fixed-width; the first column is the form type or company name
+        columns = (header.startswith(FORM_COLUMN),
+                   header.index(COMPANY_COLUMN if
+                                header.startswith(FORM_COLUMN)
+                                else FORM_COLUMN))
+        parse_line = __parseFixedWidthLine
+
+    # CPU time is measured per row, as the consumer runs between rows
+    with instrumentation.measureParse(stage='index') as parse:
+        for line in lines:
+            if not line.strip():
+                continue
+
+            filing = parse_line(line=line.rstrip('\r\n'), columns=columns)
+            parse.entries += 1
+
+            parse.suspend()
+            yield filing
+            parse.resume()
+
+
+def __parseMasterLine(line: str, columns: tuple=None) -> dict:
+    """Function to parse a row of a 'master' index file, formatted
+    'CIK|Company Name|Form Type|Date Filed|Filename'.
+    
+    Arguments:
+        line {str} -- Row of the index file.
+    
+    Keyword Arguments:
+        columns {tuple} -- Unused; for a common signature with
+                           `__parseFixedWidthLine` (default: {None}).
+    
+    Raises:
+        ValueError -- Raised if the row is malformed.
+    
+    Returns:
+        dict -- Dictionary of filing information.
+    """
+
+    fields = line.split('|')
+
+    if len(fields) != 5:
+        raise ValueError('Malformed index row: {0!r}'.format(line))
+
+    cik, company, form_type, date, filename = fields
+
+    return __filingRecord(cik=cik, company=company, form_type=form_type,
+                          date=date, filename=filename)
+
+
+def __parseFixedWidthLine(line: str, columns: tuple) -> dict:
+    """Function to parse a row of a fixed-width 'form' or 'company' index
+    file. The last three columns (CIK, date and filename) never contain
+    spaces, so only the boundary between the first two is taken from the
+    header.
+    
+    Arguments:
+        line {str} -- Row of the index file.
+        columns {tuple} -- Tuple of a flag for form type being the first
+                           column, and the start of the second column.
+    
+    Raises:
+        ValueError -- Raised if the row is malformed.
+    
+    Returns:
+        dict -- Dictionary of filing information.
+    """
+
+    form_first, second_start = columns
+
+    first = line[:second_start].strip()
+    fields = line[second_start:].rsplit(None, 3)
+
+    if len(fields) != 4 or not first:
+        raise ValueError('Malformed index row: {0!r}'.format(line))
+
+    second, cik, date, filename = fields
+
+    if form_first:
+        form_type, company = first, second.strip()
+    else:
+        form_type, company = second.strip(), first
+
+    return __filingRecord(cik=cik, company=company, form_type=form_type,
+                          date=date, filename=filename)
+
+
+def __filingRecord(cik: str, company: str, form_type: str, date: str,
+                   filename: str) -> dict:
+    """Function to build a filing record from the fields of an index row.
+    
+    Arguments:
+        cik {str} -- CIK of the filer, without leading zeros.
+        company {str} -- Name of the filer.
+        form_type {str} -- Filing type.
+        date {str} -- Filing date, formatted YYYY-MM-DD or YYYYMMDD.
+        filename {str} -- Path of the full submission text file, relative to
+                          the archives (e.g.
+                          'edgar/data/320193/0000320193-23-000106.txt').
+    
+    Raises:
+        ValueError -- Raised if the filename is malformed.
+    
+    Returns:
+        dict -- Dictionary of filing information.
+    """
+
+    # Accession number is the name of the submission file
+    accession = filename.rpartition('/')[2].rpartition('.')[0]
+    if not accession:
+        raise ValueError('Malformed index filename: {0!r}'.format(filename))
+
+    if len(date) == 8:
+        date = '{0}-{1}-{2}'.format(date[:4], date[4:6], date[6:])
+
+    cik = cik.strip()
+
+    # Filing index page, as linked by EDGAR listings
+    url = '{0}/edgar/data/{1}/{2}/{3}-index.htm'.format(
+        ARCHIVES_URL, int(cik), accession.replace('-', ''), accession)
+
+    filing = {'accession-number': accession,
+              'type': form_type,
+              'url': url,
+              'date': date}
+    # Optional fields are not in the index
+    filing.update({k: '' for k in OPTIONAL_FIELDS})
+    filing['cik'] = cik.zfill(10)
+    filing['company'] = company.strip()
+
+    return filing
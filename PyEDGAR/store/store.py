@@ -0,0 +1,260 @@
+from ..filings.container import FIELDS
+
+from typing import Iterable
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# Column of the filings table for each listing field
+FIELD_COLUMNS = dict({k: k for k in FIELDS}, **{'accession-number':
+                                                'accession'})
+
+# Columns of the filings table, in order
+FILING_COLUMNS = ('accession', 'cik') + tuple(FIELD_COLUMNS[k] for k in
+                                              FIELDS[1:])
+
+# Columns of the companies table, in order, other than the full info
+COMPANY_COLUMNS = ('cik', 'name', 'sic', 'sic_type', 'location',
+                   'incorporation_state', 'fiscal_year_end')
+
+# Upper bound of strings starting with a prefix, for prefix range queries
+PREFIX_END = '\U0010ffff'
+
+
+class FilingsStore(object):
+    """Persistent, thread-safe local store of filings and company information
+    backed by SQLite.
+
+    Filings are keyed by accession number and companies by CIK, so storing
+    the same records again updates them in place. Filings are indexed by
+    CIK, form type and filing date, and companies by SIC code, so that
+    queries across many companies are answered without contacting EDGAR.
+    """
+
+    def __init__(self, path: str):
+        """Constructor for the filings store.
+
+        Arguments:
+            path {str} -- Path to the SQLite database file; created if it
+                          does not exist.
+        """
+
+        self.path = os.path.expanduser(path)
+
+        # Creating parent directory if required
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.__conn.execute('PRAGMA journal_mode=WAL')
+        self.__conn.execute('PRAGMA synchronous=NORMAL')
+        self.__conn.execute('''
+            CREATE TABLE IF NOT EXISTS filings (
+                accession TEXT PRIMARY KEY,
+                cik TEXT,
+                type TEXT,
+                url TEXT,
+                date TEXT,
+                act TEXT,
+                file_number TEXT,
+                file_number_url TEXT,
+                film_number TEXT,
+                name TEXT,
+                description TEXT,
+                size TEXT
+            )''')
+        self.__conn.execute('''
+            CREATE TABLE IF NOT EXISTS companies (
+                cik TEXT PRIMARY KEY,
+                name TEXT,
+                sic TEXT,
+                sic_type TEXT,
+                location TEXT,
+                incorporation_state TEXT,
+                fiscal_year_end TEXT,
+                info TEXT,
+                updated REAL
+            )''')
+        self.__conn.execute('CREATE INDEX IF NOT EXISTS filings_cik_date '
+                            'ON filings (cik, date)')
+        self.__conn.execute('CREATE INDEX IF NOT EXISTS filings_type_date '
+                            'ON filings (type, date)')
+        self.__conn.execute('CREATE INDEX IF NOT EXISTS filings_date '
+                            'ON filings (date)')
+        self.__conn.execute('CREATE INDEX IF NOT EXISTS companies_sic '
+                            'ON companies (sic)')
+        self.__conn.commit()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__conn.execute('SELECT COUNT(*) FROM filings') \
+                .fetchone()[0]
+
+    def upsertFilings(self, filings: Iterable, cik: str=None) -> int:
+        """Function to store filings, replacing any stored filings with the
+        same accession numbers. All filings are stored in one transaction.
+
+        Arguments:
+            filings {Iterable} -- Dictionaries of filing information, as
+                                  returned by `getAllFilings`, or with a
+                                  'cik' field (as from `PyEDGAR.index`).
+
+        Keyword Arguments:
+            cik {str} -- CIK of the filer of all filings, if they do not have
+                         a 'cik' field (default: {None}).
+
+        Raises:
+            ValueError -- Raised if the CIK of a filing is not known.
+
+        Returns:
+            int -- Number of filings stored.
+        """
+
+        rows = list()
+        for filing in filings:
+            filing_cik = filing.get('cik', cik)
+            if filing_cik is None:
+                raise ValueError('CIK of filing {0} is not known'
+                                 .format(filing['accession-number']))
+            rows += [(filing['accession-number'], filing_cik) +
+                     tuple(filing.get(k, '') for k in FIELDS[1:])]
+
+        sql = 'INSERT INTO filings ({0}) VALUES ({1}) ON CONFLICT ' \
+              '(accession) DO UPDATE SET {2}'.format(
+                  ', '.join(FILING_COLUMNS),
+                  ', '.join('?' * len(FILING_COLUMNS)),
+                  ', '.join('{0} = excluded.{0}'.format(c)
+                            for c in FILING_COLUMNS[1:]))
+
+        with self.__lock:
+            self.__conn.executemany(sql, rows)
+            self.__conn.commit()
+
+        return len(rows)
+
+    def upsertInfo(self, info: dict):
+        """Function to store company information, replacing any stored
+        information for the same CIK.
+
+        Arguments:
+            info {dict} -- Dictionary of company information, as returned by
+                           `getInfo`.
+        """
+
+        metadata = info.get('metadata', dict())
+        row = (info['cik'], info.get('name', '')) + \
+            tuple(metadata.get(k, '') for k in COMPANY_COLUMNS[2:]) + \
+            (json.dumps({k: v for k, v in info.items() if k != '_raw'}),
+             time.time())
+
+        with self.__lock:
+            self.__conn.execute('INSERT OR REPLACE INTO companies VALUES '
+                                '(?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+            self.__conn.commit()
+
+    def getInfo(self, cik: str) -> dict:
+        """Function to get stored company information.
+
+        Arguments:
+            cik {str} -- CIK of the target company.
+
+        Returns:
+            dict -- Dictionary of company information, as stored from
+                    `getInfo`, or None if it is not stored.
+        """
+
+        with self.__lock:
+            row = self.__conn.execute('SELECT info FROM companies '
+                                      'WHERE cik = ?', (cik,)).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def query(self, cik: str=None, filing_type: str=None, exact: bool=False,
+              year: int=None, since: str=None, before: str=None,
+              sic: str=None, limit: int=None) -> list:
+        """Function to query stored filings, e.g. all 10-K filings made in
+        2019 by companies with SIC code 3571. Filters on SIC code require the
+        information of the companies to be stored (see `upsertInfo`).
+
+        Keyword Arguments:
+            cik {str} -- Only include filings by this CIK (default: {None}).
+            filing_type {str} -- Only include filings of types starting with
+                                 this type (default: {None}).
+            exact {bool} -- Flag to only match the filing type exactly
+                            (default: {False}).
+            year {int} -- Only include filings made in this year
+                          (default: {None}).
+            since {str} -- Only include filings on or after this date,
+                           formatted YYYY-MM-DD (default: {None}).
+            before {str} -- Only include filings on or before this date,
+                            formatted YYYY-MM-DD (default: {None}).
+            sic {str} -- Only include filings by companies with this SIC
+                         code (default: {None}).
+            limit {int} -- Maximum number of filings returned
+                           (default: {None}).
+
+        Returns:
+            list -- Structured list of dictionaries with filing information,
+                    as in `getAllFilings`, with the 'cik' of each filer,
+                    newest first.
+        """
+
+        conditions, params = list(), list()
+
+        if cik is not None:
+            conditions += ['f.cik = ?']
+            params += [cik]
+        if filing_type is not None and exact:
+            conditions += ['f.type = ?']
+            params += [filing_type]
+        elif filing_type is not None:
+            # Prefix match as a range, so that the type index is used
+            conditions += ['f.type >= ? AND f.type < ?']
+            params += [filing_type, filing_type + PREFIX_END]
+        if year is not None:
+            conditions += ['f.date >= ? AND f.date < ?']
+            params += ['{0:04d}-01-01'.format(year),
+                       '{0:04d}-01-01'.format(year + 1)]
+        if since is not None:
+            conditions += ['f.date >= ?']
+            params += [since]
+        if before is not None:
+            conditions += ['f.date <= ?']
+            params += [before]
+        if sic is not None:
+            conditions += ['f.cik IN (SELECT cik FROM companies '
+                           'WHERE sic = ?)']
+            params += [sic]
+
+        sql = 'SELECT {0} FROM filings f'.format(
+            ', '.join('f.' + c for c in FILING_COLUMNS))
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY f.date DESC, f.accession DESC'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params += [limit]
+
+        with self.__lock:
+            rows = self.__conn.execute(sql, params).fetchall()
+
+        filings = list()
+        for row in rows:
+            values = dict(zip(FILING_COLUMNS, row))
+            filing = {k: values[FIELD_COLUMNS[k]] for k in FIELDS}
+            filing['cik'] = values['cik']
+            filings += [filing]
+
+        return filings
+
+    def close(self):
+        """Function to close the underlying database connection.
+        """
+
+        with self.__lock:
+            self.__conn.close()
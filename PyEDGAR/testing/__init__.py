@@ -0,0 +1,5 @@
+from .pages import makeFilings
+from .pages import makeListingsPage
+from .server import EdgarStandIn
+from .server import StandInServer
+from .server import main
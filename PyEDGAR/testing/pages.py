@@ -0,0 +1,259 @@
+"""Synthetic EDGAR atom listings pages, shared by the stand-in server and
+offline tests.
+
+Synthetic filers have several filings per day, newest first, going back from
+`END_DATE`, with types in rotation. `syntheticFiling` generates any single
+filing of a filer directly, so that listings of any size can be served
+without generating the filings before them.
+"""
+
+import datetime
+import html
+import re
+
+
+# Date of the newest synthetic filing
+END_DATE = datetime.date(2019, 12, 31)
+
+# Number of synthetic filings per day, going back from `END_DATE`
+FILINGS_PER_DAY = 4
+
+# Types of synthetic filings, in rotation
+FILING_TYPES = ('10-Q', '8-K', '4', '10-K', '8-K', '4', '10-Q', '10-K/A')
+
+# RegEx for the link to the next page of an atom listings page
+NEXT_LINK_RE = re.compile(r'<link [^>]*rel="next"[^>]*/>\n?')
+
+# Template for a single entry in an atom listings page
+ENTRY_TEMPLATE = '''<entry>
+<category label="form type" scheme="https://www.sec.gov/" term="{type}" />
+<content type="text/xml">
+<accession-nunber>{accession}</accession-nunber>
+<act>34</act>
+<file-number>001-{cik_int:05d}</file-number>
+<file-number-href>https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&amp;filenum=001-{cik_int:05d}&amp;owner=exclude&amp;count=40</file-number-href>
+<filing-date>{date}</filing-date>
+<filing-href>https://www.sec.gov/Archives/edgar/data/{cik_int}/{accession_flat}/{accession}-index.htm</filing-href>
+<filing-type>{type}</filing-type>
+<film-number>{film}</film-number>
+<form-name>Synthetic filing</form-name>
+<size>11 MB</size>
+</content>
+<id>urn:tag:sec.gov,2008:accession-number={accession}</id>
+<link href="https://www.sec.gov/Archives/edgar/data/{cik_int}/{accession_flat}/{accession}-index.htm" rel="alternate" type="text/html" />
+<summary type="html"> &lt;b&gt;Filed:&lt;/b&gt; {date} &lt;b&gt;AccNo:&lt;/b&gt; {accession} &lt;b&gt;Size:&lt;/b&gt; 11 MB</summary>
+<title>{type}  - Synthetic filing </title>
+<updated>{date}T08:30:00-05:00</updated>
+</entry>
+'''
+
+# Template for an atom listings page
+LISTINGS_TEMPLATE = '''<?xml version="1.0" encoding="ISO-8859-1" ?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<author>
+<email>webmaster@sec.gov</email>
+<name>Webmaster</name>
+</author>
+<company-info>
+<addresses>
+<address type="mailing">
+<city>SPRINGFIELD</city>
+<state>IL</state>
+<street1>{cik_int} MAIN ST</street1>
+<street2>SUITE 200</street2>
+<zip>62701</zip>
+</address>
+<address type="business">
+<city>SPRINGFIELD</city>
+<phone>(217) 555-0100</phone>
+<state>IL</state>
+<street1>{cik_int} MAIN ST</street1>
+<zip>62701</zip>
+</address>
+</addresses>
+<assigned-sic>3571</assigned-sic>
+<assigned-sic-desc>ELECTRONIC COMPUTERS</assigned-sic-desc>
+<cik>{cik}</cik>
+<conformed-name>{name}</conformed-name>
+<fiscal-year-end>1231</fiscal-year-end>
+<formerly-names>
+<names>
+<date>2007-01-04</date>
+<name>{former_name}</name>
+</names>
+</formerly-names>
+<state-location>IL</state-location>
+<state-of-incorporation>DE</state-of-incorporation>
+</company-info>
+{next_link}<link href="/cgi-bin/browse-edgar?action=getcompany&amp;CIK={cik}&amp;type=&amp;dateb=&amp;owner=exclude&amp;count=40" rel="alternate" type="text/html" />
+<title>{name}  ({cik})</title>
+<updated>{end_date}T08:30:00-05:00</updated>
+{entries}</feed>
+'''
+
+# Template for the link to the next page of an atom listings page
+NEXT_LINK_TEMPLATE = ('<link href="/cgi-bin/browse-edgar?action=getcompany'
+                      '&amp;CIK={cik}&amp;type={type}&amp;dateb={dateb}'
+                      '&amp;owner=exclude&amp;start={start}&amp;count={count}'
+                      '&amp;output=atom" rel="next" '
+                      'type="application/atom+xml" />\n')
+
+
+def companyName(cik: str) -> str:
+    """Function to get the name of a synthetic filer.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+
+    Returns:
+        str -- Company name.
+    """
+
+    return 'SYNTHETIC CORP {0}'.format(int(cik))
+
+
+def formerName(cik: str) -> str:
+    """Function to get the former name of a synthetic filer.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+
+    Returns:
+        str -- Former company name, used for filings through 2007-01-04.
+    """
+
+    return 'SYNTHETIC COMPUTER CORP {0}'.format(int(cik))
+
+
+def syntheticFiling(cik: str, n: int, total: int) -> dict:
+    """Function to generate the attributes of a synthetic filing.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+        n {int} -- Number of the filing, from 1 for the oldest.
+        total {int} -- Number of filings of the filer.
+
+    Returns:
+        dict -- Dictionary of filing attributes, for `renderEntry`.
+    """
+
+    position = total - n
+    date = END_DATE - datetime.timedelta(days=position // FILINGS_PER_DAY)
+    accession = '{0}-{1:02d}-{2:06d}'.format(cik, date.year % 100, n)
+
+    return {'accession': accession,
+            'accession_flat': accession.replace('-', ''),
+            'cik': cik,
+            'cik_int': int(cik),
+            'date': date.isoformat(),
+            'film': 10000000 + n,
+            'type': FILING_TYPES[n % len(FILING_TYPES)]}
+
+
+def makeFilings(cik: str, total: int) -> list:
+    """Function to generate the attributes of all synthetic filings of a
+    filer, newest first.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+        total {int} -- Number of filings.
+
+    Returns:
+        list -- List of dictionaries of filing attributes.
+    """
+
+    return [syntheticFiling(cik=cik, n=total - i, total=total)
+            for i in range(total)]
+
+
+def renderEntry(filing: dict) -> str:
+    """Function to render the atom entry of a filing.
+
+    Arguments:
+        filing {dict} -- Filing attributes, from `syntheticFiling`.
+
+    Returns:
+        str -- Entry XML.
+    """
+
+    return ENTRY_TEMPLATE.format(**filing)
+
+
+def nextLink(cik: str, start: int, count: int, filing_type: str='',
+             before: str='') -> str:
+    """Function to render the link to the next page of an atom listings
+    page.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+        start {int} -- Start index of the next page.
+        count {int} -- Count of results per page.
+
+    Keyword Arguments:
+        filing_type {str} -- Filing type prefix filtered by (default: {''}).
+        before {str} -- Date filtered by, formatted YYYYMMDD
+                        (default: {''}).
+
+    Returns:
+        str -- Link XML.
+    """
+
+    return NEXT_LINK_TEMPLATE.format(cik=cik, type=html.escape(filing_type),
+                                     dateb=before, start=start, count=count)
+
+
+def renderListingsPage(cik: str, entries: str, next_link: str='') -> str:
+    """Function to render an atom listings page of a synthetic filer.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+        entries {str} -- XML of the page entries, from `renderEntry`.
+
+    Keyword Arguments:
+        next_link {str} -- XML of the link to the next page, from
+                           `nextLink`; none if empty (default: {''}).
+
+    Returns:
+        str -- Page XML.
+    """
+
+    return LISTINGS_TEMPLATE.format(
+        cik=cik, cik_int=int(cik), name=html.escape(companyName(cik=cik)),
+        former_name=html.escape(formerName(cik=cik)),
+        end_date=END_DATE.isoformat(), next_link=next_link, entries=entries)
+
+
+def makeListingsPage(cik: str, filings: list, start: int, count: int,
+                     filing_type: str='', before: str='') -> str:
+    """Function to render a page of the atom listings of a filer, filtering
+    its filings by type and date as EDGAR does.
+
+    Arguments:
+        cik {str} -- CIK of the filer.
+        filings {list} -- Filing attributes, newest first, from
+                          `makeFilings`.
+        start {int} -- Start index of the page.
+        count {int} -- Count of results per page.
+
+    Keyword Arguments:
+        filing_type {str} -- Filing type prefix to filter by (default: {''}).
+        before {str} -- Only list filings on or before this date, formatted
+                        YYYYMMDD or YYYY-MM-DD (default: {''}).
+
+    Returns:
+        str -- Page XML.
+    """
+
+    before = before.replace('-', '')
+    filings = [f for f in filings if f['type'].startswith(filing_type)
+               and (not before or f['date'].replace('-', '') <= before)]
+
+    next_link = ''
+    if start + count < len(filings):
+        next_link = nextLink(cik=cik, start=start + count, count=count,
+                             filing_type=filing_type, before=before)
+
+    return renderListingsPage(
+        cik=cik, next_link=next_link,
+        entries=''.join(renderEntry(filing=f)
+                        for f in filings[start:start + count]))
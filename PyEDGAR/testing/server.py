@@ -0,0 +1,643 @@
+"""Local stand-in for the EDGAR endpoints used by PyEDGAR.
+
+Serves company pages, paginated atom listings, ticker searches and the bulk
+ticker mapping over HTTP, from synthetic filers of any size or from recorded
+responses, with configurable latency, error rate and throttling. Point a
+session at it with `configureSession(base_url=server.base_url)`.
+
+Usage:
+    python -m PyEDGAR.testing --port 8080 --filer 0000320193:50000 \\
+        --ticker AAPL:0000320193 --latency 0.05 --error-rate 0.01 --max-rate 10
+"""
+
+from .pages import END_DATE, FILING_TYPES, FILINGS_PER_DAY, NEXT_LINK_RE
+from .pages import companyName, formerName, nextLink, renderEntry
+from .pages import renderListingsPage, syntheticFiling
+
+from bisect import bisect_left
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import datetime
+import html
+import json
+import os
+import random
+import threading
+import time
+
+
+# Number of filings of unknown filers
+DEFAULT_FILINGS = 550
+
+# Template for a company page
+COMPANY_TEMPLATE = '''<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
+<head>
+<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1" />
+<title>EDGAR Search Results</title>
+</head>
+<body style="margin: 0">
+<div id="PageTitle">EDGAR Search Results</div>
+<div id="contentDiv">
+<div id="filerDiv">
+<div class="mailer">Mailing Address
+<span class="mailerAddress">{cik_int} MAIN ST</span>
+<span class="mailerAddress">SUITE 200</span>
+<span class="mailerAddress">
+SPRINGFIELD IL 62701		</span>
+</div>
+<div class="mailer">Business Address
+<span class="mailerAddress">{cik_int} MAIN ST</span>
+<span class="mailerAddress">
+SPRINGFIELD IL 62701		</span>
+<span class="mailerAddress">2175550100</span>
+</div>
+<div class="companyInfo">
+<span class="companyName">{name} <acronym title="Central Index Key">CIK</acronym>#: <a href="/cgi-bin/browse-edgar?action=getcompany&amp;CIK={cik}&amp;owner=exclude&amp;count=40">{cik} (see all company filings)</a></span>
+<p class="identInfo"><acronym title="Standard Industrial Code">SIC</acronym>: <a href="/cgi-bin/browse-edgar?action=getcompany&amp;SIC=3571&amp;owner=exclude&amp;count=40">3571</a> - ELECTRONIC COMPUTERS<br />State location: <a href="/cgi-bin/browse-edgar?action=getcompany&amp;State=IL&amp;owner=exclude&amp;count=40">IL</a> | State of Inc.: <strong>DE</strong> | Fiscal Year End: 1231<br />(Office of Manufacturing)<br />formerly: {former_name} (filings through 2007-01-04)<br />
+</p>
+</div>
+</div>
+</div>
+</body>
+</html>
+'''
+
+# Page returned by ticker searches without a match
+NO_MATCH_PAGE = '''<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
+<head>
+<title>EDGAR Search Results</title>
+</head>
+<body style="margin: 0">
+<div id="PageTitle">EDGAR Search Results</div>
+<center><h1>No matching Ticker Symbol.</h1></center>
+</body>
+</html>
+'''
+
+
+class EdgarStandIn(object):
+    """Generator of EDGAR responses for a stand-in server.
+
+    Synthetic filers have `filers[cik]` filings (or `default_filings`, if not
+    listed), newest first, with several filings per day going back from
+    `END_DATE`; type and date filters are applied as EDGAR does. Pages are
+    generated on request, so filers may have any number of filings.
+
+    If `fixtures_dir` is given, responses are instead built from recordings
+    in the layout of `benchmarks/fixtures` (`filings_page.xml`,
+    `company_tickers.json` and, unless `company_page` is given,
+    `company_page.html`): the recorded company page is served for every
+    CIK, and listings repeat the recorded entries, ignoring type and date
+    filters.
+    """
+
+    def __init__(self, filers: dict=None, tickers: dict=None,
+                 default_filings: int=DEFAULT_FILINGS,
+                 fixtures_dir: str=None, company_page: str=None):
+        """Constructor for the stand-in response generator.
+
+        Keyword Arguments:
+            filers {dict} -- Dictionary mapping each CIK to its number of
+                             filings (default: {None}).
+            tickers {dict} -- Dictionary mapping tickers to CIKs, served by
+                              ticker searches and the bulk ticker mapping
+                              (default: {None}).
+            default_filings {int} -- Number of filings of CIKs not in
+                                     `filers`; unknown CIKs are not found if
+                                     None (default: {DEFAULT_FILINGS}).
+            fixtures_dir {str} -- Directory of recorded responses; responses
+                                  are synthetic if None (default: {None}).
+            company_page {str} -- Path of the recorded company page, if not
+                                  in `fixtures_dir` (default: {None}).
+        """
+
+        self.filers = {cik.zfill(10): n for cik, n in (filers or {}).items()}
+        self.tickers = {t.upper(): cik.zfill(10)
+                        for t, cik in (tickers or {}).items()}
+        self.default_filings = default_filings
+        self.fixtures_dir = fixtures_dir
+        self.__positions = dict()  # (CIK, type) to positions of filings
+        self.__lock = threading.Lock()
+
+        if fixtures_dir is not None:
+            self.__loadFixtures(fixtures_dir=fixtures_dir,
+                                company_page=company_page)
+
+    def respond(self, path: str, params: dict) -> tuple:
+        """Function to generate the response to a GET request.
+
+        Arguments:
+            path {str} -- Path of the request URL.
+            params {dict} -- Query parameters of the request.
+
+        Returns:
+            tuple -- Tuple of the status code, content type and body.
+        """
+
+        if path.endswith('/files/company_tickers.json'):
+            return 200, 'application/json', self.tickersJSON()
+
+        if not path.endswith('/cgi-bin/browse-edgar') or \
+            params.get('action') != 'getcompany':
+            return 404, 'text/plain', b'Not Found'
+
+        cik = params.get('CIK', '')
+
+        # Ticker searches are answered with the matching company page
+        if 'Find' in params or not cik.isdigit():
+            page = self.tickerSearch(ticker=cik)
+            return 200, 'text/html', page.encode('iso-8859-1')
+
+        cik = cik.zfill(10)
+        if self.filings(cik=cik) is None:
+            return 404, 'text/plain', b'Not Found'
+
+        if params.get('output') == 'atom':
+            page = self.listingsPage(cik=cik,
+                                     start=int(params.get('start', 0)),
+                                     count=int(params.get('count', 40)),
+                                     filing_type=params.get('type', ''),
+                                     before=params.get('dateb', ''))
+            return 200, 'application/atom+xml', page.encode('iso-8859-1')
+
+        return 200, 'text/html', self.companyPage(cik=cik).encode(
+            'iso-8859-1')
+
+    def filings(self, cik: str) -> int:
+        """Function to get the number of filings of a filer.
+
+        Arguments:
+            cik {str} -- CIK of the filer.
+
+        Returns:
+            int -- Number of filings, or None if the filer is not known.
+        """
+
+        return self.filers.get(cik, self.default_filings)
+
+    def companyName(self, cik: str) -> str:
+        """Function to get the name of a synthetic filer.
+
+        Arguments:
+            cik {str} -- CIK of the filer.
+
+        Returns:
+            str -- Company name.
+        """
+
+        return companyName(cik=cik)
+
+    def companyPage(self, cik: str) -> str:
+        """Function to generate the company page of a filer.
+
+        Arguments:
+            cik {str} -- CIK of the filer.
+
+        Returns:
+            str -- Page HTML.
+        """
+
+        if self.fixtures_dir is not None:
+            return self.__company_page
+
+        return COMPANY_TEMPLATE.format(
+            cik=cik, cik_int=int(cik),
+            name=html.escape(self.companyName(cik=cik)),
+            former_name=html.escape(formerName(cik=cik)))
+
+    def tickerSearch(self, ticker: str) -> str:
+        """Function to generate the response to a ticker search.
+
+        Arguments:
+            ticker {str} -- Searched ticker.
+
+        Returns:
+            str -- Page HTML; the company page of the matching filer.
+        """
+
+        if self.fixtures_dir is not None:
+            return self.__company_page
+
+        cik = self.tickers.get(ticker.upper())
+
+        if cik is None:
+            return NO_MATCH_PAGE
+
+        return self.companyPage(cik=cik)
+
+    def tickersJSON(self) -> bytes:
+        """Function to generate the bulk ticker mapping.
+
+        Returns:
+            bytes -- Mapping in `company_tickers.json` format.
+        """
+
+        if self.fixtures_dir is not None:
+            return self.__tickers_json
+
+        return json.dumps({str(i): {'cik_str': int(cik), 'ticker': ticker,
+                                    'title': self.companyName(cik=cik)}
+                           for i, (ticker, cik)
+                           in enumerate(self.tickers.items())}).encode()
+
+    def listingsPage(self, cik: str, start: int, count: int,
+                     filing_type: str='', before: str='') -> str:
+        """Function to generate an atom listings page of a filer.
+
+        Arguments:
+            cik {str} -- CIK of the filer.
+            start {int} -- Start index of the page.
+            count {int} -- Count of results per page.
+
+        Keyword Arguments:
+            filing_type {str} -- Filing type prefix to filter by
+                                 (default: {''}).
+            before {str} -- Only list filings on or before this date,
+                            formatted YYYYMMDD (default: {''}).
+
+        Returns:
+            str -- Page XML.
+        """
+
+        positions = self.__filtered(cik=cik, filing_type=filing_type,
+                                    before=before)
+        end = min(start + count, len(positions))
+
+        next_link = ''
+        if end < len(positions):
+            next_link = nextLink(cik=cik, start=end, count=count,
+                                 filing_type=filing_type, before=before)
+
+        if self.fixtures_dir is not None:
+            entries = [self.__entries[positions[i] % len(self.__entries)]
+                       for i in range(start, end)]
+            return ''.join([self.__header, next_link] + entries
+                           + [self.__footer])
+
+        total = self.filings(cik=cik)
+        entries = ''.join(renderEntry(filing=syntheticFiling(
+            cik=cik, n=total - positions[i], total=total))
+            for i in range(start, end))
+
+        return renderListingsPage(cik=cik, entries=entries,
+                                  next_link=next_link)
+
+    def __filtered(self, cik: str, filing_type: str, before: str):
+        """Function to get the positions (newest first) of the filings of a
+        filer matching type and date filters.
+
+        Arguments:
+            cik {str} -- CIK of the filer.
+            filing_type {str} -- Filing type prefix to filter by.
+            before {str} -- Only include filings on or before this date,
+                            formatted YYYYMMDD.
+
+        Returns:
+            Sequence of positions of matching filings.
+        """
+
+        total = self.filings(cik=cik)
+
+        # Recorded entries are not filtered
+        if self.fixtures_dir is not None or (not filing_type
+                                             and not before):
+            return range(total)
+
+        key = (cik, filing_type)
+
+        with self.__lock:
+            positions = self.__positions.get(key)
+
+        if positions is None:
+            positions = [i for i in range(total)
+                         if FILING_TYPES[(total - i) % len(FILING_TYPES)]
+                         .startswith(filing_type)]
+            with self.__lock:
+                self.__positions[key] = positions
+
+        if before:
+            # Filings are dated in decreasing order of position
+            date = datetime.datetime.strptime(before, '%Y%m%d').date()
+            first = max(0, (END_DATE - date).days * FILINGS_PER_DAY)
+            positions = positions[bisect_left(positions, first):]
+
+        return positions
+
+    def __loadFixtures(self, fixtures_dir: str, company_page: str=None):
+        """Function to load recorded responses.
+
+        Arguments:
+            fixtures_dir {str} -- Directory of recorded responses.
+
+        Keyword Arguments:
+            company_page {str} -- Path of the recorded company page; the one
+                                  in `fixtures_dir` is used if None
+                                  (default: {None}).
+        """
+
+        if company_page is None:
+            company_page = os.path.join(fixtures_dir, 'company_page.html')
+
+        with open(os.path.join(fixtures_dir, 'filings_page.xml')) as f:
+            listings = f.read()
+        with open(company_page) as f:
+            self.__company_page = f.read()
+        with open(os.path.join(fixtures_dir, 'company_tickers.json'),
+                  'rb') as f:
+            self.__tickers_json = f.read()
+
+        # Splitting recorded listings page into header and entries
+        start = listings.index('<entry>')
+        end = listings.rindex('</entry>') + len('</entry>')
+        self.__header = NEXT_LINK_RE.sub('', listings[:start])
+        self.__entries = [e + '</entry>\n' for e in
+                          listings[start:end].split('</entry>') if e.strip()]
+        self.__footer = listings[end:].strip() + '\n'
+
+
+class StandInServer(object):
+    """Local HTTP server answering EDGAR requests from an `EdgarStandIn`.
+
+    Each request is delayed by `latency` seconds, plus up to `jitter`
+    seconds at random. If `max_rate` is set, requests beyond `max_rate` in
+    any one second window are refused with `throttle_status` and a
+    Retry-After header, as EDGAR does. A fraction `error_rate` of the
+    remaining requests fail with `error_status`. Random choices are seeded,
+    so that runs are reproducible.
+
+    For failures independent of timing and thread scheduling, every
+    `throttle_every`-th request may be throttled, and every `error_every`-th
+    request may fail, counting all requests from the first.
+    """
+
+    def __init__(self, standin: EdgarStandIn=None, host: str='127.0.0.1',
+                 port: int=0, latency: float=0.0, jitter: float=0.0,
+                 error_rate: float=0.0, error_status: int=500,
+                 max_rate: float=None, throttle_status: int=429,
+                 retry_after: float=1.0, seed: int=0, error_every: int=None,
+                 throttle_every: int=None):
+        """Constructor for the stand-in server. The server is started by
+        `start`, or on entering a `with` block.
+
+        Keyword Arguments:
+            standin {EdgarStandIn} -- Response generator; synthetic filers
+                                      with the default number of filings if
+                                      None (default: {None}).
+            host {str} -- Address to listen on (default: {'127.0.0.1'}).
+            port {int} -- Port to listen on; any free port if 0
+                          (default: {0}).
+            latency {float} -- Delay of each response, in seconds
+                               (default: {0.0}).
+            jitter {float} -- Maximum random additional delay, in seconds
+                              (default: {0.0}).
+            error_rate {float} -- Fraction of requests that fail
+                                  (default: {0.0}).
+            error_status {int} -- Status code of failed requests
+                                  (default: {500}).
+            max_rate {float} -- Maximum requests served per second; not
+                                limited if None (default: {None}).
+            throttle_status {int} -- Status code of throttled requests
+                                     (default: {429}).
+            retry_after {float} -- Retry-After of throttled requests, in
+                                   seconds (default: {1.0}).
+            seed {int} -- Seed of random latency and errors (default: {0}).
+            error_every {int} -- Interval, in requests, of failed requests;
+                                 none if None (default: {None}).
+            throttle_every {int} -- Interval, in requests, of throttled
+                                    requests; none if None (default: {None}).
+        """
+
+        self.standin = standin or EdgarStandIn()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_rate = max_rate
+        self.throttle_status = throttle_status
+        self.retry_after = retry_after
+        self.error_every = error_every
+        self.throttle_every = throttle_every
+        self.__random = random.Random(seed)
+        self.__served = deque()  # Times of requests served in the window
+        self.__counts = Counter()
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+        self.httpd = ThreadingHTTPServer((host, port), self.__handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the server, for `configureSession(base_url=...)`.
+        """
+
+        host, port = self.httpd.server_address[:2]
+
+        return 'http://{0}:{1}'.format(host, port)
+
+    def start(self) -> 'StandInServer':
+        """Function to start serving requests in a background thread.
+
+        Returns:
+            StandInServer -- The server.
+        """
+
+        self.__thread = threading.Thread(target=self.httpd.serve_forever,
+                                         daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def stop(self):
+        """Function to stop serving requests, and close the server.
+        """
+
+        if self.__thread is not None:
+            self.httpd.shutdown()
+            self.__thread.join()
+            self.__thread = None
+
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        """Function to get the request counts.
+
+        Returns:
+            dict -- Dictionary with the total number of requests, and the
+                    number of responses per status code (as 'status.NNN').
+        """
+
+        with self.__lock:
+            return dict(self.__counts)
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __decide(self) -> tuple:
+        """Function to decide the delay and outcome of a request.
+
+        Returns:
+            tuple -- Tuple of the delay in seconds, and the status code of
+                     an injected failure (or None to serve the request).
+        """
+
+        with self.__lock:
+            self.__counts['requests'] += 1
+            n = self.__counts['requests']
+            delay = self.latency + self.__random.uniform(0, self.jitter)
+
+            if self.throttle_every and n % self.throttle_every == 0:
+                return delay, self.throttle_status
+            if self.error_every and n % self.error_every == 0:
+                return delay, self.error_status
+
+            if self.max_rate is not None:
+                now = time.monotonic()
+                # Dropping requests that left the one second window
+                while self.__served and self.__served[0] <= now - 1.0:
+                    self.__served.popleft()
+                if len(self.__served) >= self.max_rate:
+                    return delay, self.throttle_status
+                self.__served.append(now)
+
+            if self.__random.random() < self.error_rate:
+                return delay, self.error_status
+
+            return delay, None
+
+    def __count(self, status: int):
+        with self.__lock:
+            self.__counts['status.{0}'.format(status)] += 1
+
+    def __handler(self) -> type:
+        """Function to build the request handler class of the server.
+
+        Returns:
+            type -- Request handler class.
+        """
+
+        server = self
+        decide, count = self.__decide, self.__count
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; without this, small
+            # responses wait for the client's delayed acknowledgement
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                delay, failure = decide()
+                time.sleep(delay)
+
+                headers = dict()
+                if failure is not None:
+                    status, content_type = failure, 'text/plain'
+                    body = 'Injected status {0}'.format(failure).encode()
+                    if failure == server.throttle_status:
+                        headers['Retry-After'] = str(server.retry_after)
+                else:
+                    url = urlsplit(self.path)
+                    params = {k: v[0] for k, v in
+                              parse_qs(url.query,
+                                       keep_blank_values=True).items()}
+                    status, content_type, body = server.standin.respond(
+                        path=url.path, params=params)
+
+                count(status)
+
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main(argv: list=None):
+    """Function to run a stand-in server until interrupted.
+
+    Keyword Arguments:
+        argv {list} -- Command-line arguments; `sys.argv` if None
+                       (default: {None}).
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m PyEDGAR.testing',
+        description='Serve a local stand-in for EDGAR.')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='address to listen on')
+    parser.add_argument('--port', type=int, default=8080,
+                        help='port to listen on')
+    parser.add_argument('--filer', action='append', default=[],
+                        metavar='CIK:FILINGS',
+                        help='synthetic filer and its number of filings; '
+                             'may be repeated')
+    parser.add_argument('--ticker', action='append', default=[],
+                        metavar='TICKER:CIK',
+                        help='ticker of a filer; may be repeated')
+    parser.add_argument('--default-filings', type=int,
+                        default=DEFAULT_FILINGS,
+                        help='number of filings of other CIKs; 0 to answer '
+                             'them with 404')
+    parser.add_argument('--fixtures',
+                        help='directory of recorded responses to serve '
+                             'instead of synthetic ones')
+    parser.add_argument('--company-page',
+                        help='recorded company page to serve, if not in '
+                             'the fixtures directory')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='delay of each response, in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='maximum random additional delay, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests answered with 500')
+    parser.add_argument('--error-every', type=int,
+                        help='answer every N-th request with 500')
+    parser.add_argument('--max-rate', type=float,
+                        help='maximum requests per second before throttling')
+    parser.add_argument('--throttle-every', type=int,
+                        help='throttle every N-th request')
+    parser.add_argument('--throttle-status', type=int, default=429,
+                        help='status code of throttled requests')
+    parser.add_argument('--retry-after', type=float, default=1.0,
+                        help='Retry-After of throttled requests, in seconds')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of random latency and errors')
+    args = parser.parse_args(argv)
+
+    standin = EdgarStandIn(
+        filers={cik: int(n) for cik, n in
+                (f.split(':') for f in args.filer)},
+        tickers=dict(t.split(':') for t in args.ticker),
+        default_filings=args.default_filings or None,
+        fixtures_dir=args.fixtures, company_page=args.company_page)
+
+    server = StandInServer(standin=standin, host=args.host, port=args.port,
+                           latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, max_rate=args.max_rate,
+                           throttle_status=args.throttle_status,
+                           retry_after=args.retry_after, seed=args.seed,
+                           error_every=args.error_every,
+                           throttle_every=args.throttle_every)
+
+    print('Serving EDGAR stand-in at {0}'.format(server.base_url))
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
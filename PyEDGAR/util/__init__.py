@@ -1 +1,18 @@
 from .cik_tools import getCIK
+from .cik_tools import getCIKs
+from .cache import ResponseCache
+from .retry import CircuitBreaker
+from .retry import RetryPolicy
+from .session import configureSession
+from .session import getSession
+from .session import setSession
+from .ticker_index import getTickers
+from .ticker_index import loadTickerIndex
+from .ticker_index import refreshTickerIndex
+from .ticker_index import TickerIndex
+from .ticker_index import setTickerIndex
+from .memo import configureMemo
+from .memo import getMemo
+from .memo import setMemo
+from .instrumentation import addHook
+from .instrumentation import removeHook
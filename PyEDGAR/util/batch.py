@@ -0,0 +1,54 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator
+import logging
+
+
+def __runBatch(func: Callable, keys: Iterable, max_workers: int=4) \
+    -> Iterator[tuple]:
+    """Function to apply a function to many keys on a bounded thread pool,
+    yielding results as they complete. Exceptions raised for a key are
+    yielded in place of its result, so that one failure does not abort the
+    batch.
+
+    At most `2 * max_workers` keys are submitted at any time, so that large
+    batches are not queued up in memory all at once.
+
+    Arguments:
+        func {Callable} -- Function applied to each key.
+        keys {Iterable} -- Keys to process.
+
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of worker threads (default: {4}).
+
+    Returns:
+        Iterator[tuple] -- Iterator of `(key, result_or_exception)` tuples, in
+                           order of completion.
+    """
+
+    keys = iter(keys)
+    max_pending = 2 * max_workers
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Futures in flight, mapped to their keys
+        pending = dict()
+
+        while True:
+            # Topping up the queue of submitted keys
+            for key in keys:
+                pending[executor.submit(func, key)] = key
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    yield key, future.result()
+                except Exception as e:
+                    logging.warning('Batch item {0} failed: {1!r}'
+                                    .format(key, e))
+                    yield key, e
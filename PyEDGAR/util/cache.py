@@ -0,0 +1,271 @@
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from urllib.parse import urlencode
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+# Default time-to-live (in seconds) of cached responses for each endpoint
+DEFAULT_TTLS = {
+    'cik': 30 * 24 * 3600,  # Ticker to CIK mappings rarely change
+    'info': 24 * 3600,  # Company information pages
+    'filings': 3600,  # Filing listings pages
+    'tickers': 24 * 3600,  # Bulk ticker to CIK mapping
+    'manifest': 365 * 24 * 3600  # Filing index pages do not change
+}
+
+# Default time-to-live for responses from endpoints not listed above
+DEFAULT_TTL = 24 * 3600
+
+# Default maximum total size of cached (compressed) bodies, in bytes
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# Number of access times buffered in memory before they are written
+ACCESS_BUFFER_SIZE = 1024
+
+
+class ResponseCache(object):
+    """Persistent, thread-safe cache of EDGAR responses backed by SQLite.
+
+    Response bodies are stored zlib-compressed and keyed by the normalized
+    request (URL with sorted query parameters). Each entry expires after the
+    time-to-live of its endpoint; expired entries are revalidated with the
+    server using their ETag and Last-Modified headers. When the total size of
+    stored bodies exceeds `max_size`, the least recently used entries are
+    evicted.
+
+    Cache hits do not write to the database: their access times are buffered
+    in memory, and written in one batch when entries are stored, when
+    `ACCESS_BUFFER_SIZE` are buffered, or when the cache is closed.
+    """
+
+    def __init__(self, path: str, ttls: dict=None,
+                 default_ttl: float=DEFAULT_TTL,
+                 max_size: int=DEFAULT_MAX_SIZE, compress_level: int=6):
+        """Constructor for the response cache.
+
+        Arguments:
+            path {str} -- Path to the SQLite database file; created if it
+                          does not exist.
+
+        Keyword Arguments:
+            ttls {dict} -- Time-to-live in seconds for each endpoint,
+                           overriding `DEFAULT_TTLS` (default: {None}).
+            default_ttl {float} -- Time-to-live in seconds for endpoints not
+                                   in `ttls` (default: {DEFAULT_TTL}).
+            max_size {int} -- Maximum total size of stored bodies in bytes
+                              (default: {DEFAULT_MAX_SIZE}).
+            compress_level {int} -- zlib compression level (default: {6}).
+        """
+
+        self.path = os.path.expanduser(path)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or dict()))
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.compress_level = compress_level
+
+        # Creating parent directory if required
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.__lock = threading.Lock()
+        self.__accessed = dict()  # Key to buffered access time
+        self.__conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.__conn.execute('PRAGMA journal_mode=WAL')
+        self.__conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT,
+                url TEXT,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB,
+                size INTEGER,
+                stored REAL,
+                accessed REAL
+            )''')
+        self.__conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed '
+                            'ON responses (accessed)')
+        self.__conn.commit()
+
+        # Running total size of stored bodies
+        self.__total = self.__conn.execute('SELECT COALESCE(SUM(size), 0) '
+                                           'FROM responses').fetchone()[0]
+
+    @staticmethod
+    def key(url: str, params: dict=None) -> str:
+        """Function to build the normalized cache key for a request.
+
+        Arguments:
+            url {str} -- Request URL.
+
+        Keyword Arguments:
+            params {dict} -- Query parameters (default: {None}).
+
+        Returns:
+            str -- Cache key.
+        """
+
+        query = urlencode(sorted((params or dict()).items()))
+
+        return url.rstrip('/') + '?' + query
+
+    def lookup(self, key: str) -> tuple:
+        """Function to look up a cached response.
+
+        Arguments:
+            key {str} -- Cache key.
+
+        Returns:
+            tuple -- Tuple of the cached `Response` and a flag that is True if
+                     the entry is still fresh, or `(None, False)` if the key
+                     is not cached.
+        """
+
+        with self.__lock:
+            row = self.__conn.execute(
+                'SELECT endpoint, url, encoding, etag, last_modified, body, '
+                'stored FROM responses WHERE key = ?', (key,)).fetchone()
+
+            if row is None:
+                return None, False
+
+            self.__accessed[key] = time.time()
+            if len(self.__accessed) >= ACCESS_BUFFER_SIZE:
+                self.__flushAccessed()
+                self.__conn.commit()
+
+        endpoint, url, encoding, etag, last_modified, body, stored = row
+        fresh = (time.time() - stored) < self.ttls.get(endpoint,
+                                                       self.default_ttl)
+
+        # Rebuilding response from cached entry
+        r = Response()
+        r.status_code = 200
+        r.url = url
+        r.encoding = encoding
+        r._content = zlib.decompress(body)
+        r.headers = CaseInsensitiveDict()
+        if etag: r.headers['ETag'] = etag
+        if last_modified: r.headers['Last-Modified'] = last_modified
+        r.from_cache = True
+
+        return r, fresh
+
+    def store(self, key: str, endpoint: str, response: Response):
+        """Function to store a successful response in the cache.
+
+        Arguments:
+            key {str} -- Cache key.
+            endpoint {str} -- Endpoint name, used to select the TTL.
+            response {Response} -- Response to be stored.
+        """
+
+        body = zlib.compress(response.content, self.compress_level)
+        now = time.time()
+
+        with self.__lock:
+            self.__accessed.pop(key, None)
+            self.__flushAccessed()
+
+            # Size of the entry being replaced, if any
+            old = self.__conn.execute('SELECT size FROM responses '
+                                      'WHERE key = ?', (key,)).fetchone()
+            self.__total += len(body) - (old[0] if old else 0)
+
+            self.__conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, endpoint, response.url, response.encoding,
+                 response.headers.get('ETag'),
+                 response.headers.get('Last-Modified'), body, len(body), now,
+                 now))
+            self.__conn.commit()
+            self.__evict()
+
+    def refresh(self, key: str):
+        """Function to mark a cached entry as fresh, after the server confirms
+        that it has not been modified.
+
+        Arguments:
+            key {str} -- Cache key.
+        """
+
+        now = time.time()
+
+        with self.__lock:
+            self.__accessed.pop(key, None)
+            self.__conn.execute('UPDATE responses SET stored = ?, '
+                                'accessed = ? WHERE key = ?', (now, now, key))
+            self.__conn.commit()
+
+    def clear(self):
+        """Function to remove all entries from the cache.
+        """
+
+        with self.__lock:
+            self.__accessed.clear()
+            self.__conn.execute('DELETE FROM responses')
+            self.__conn.commit()
+            self.__total = 0
+
+    def size(self) -> int:
+        """Function to get the total size of stored bodies.
+
+        Returns:
+            int -- Total size of stored (compressed) bodies, in bytes.
+        """
+
+        return self.__total
+
+    def close(self):
+        """Function to write buffered access times, and close the underlying
+        database connection.
+        """
+
+        with self.__lock:
+            self.__flushAccessed()
+            self.__conn.commit()
+            self.__conn.close()
+
+    def __evict(self):
+        """Function to evict least recently used entries until the total size
+        of stored bodies is within `max_size`. Must be called with the lock
+        held.
+        """
+
+        if self.__total <= self.max_size:
+            return
+
+        evicted = 0
+        rows = self.__conn.execute('SELECT key, size FROM responses '
+                                   'ORDER BY accessed')
+
+        for key, size in rows.fetchall():
+            if self.__total <= self.max_size:
+                break
+            self.__conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self.__total -= size
+            evicted += 1
+
+        self.__conn.commit()
+        logging.info('Evicted {0} entries from response cache'.format(evicted))
+
+    def __flushAccessed(self):
+        """Function to write the buffered access times, without committing.
+        Must be called with the lock held.
+        """
+
+        if not self.__accessed:
+            return
+
+        self.__conn.executemany('UPDATE responses SET accessed = ? '
+                                'WHERE key = ?',
+                                [(t, k) for k, t in self.__accessed.items()])
+        self.__accessed.clear()
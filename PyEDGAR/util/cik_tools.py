@@ -1,15 +1,39 @@
-from requests import exceptions, get
+from .batch import __runBatch
+from .memo import memoized
+from .session import getSession
+from .ticker_index import getTickerIndex
+
+from requests import exceptions
+from typing import Iterable, Iterator
 import logging
 import re
 
 
-def getCIK(ticker: str) -> str:
-    """Function to get the Central Index Key (CIK) for a given ticker by
-    querying the SEC EDGAR API.
+# URL of the EDGAR company browsing endpoint, used for ticker lookups
+CIK_URL = 'https://www.sec.gov/cgi-bin/browse-edgar'
+
+# RegEx for extracting CIK from response
+# Note: Solution adapted from:
+#           1. https://gist.github.com/ddd1600/3934032
+#           2. https://gist.github.com/dougvk/8499335
+CIK_RE = re.compile(r'.*CIK=(\d{10}).*')
+
+
+@memoized
+def getCIK(ticker: str, use_index: bool=True) -> str:
+    """Function to get the Central Index Key (CIK) for a given ticker.
+
+    If the shared ticker index is loaded (see `loadTickerIndex`), the ticker
+    is looked up locally; otherwise, or if the ticker is not in the index,
+    the SEC EDGAR API is queried.
     
     Arguments:
         ticker {str} -- Ticker to be matched.
     
+    Keyword Arguments:
+        use_index {bool} -- Flag to look up the ticker in the shared ticker
+                            index first (default: {True}).
+    
     Raises:
         exceptions.RequestException -- Thrown if the request fails.
         LookupError -- Thrown if a CIK match is not found, or if there is more
@@ -19,44 +43,103 @@ def getCIK(ticker: str) -> str:
         str -- Corresponding CIK of the ticker.
     """
 
-    # Base URL for request
-    base_url = 'http://www.sec.gov/cgi-bin/browse-edgar'
+    # Looking up ticker in local index
+    index = getTickerIndex() if use_index else None
+    if index is not None and ticker in index:
+        return index.getCIK(ticker=ticker)
+
+    # Making request
+    r = getSession().get(url=CIK_URL, params=__cikParams(ticker=ticker),
+                         endpoint='cik')
+
+    # Handling failed request
+    if not r.ok:
+        logging.warning('Request failed: CIK lookup for ticker {0} with '
+                        'error {1}'.format(ticker, r.status_code))
+        raise exceptions.RequestException('Request failed')
+
+    return __matchCIK(ticker=ticker, page_text=r.text)
+
+
+def getCIKs(tickers: Iterable, max_workers: int=4) -> Iterator[tuple]:
+    """Function to get the Central Index Keys (CIKs) for many tickers
+    concurrently. All requests share the global EDGAR rate limit.
+    
+    Arguments:
+        tickers {Iterable} -- Tickers to be matched.
+    
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of tickers looked up concurrently
+                             (default: {4}).
+    
+    Returns:
+        Iterator[tuple] -- Iterator of `(ticker, cik)` tuples, in order of
+                           completion. If a ticker could not be matched, the
+                           exception is given in place of the CIK.
+    """
+
+    index = getTickerIndex()
+
+    # Tickers not in the local index
+    misses = list()
+
+    for ticker in tickers:
+        if index is not None and ticker in index:
+            yield ticker, index.getCIK(ticker=ticker)
+        else:
+            misses += [ticker]
+
+    # Querying the SEC EDGAR API for the remaining tickers
+    yield from __runBatch(func=getCIK, keys=misses, max_workers=max_workers)
+
+
+def __cikParams(ticker: str) -> dict:
+    """Function to build the query parameters of a ticker lookup request.
+    
+    Arguments:
+        ticker {str} -- Ticker to be matched.
+    
+    Returns:
+        dict -- Query parameters of the request.
+    """
 
-    # Building parameters for request with ticker
     # Note: Order of parameters here is important
-    params = {
+    return {
         'CIK': ticker,
         'Find': 'Search',
         'owner': 'exclude',
         'action': 'getcompany'
     }
 
-    # Making request
-    r = get(url=base_url, params=params)
-
-    # Handling failed request
-    if not r.ok:
-        logging.warn('Request failed: CIK lookup for ticker {0} with error {1}'
-            .format(ticker, r.status_code))
-        raise exceptions.RequestException('Request failed')
 
-    # RegEx for extracting ticker from response
-    # Note: Solution adapted from:
-    #           1. https://gist.github.com/ddd1600/3934032
-    #           2. https://gist.github.com/dougvk/8499335
-    ticker_regex = re.compile(r'.*CIK=(\d{10}).*')
+def __matchCIK(ticker: str, page_text: str) -> str:
+    """Function to extract the unique CIK from the response to a ticker
+    lookup request.
+    
+    Arguments:
+        ticker {str} -- Ticker to be matched.
+        page_text {str} -- Text of the response.
+    
+    Raises:
+        LookupError -- Thrown if a CIK match is not found, or if there is more
+                       than one CIK corresponding to the candidate ticker.
+    
+    Returns:
+        str -- Corresponding CIK of the ticker.
+    """
 
     # Matching RegEx
-    matches = ticker_regex.findall(string=r.text)
+    matches = CIK_RE.findall(string=page_text)
 
     # Checking if the CIK exists, and is unique
     matches_set_len = len(set(matches))
 
     if matches_set_len > 1:
-        logging.warn('Unique CIK match not found for ticker {0}'.format(ticker))
+        logging.warning('Unique CIK match not found for ticker {0}'
+                        .format(ticker))
         raise LookupError('Unique CIK match not found')
     elif matches_set_len == 0:
-        logging.warn('No CIK match found for ticker {0}'.format(ticker))
+        logging.warning('No CIK match found for ticker {0}'.format(ticker))
         raise LookupError('CIK match not found')
 
     # No errors, return CIK
@@ -0,0 +1,298 @@
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from typing import Callable
+import logging
+import threading
+import time
+
+
+# Event reported for each HTTP request made to EDGAR
+RequestEvent = namedtuple('RequestEvent', [
+    'endpoint',  # Endpoint name (e.g. 'filings'), or None
+    'url',  # Request URL, including query parameters
+    'status',  # HTTP status code
+    'bytes',  # Size of the response body
+    'latency',  # Time from sending the request to receiving the response
+    'retries',  # Number of previous attempts of this request
+    'wait',  # Time spent waiting for the rate limiter
+    'from_cache'  # Flag for responses served from the response cache
+])
+
+# Event reported for each parsing stage
+ParseEvent = namedtuple('ParseEvent', [
+    'stage',  # Parser name (e.g. 'filings')
+    'pages',  # Number of pages parsed
+    'entries',  # Number of records produced
+    'cpu_time',  # CPU time spent parsing, in the calling thread
+    'wall_time'  # Elapsed time spent parsing
+])
+
+# Registered hooks; replaced on change, so that emitting needs no lock
+_hooks = ()
+_hooks_lock = threading.Lock()
+
+
+def addHook(hook: Callable):
+    """Function to register an instrumentation hook. Hooks are called with
+    each `RequestEvent` and `ParseEvent`, from the thread that produced it.
+
+    Arguments:
+        hook {Callable} -- Function taking a single event.
+    """
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def removeHook(hook: Callable):
+    """Function to unregister an instrumentation hook.
+
+    Arguments:
+        hook {Callable} -- Previously registered hook.
+    """
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def enabled() -> bool:
+    """Function to check if any instrumentation hooks are registered. Callers
+    should skip measuring events entirely if not.
+
+    Returns:
+        bool -- True if any hooks are registered, False otherwise.
+    """
+
+    return bool(_hooks)
+
+
+def emit(event: tuple):
+    """Function to report an event to all registered hooks. Exceptions raised
+    by hooks are logged, and do not interrupt the instrumented call.
+
+    Arguments:
+        event {tuple} -- `RequestEvent` or `ParseEvent`.
+    """
+
+    for hook in _hooks:
+        try:
+            hook(event)
+        except Exception as e:
+            logging.warning('Instrumentation hook {0!r} failed: {1!r}'
+                            .format(hook, e))
+
+
+class ParseCounter(object):
+    """Counts of the pages parsed and entries produced by a parse, and of the
+    CPU time spent in it, as given by `measureParse`.
+    """
+
+    def __init__(self, measure: bool, pages: int=1):
+        """Constructor for the parse counter.
+
+        Arguments:
+            measure {bool} -- Flag to measure CPU time.
+
+        Keyword Arguments:
+            pages {int} -- Number of pages parsed (default: {1}).
+        """
+
+        self.measure = measure
+        self.pages = pages
+        self.entries = 0
+        self.cpu_time = 0.0
+        self.__cpu_start = None
+
+    def resume(self):
+        """Function to start measuring CPU time, e.g. when a parsing
+        generator resumes.
+        """
+
+        if self.measure:
+            self.__cpu_start = time.thread_time()
+
+    def suspend(self):
+        """Function to stop measuring CPU time, e.g. while a parsing
+        generator yields to its consumer.
+        """
+
+        if self.measure and self.__cpu_start is not None:
+            self.cpu_time += time.thread_time() - self.__cpu_start
+            self.__cpu_start = None
+
+
+@contextmanager
+def measureParse(stage: str, pages: int=1):
+    """Context manager measuring a parsing stage, and reporting it as a
+    `ParseEvent` on exit if instrumentation is enabled on entry. Parses that
+    raise are not reported. Set the `entries` of the given counter to the
+    number of records produced.
+
+    Arguments:
+        stage {str} -- Parser name (e.g. 'filings').
+
+    Keyword Arguments:
+        pages {int} -- Number of pages parsed (default: {1}).
+
+    Yields:
+        ParseCounter -- Counter of the parse.
+    """
+
+    # Read once, as hooks may be added during the parse
+    counter = ParseCounter(measure=enabled(), pages=pages)
+    wall_start = time.perf_counter()
+
+    counter.resume()
+    yield counter
+    counter.suspend()
+
+    if counter.measure:
+        emit(ParseEvent(stage=stage, pages=counter.pages,
+                        entries=counter.entries, cpu_time=counter.cpu_time,
+                        wall_time=time.perf_counter() - wall_start))
+
+
+class Counters(object):
+    """Thread-safe instrumentation hook that counts events.
+
+    Counts are kept for requests (in total, per endpoint and per status code),
+    response bytes, retries, rate limiter waits, cache hits, and pages,
+    entries and CPU time per parsing stage.
+    """
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.__lock = threading.Lock()
+
+    def __call__(self, event: tuple):
+        with self.__lock:
+            if isinstance(event, RequestEvent):
+                self.counts['requests'] += 1
+                self.counts['requests.{0}'.format(event.endpoint)] += 1
+                self.counts['status.{0}'.format(event.status)] += 1
+                self.counts['bytes'] += event.bytes
+                self.counts['retries'] += int(event.retries > 0)
+                self.counts['wait'] += event.wait
+                self.counts['cache_hits'] += int(event.from_cache)
+            elif isinstance(event, ParseEvent):
+                self.counts['parse.{0}.pages'.format(event.stage)] += \
+                    event.pages
+                self.counts['parse.{0}.entries'.format(event.stage)] += \
+                    event.entries
+                self.counts['parse.{0}.cpu_time'.format(event.stage)] += \
+                    event.cpu_time
+
+    def snapshot(self) -> dict:
+        """Function to get a copy of the current counts.
+
+        Returns:
+            dict -- Dictionary of counter name to count.
+        """
+
+        with self.__lock:
+            return dict(self.counts)
+
+    def reset(self):
+        """Function to reset all counts.
+        """
+
+        with self.__lock:
+            self.counts.clear()
+
+
+# Default histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram(object):
+    """Thread-safe instrumentation hook that records the distribution of one
+    field of one event type, e.g. the latency of requests, in fixed buckets.
+    """
+
+    def __init__(self, field: str='latency', event_type: type=RequestEvent,
+                 buckets: tuple=DEFAULT_BUCKETS, endpoint: str=None):
+        """Constructor for the histogram.
+
+        Keyword Arguments:
+            field {str} -- Event field to record (default: {'latency'}).
+            event_type {type} -- Type of event to record
+                                 (default: {RequestEvent}).
+            buckets {tuple} -- Increasing bucket upper bounds; values above
+                               the last bound are counted in an overflow
+                               bucket (default: {DEFAULT_BUCKETS}).
+            endpoint {str} -- Only record request events for this endpoint;
+                              all if None (default: {None}).
+        """
+
+        self.field = field
+        self.event_type = event_type
+        self.buckets = tuple(buckets)
+        self.endpoint = endpoint
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.__lock = threading.Lock()
+
+    def __call__(self, event: tuple):
+        if not isinstance(event, self.event_type):
+            return
+        if self.endpoint is not None and event.endpoint != self.endpoint:
+            return
+
+        value = getattr(event, self.field)
+
+        with self.__lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """Function to estimate a percentile of the recorded values, as the
+        upper bound of the bucket containing it.
+
+        Arguments:
+            q {float} -- Percentile, between 0 and 100.
+
+        Returns:
+            float -- Estimated percentile, or None if nothing was recorded.
+        """
+
+        with self.__lock:
+            if self.count == 0:
+                return None
+
+            rank = q / 100 * self.count
+            cumulative = 0
+            for i, count in enumerate(self.counts):
+                cumulative += count
+                if cumulative >= rank and count:
+                    return self.buckets[i] if i < len(self.buckets) \
+                        else self.max
+
+            return self.max
+
+    def summary(self) -> dict:
+        """Function to summarize the recorded values.
+
+        Returns:
+            dict -- Dictionary with the count, mean, min, max, and estimated
+                    50th, 90th and 99th percentiles.
+        """
+
+        return {'count': self.count,
+                'mean': self.total / self.count if self.count else None,
+                'min': self.min,
+                'max': self.max,
+                'p50': self.percentile(50),
+                'p90': self.percentile(90),
+                'p99': self.percentile(99)}
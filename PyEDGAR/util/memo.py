@@ -0,0 +1,361 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable
+import asyncio
+import copy
+import functools
+import inspect
+import threading
+import time
+
+
+# Default maximum number of memoized results
+DEFAULT_MAX_SIZE = 1024
+
+# Default time-to-live of memoized results, in seconds
+DEFAULT_TTL = 300.0
+
+# Result passed to waiting callers when the computing caller is cancelled
+RELEASED = object()
+
+# Immutable types of values shared between copies of memoized results
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class MemoCache(object):
+    """Thread-safe in-memory LRU cache of function results, with a
+    time-to-live and single-flight request coalescing.
+
+    Concurrent calls for the same key, from threads or coroutines, share a
+    single in-flight call: the first caller computes the result and the
+    others wait for it. Exceptions are propagated to all waiting callers, and
+    are not cached; if the first caller is cancelled, a waiting caller
+    computes the result in its place. Results are shared between callers,
+    and must not be modified.
+    """
+
+    def __init__(self, max_size: int=DEFAULT_MAX_SIZE,
+                 ttl: float=DEFAULT_TTL):
+        """Constructor for the memoization cache.
+
+        Keyword Arguments:
+            max_size {int} -- Maximum number of results kept; least recently
+                              used results are evicted first
+                              (default: {DEFAULT_MAX_SIZE}).
+            ttl {float} -- Time-to-live of results, in seconds
+                           (default: {DEFAULT_TTL}).
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__entries = OrderedDict()  # Key to (expiry time, result)
+        self.__in_flight = dict()  # Key to future of the result
+        self.__stats = dict(hits=0, misses=0, coalesced=0, evictions=0)
+        self.__lock = threading.Lock()
+
+    def call(self, key, func: Callable, *args, **kwargs):
+        """Function to get the memoized result for a key, calling a function
+        to compute it if required. Blocks while another caller computes it.
+
+        Arguments:
+            key -- Hashable key of the result.
+            func {Callable} -- Function computing the result.
+            *args -- Positional arguments of `func`.
+            **kwargs -- Keyword arguments of `func`.
+
+        Returns:
+            Result of `func`.
+        """
+
+        while True:
+            found, value, future = self.__claim(key=key)
+
+            if found:
+                return value
+            if future is None:
+                break
+
+            value = future.result()
+
+            # Claim released by a cancelled caller; claiming it again
+            if value is not RELEASED:
+                return value
+
+        try:
+            result = func(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.__release(key=key)
+            raise
+        except BaseException as e:
+            self.__fail(key=key, error=e)
+            raise
+
+        return self.__complete(key=key, result=result)
+
+    async def callAsync(self, key, func: Callable, *args, **kwargs):
+        """Function to get the memoized result for a key, awaiting a
+        coroutine function to compute it if required. Waiting for another
+        caller does not block the event loop.
+
+        Arguments:
+            key -- Hashable key of the result.
+            func {Callable} -- Coroutine function computing the result.
+            *args -- Positional arguments of `func`.
+            **kwargs -- Keyword arguments of `func`.
+
+        Returns:
+            Result of `func`.
+        """
+
+        while True:
+            found, value, future = self.__claim(key=key)
+
+            if found:
+                return value
+            if future is None:
+                break
+
+            value = await asyncio.wrap_future(future)
+
+            # Claim released by a cancelled caller; claiming it again
+            if value is not RELEASED:
+                return value
+
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.__release(key=key)
+            raise
+        except BaseException as e:
+            self.__fail(key=key, error=e)
+            raise
+
+        return self.__complete(key=key, result=result)
+
+    def stats(self) -> dict:
+        """Function to get the cache statistics.
+
+        Returns:
+            dict -- Dictionary of hits, misses, coalesced calls (that waited
+                    for an in-flight call), evictions and current size.
+        """
+
+        with self.__lock:
+            return dict(self.__stats, size=len(self.__entries))
+
+    def clear(self):
+        """Function to remove all results from the cache. In-flight calls
+        are not affected.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def __claim(self, key) -> tuple:
+        """Function to look up a key, registering the caller as the one
+        computing the result if it is neither cached nor in flight.
+
+        Arguments:
+            key -- Hashable key of the result.
+
+        Returns:
+            tuple -- Tuple of a flag for cached results, the cached result,
+                     and the future of an in-flight call (None if the caller
+                     must compute the result).
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.__stats['hits'] += 1
+                    return True, entry[1], None
+                # Expired
+                del self.__entries[key]
+
+            future = self.__in_flight.get(key)
+
+            if future is not None:
+                self.__stats['coalesced'] += 1
+                return False, None, future
+
+            # Running futures cannot be cancelled by waiting callers
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self.__in_flight[key] = future
+            self.__stats['misses'] += 1
+
+            return False, None, None
+
+    def __complete(self, key, result):
+        """Function to store the result of a claimed call, and pass it to
+        all waiting callers.
+
+        Arguments:
+            key -- Hashable key of the result.
+            result -- Result of the call.
+
+        Returns:
+            The result.
+        """
+
+        with self.__lock:
+            future = self.__in_flight.pop(key)
+            self.__entries[key] = (time.monotonic() + self.ttl, result)
+            self.__entries.move_to_end(key)
+
+            # Evicting least recently used results
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.__stats['evictions'] += 1
+
+        future.set_result(result)
+
+        return result
+
+    def __fail(self, key, error: BaseException):
+        """Function to pass the exception raised by a claimed call to all
+        waiting callers, without caching it.
+
+        Arguments:
+            key -- Hashable key of the result.
+            error {BaseException} -- Exception raised by the call.
+        """
+
+        with self.__lock:
+            future = self.__in_flight.pop(key)
+
+        future.set_exception(error)
+
+    def __release(self, key):
+        """Function to release the claim of a cancelled call, so that a
+        waiting caller computes the result instead.
+
+        Arguments:
+            key -- Hashable key of the result.
+        """
+
+        with self.__lock:
+            future = self.__in_flight.pop(key)
+
+        future.set_result(RELEASED)
+
+
+# Shared cache used by memoized functions; memoization is disabled if None
+_memo = None
+_memo_lock = threading.Lock()
+
+
+def getMemo() -> MemoCache:
+    """Function to get the shared memoization cache.
+
+    Returns:
+        MemoCache -- Shared memoization cache, or None if memoization is
+                     disabled.
+    """
+
+    return _memo
+
+
+def setMemo(memo: MemoCache):
+    """Function to replace the shared memoization cache used by memoized
+    functions. Passing `None` disables memoization (the default).
+
+    Arguments:
+        memo {MemoCache} -- New shared memoization cache.
+    """
+
+    global _memo
+
+    with _memo_lock:
+        _memo = memo
+
+
+def configureMemo(**kwargs) -> MemoCache:
+    """Function to enable memoization of PyEDGAR's public functions with a
+    new shared cache. See `MemoCache` for the accepted keyword arguments.
+
+    Returns:
+        MemoCache -- Newly configured shared memoization cache.
+    """
+
+    memo = MemoCache(**kwargs)
+    setMemo(memo=memo)
+
+    return memo
+
+
+def copyResult(result):
+    """Function to copy a memoized result for a caller. Lists, tuples and
+    dictionaries are copied recursively, and the immutable values they hold
+    (e.g. strings) are shared; other objects are deep-copied.
+
+    Arguments:
+        result -- Memoized result.
+
+    Returns:
+        Copy of the result.
+    """
+
+    if isinstance(result, IMMUTABLE_TYPES):
+        return result
+    if type(result) is dict:
+        return {k: v if isinstance(v, IMMUTABLE_TYPES) else copyResult(v)
+                for k, v in result.items()}
+    if type(result) is list:
+        return [v if isinstance(v, IMMUTABLE_TYPES) else copyResult(v)
+                for v in result]
+    if type(result) is tuple:
+        return tuple(copyResult(v) for v in result)
+
+    return copy.deepcopy(result)
+
+
+def memoized(func: Callable) -> Callable:
+    """Decorator memoizing a function (or coroutine function) in the shared
+    memoization cache, if enabled. Results are keyed by the function and its
+    bound arguments, including defaults; calls with unhashable arguments are
+    not memoized. Each caller gets its own copy of the memoized result, so
+    that modifying it does not affect other callers; see `copyResult`.
+
+    Arguments:
+        func {Callable} -- Function to be memoized.
+
+    Returns:
+        Callable -- Memoized function.
+    """
+
+    signature = inspect.signature(func)
+    name = '{0}.{1}'.format(func.__module__, func.__qualname__)
+
+    def key(args: tuple, kwargs: dict) -> tuple:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (name,) + tuple(bound.arguments.items())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            memo = _memo
+            k = key(args=args, kwargs=kwargs) if memo is not None else None
+            if k is None:
+                return await func(*args, **kwargs)
+            return copyResult(await memo.callAsync(k, func, *args,
+                                                   **kwargs))
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            memo = _memo
+            k = key(args=args, kwargs=kwargs) if memo is not None else None
+            if k is None:
+                return func(*args, **kwargs)
+            return copyResult(memo.call(k, func, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,101 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+import logging
+import multiprocessing
+
+
+def __runPipeline(download: Callable, parse: Callable, keys: Iterable,
+                  max_workers: int=4, parse_workers: int=2) \
+    -> Iterator[tuple]:
+    """Function to download and parse many keys, with downloads running on a
+    thread pool and parsing on a process pool, so that CPU-bound parsing is
+    not limited to one core by the GIL. Each downloaded page is handed to the
+    process pool as soon as it arrives.
+
+    At most `2 * (max_workers + parse_workers)` keys are in flight at any
+    time, so that downloads do not run ahead of parsing (or of the consumer)
+    without bound. Results are yielded in the order of `keys`. Exceptions
+    raised for a key are yielded in place of its result.
+
+    The parse function and its inputs and outputs must be picklable. Parse
+    events are not reported to instrumentation hooks, as parsing runs in
+    other processes. Worker processes are started by a fork server (or
+    spawned, where fork servers are not supported), never forked from this
+    multithreaded process.
+
+    Arguments:
+        download {Callable} -- Function applied to each key on a thread,
+                               returning the raw input of `parse`.
+        parse {Callable} -- Function applied to each downloaded input in a
+                            worker process.
+        keys {Iterable} -- Keys to process.
+
+    Keyword Arguments:
+        max_workers {int} -- Maximum number of download threads
+                             (default: {4}).
+        parse_workers {int} -- Number of parsing processes (default: {2}).
+
+    Returns:
+        Iterator[tuple] -- Iterator of `(key, result_or_exception)` tuples, in
+                           the order of `keys`.
+    """
+
+    keys = iter(keys)
+    max_pending = 2 * (max_workers + parse_workers)
+
+    # Forking a process whose other threads hold locks (e.g. of the rate
+    # limiter, cache or logging) may deadlock the child
+    start_method = 'forkserver' if 'forkserver' in \
+        multiprocessing.get_all_start_methods() else 'spawn'
+
+    with ProcessPoolExecutor(max_workers=parse_workers,
+                             mp_context=multiprocessing.get_context(
+                                 start_method)) as parse_pool:
+        # Starting the pool before any download threads
+        parse_pool.submit(int).result()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as download_pool:
+            def submit(key) -> Future:
+                # Future of the parsed result, chained on the download
+                parsed = Future()
+
+                def onParsed(future: Future):
+                    try:
+                        parsed.set_result(future.result())
+                    except Exception as e:
+                        parsed.set_exception(e)
+
+                def onDownloaded(future: Future):
+                    try:
+                        parse_pool.submit(parse, future.result()) \
+                            .add_done_callback(onParsed)
+                    except Exception as e:
+                        parsed.set_exception(e)
+
+                download_pool.submit(download, key) \
+                    .add_done_callback(onDownloaded)
+
+                return parsed
+
+            # Keys in flight, in order
+            pending = deque()
+
+            while True:
+                # Topping up the window of submitted keys
+                for key in keys:
+                    pending.append((key, submit(key)))
+                    if len(pending) >= max_pending:
+                        break
+
+                if not pending:
+                    break
+
+                # Waiting for the earliest outstanding key
+                key, future = pending.popleft()
+                try:
+                    yield key, future.result()
+                except Exception as e:
+                    logging.warning('Pipeline item {0} failed: {1!r}'
+                                    .format(key, e))
+                    yield key, e
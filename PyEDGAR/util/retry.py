@@ -0,0 +1,262 @@
+from email.utils import parsedate_to_datetime
+from requests import exceptions, Response
+import datetime
+import logging
+import random
+import threading
+import time
+
+
+# Status codes returned by EDGAR when throttling, or on transient errors
+# Note: EDGAR answers 403 when its request rate threshold is exceeded
+RETRY_STATUSES = frozenset([403, 429, 500, 502, 503, 504])
+
+# Status codes indicating throttling, for which Retry-After is honoured
+THROTTLE_STATUSES = frozenset([403, 429, 503])
+
+
+class CircuitOpenError(exceptions.RequestException):
+    """Raised when a request is refused because the circuit breaker for its
+    host is open.
+    """
+
+
+class RetryPolicy(object):
+    """Policy for retrying failed requests with jittered exponential backoff.
+
+    Requests are retried on connection errors, timeouts and the statuses in
+    `retry_statuses`. The delay before retry `n` (counting from 0) is drawn
+    uniformly between 0 and `min(backoff_max, backoff_base * 2 ** n)`.
+
+    Throttling responses are not errors, and do not count towards
+    `max_retries`. They are retried after the server's Retry-After delay (or
+    the backoff delay, if absent) until the request has waited
+    `throttle_wait_max` seconds in total.
+    """
+
+    def __init__(self, max_retries: int=4, backoff_base: float=0.5,
+                 backoff_max: float=30.0, retry_after_max: float=120.0,
+                 throttle_wait_max: float=600.0,
+                 retry_statuses: frozenset=RETRY_STATUSES):
+        """Constructor for the retry policy.
+
+        Keyword Arguments:
+            max_retries {int} -- Maximum number of retries per request on
+                                 errors (default: {4}).
+            backoff_base {float} -- Base backoff delay in seconds
+                                    (default: {0.5}).
+            backoff_max {float} -- Maximum backoff delay in seconds
+                                   (default: {30.0}).
+            retry_after_max {float} -- Longest Retry-After delay honoured, in
+                                       seconds; requests asked to wait longer
+                                       are not retried (default: {120.0}).
+            throttle_wait_max {float} -- Longest total time a request waits
+                                         on throttling, in seconds
+                                         (default: {600.0}).
+            retry_statuses {frozenset} -- Status codes that are retried
+                                          (default: {RETRY_STATUSES}).
+        """
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.throttle_wait_max = throttle_wait_max
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def isRetryable(self, response: Response=None) -> bool:
+        """Function to check if a response (or, if None, a connection error)
+        should be retried.
+
+        Keyword Arguments:
+            response {Response} -- Response to the request (default: {None}).
+
+        Returns:
+            bool -- True if the request should be retried, False otherwise.
+        """
+
+        return response is None or response.status_code in self.retry_statuses
+
+    def isThrottled(self, response: Response=None) -> bool:
+        """Function to check if a response is a retryable throttling
+        response.
+
+        Keyword Arguments:
+            response {Response} -- Response to the request (default: {None}).
+
+        Returns:
+            bool -- True if the request was throttled, False otherwise.
+        """
+
+        return response is not None and \
+            response.status_code in THROTTLE_STATUSES and \
+            response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: Response=None) -> float:
+        """Function to get the delay before retrying a request.
+
+        Arguments:
+            attempt {int} -- Number of retries already made.
+
+        Keyword Arguments:
+            response {Response} -- Response to the failed request, if any
+                                   (default: {None}).
+
+        Returns:
+            float -- Delay in seconds, or None if the request should not be
+                     retried.
+        """
+
+        if attempt >= self.max_retries:
+            return None
+
+        # Honouring the server's Retry-After when throttled
+        if response is not None and \
+            response.status_code in THROTTLE_STATUSES:
+            retry_after = self.retryAfter(response=response)
+            if retry_after is not None:
+                if retry_after > self.retry_after_max:
+                    return None
+                return retry_after
+
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+
+        return random.uniform(0, backoff)
+
+    def throttleDelay(self, throttles: int, waited: float,
+                      response: Response) -> float:
+        """Function to get the delay before retrying a throttled request.
+
+        Arguments:
+            throttles {int} -- Number of times the request was already
+                               throttled.
+            waited {float} -- Total time the request already waited on
+                              throttling, in seconds.
+            response {Response} -- Throttling response to the request.
+
+        Returns:
+            float -- Delay in seconds, or None if the request should not be
+                     retried.
+        """
+
+        delay = self.retryAfter(response=response)
+
+        if delay is None:
+            backoff = min(self.backoff_max,
+                          self.backoff_base * 2 ** throttles)
+            delay = random.uniform(backoff / 2, backoff)
+        elif delay > self.retry_after_max:
+            return None
+
+        if waited + delay > self.throttle_wait_max:
+            return None
+
+        return delay
+
+    @staticmethod
+    def retryAfter(response: Response) -> float:
+        """Function to parse the Retry-After header of a response.
+
+        Arguments:
+            response {Response} -- Response to the request.
+
+        Returns:
+            float -- Delay requested by the server in seconds, or None if the
+                     header is absent or invalid.
+        """
+
+        value = response.headers.get('Retry-After')
+
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        now = datetime.datetime.now(tz=date.tzinfo)
+
+        return max(0.0, (date - now).total_seconds())
+
+
+class CircuitBreaker(object):
+    """Thread-safe per-host circuit breaker.
+
+    After `failure_threshold` consecutive failures to a host, the circuit for
+    that host opens and requests to it are refused for `reset_timeout`
+    seconds. A single trial request is then allowed through; the circuit
+    closes if it succeeds, and re-opens otherwise.
+    """
+
+    def __init__(self, failure_threshold: int=10, reset_timeout: float=60.0):
+        """Constructor for the circuit breaker.
+
+        Keyword Arguments:
+            failure_threshold {int} -- Consecutive failures after which the
+                                       circuit opens (default: {10}).
+            reset_timeout {float} -- Seconds for which an open circuit
+                                     refuses requests (default: {60.0}).
+        """
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.__failures = dict()  # Host to consecutive failures
+        self.__opened = dict()  # Host to time the circuit opened
+        self.__lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """Function to check if a request to a host is allowed.
+
+        Arguments:
+            host {str} -- Target host.
+
+        Returns:
+            bool -- True if the request may be made, False otherwise.
+        """
+
+        with self.__lock:
+            opened = self.__opened.get(host)
+
+            if opened is None:
+                return True
+
+            if time.monotonic() - opened >= self.reset_timeout:
+                # Half-open; allowing one trial request
+                self.__opened[host] = time.monotonic()
+                return True
+
+            return False
+
+    def recordSuccess(self, host: str):
+        """Function to record a successful request to a host.
+
+        Arguments:
+            host {str} -- Target host.
+        """
+
+        with self.__lock:
+            self.__failures.pop(host, None)
+            self.__opened.pop(host, None)
+
+    def recordFailure(self, host: str):
+        """Function to record a failed request to a host.
+
+        Arguments:
+            host {str} -- Target host.
+        """
+
+        with self.__lock:
+            failures = self.__failures.get(host, 0) + 1
+            self.__failures[host] = failures
+
+            if failures >= self.failure_threshold and \
+                host not in self.__opened:
+                logging.warning('Circuit opened for host {0} after {1} '
+                                'consecutive failures'.format(host, failures))
+                self.__opened[host] = time.monotonic()
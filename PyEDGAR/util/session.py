@@ -0,0 +1,437 @@
+from . import instrumentation
+from .cache import ResponseCache
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+from requests import adapters, exceptions, Response, Session
+from urllib.parse import urlsplit, urlunsplit
+import logging
+import threading
+import time
+
+
+# Maximum request rate permitted by the SEC EDGAR fair access policy
+# See: https://www.sec.gov/os/accessing-edgar-data
+EDGAR_MAX_RATE = 10.0
+
+# Default User-Agent; the SEC asks automated tools to identify themselves
+DEFAULT_USER_AGENT = 'PyEDGAR (https://github.com/rukmal/PyEDGAR)'
+
+# Base URL of EDGAR, to which all downloader URLs are relative
+EDGAR_BASE_URL = 'https://www.sec.gov'
+
+# Hosts serving EDGAR under `EDGAR_BASE_URL`
+EDGAR_HOSTS = frozenset(['sec.gov', 'www.sec.gov'])
+
+
+def rebaseURL(url: str, base_url: str=EDGAR_BASE_URL) -> str:
+    """Function to point an EDGAR URL at another base URL, e.g. that of a
+    local stand-in server. URLs of other hosts are returned unchanged.
+
+    Arguments:
+        url {str} -- EDGAR URL.
+
+    Keyword Arguments:
+        base_url {str} -- Base URL replacing the scheme and host of EDGAR
+                          URLs (default: {EDGAR_BASE_URL}).
+
+    Returns:
+        str -- Rebased URL.
+    """
+
+    parts = urlsplit(url)
+
+    if parts.netloc not in EDGAR_HOSTS:
+        return url
+
+    base = urlsplit(base_url)
+
+    return urlunsplit((base.scheme, base.netloc,
+                       base.path.rstrip('/') + parts.path, parts.query,
+                       parts.fragment))
+
+
+class RateLimiter(object):
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are replenished continuously at `rate` tokens per second, up to a
+    maximum of `burst` tokens. Each call to `acquire` consumes one token,
+    blocking until one is available.
+    """
+
+    def __init__(self, rate: float=EDGAR_MAX_RATE, burst: int=1):
+        """Constructor for the rate limiter.
+
+        Keyword Arguments:
+            rate {float} -- Tokens replenished per second
+                            (default: {EDGAR_MAX_RATE}).
+            burst {int} -- Maximum number of tokens that may accumulate
+                           (default: {1}).
+
+        Raises:
+            ValueError -- Raised if the rate or burst are not positive.
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError('Rate and burst must be positive')
+
+        self.rate = float(rate)
+        self.burst = burst
+        self.__tokens = float(burst)
+        self.__last = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def pause(self, duration: float):
+        """Function to stop handing out tokens for a period of time, e.g.
+        while the server is throttling requests. Overlapping pauses are
+        extended to the latest end time.
+
+        Arguments:
+            duration {float} -- Pause duration, in seconds.
+        """
+
+        with self.__lock:
+            now = time.monotonic()
+            # Tokens are replenished from the end of the pause
+            self.__tokens = 0.0
+            self.__last = max(self.__last, now + duration)
+
+    def acquire(self) -> float:
+        """Function to acquire a single token, blocking until available.
+
+        Returns:
+            float -- Time spent waiting for the token, in seconds.
+        """
+
+        waited = 0.0
+
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                # Replenishing tokens for elapsed time; none while paused
+                self.__tokens = min(self.burst, self.__tokens
+                                    + max(0.0, now - self.__last) * self.rate)
+                self.__last = max(self.__last, now)
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return waited
+
+                # Time until the next token is available
+                delay = (self.__last - now) + (1 - self.__tokens) / self.rate
+
+            # Sleeping outside the lock so other threads can refill the bucket
+            time.sleep(delay)
+            waited += delay
+
+
+class EdgarSession(object):
+    """Thread-safe transport for all requests made to EDGAR.
+
+    Wraps a pooled `requests.Session`, so that connections are kept alive and
+    re-used between requests, and a shared `RateLimiter`, so that the total
+    request rate across all threads stays within the SEC's limits. If a
+    `ResponseCache` is given, successful responses are cached by endpoint and
+    served from the cache while fresh.
+
+    Failed requests are retried according to a `RetryPolicy`, and a per-host
+    `CircuitBreaker` stops requests to hosts that keep failing. Throttling
+    responses are not failures: they pause the rate limiter for all threads,
+    and are retried under the policy's separate throttling budget.
+
+    Requests to EDGAR are sent to `base_url`, so that a session can be
+    pointed at a local stand-in server (see `PyEDGAR.testing`).
+    """
+
+    def __init__(self, user_agent: str=DEFAULT_USER_AGENT,
+                 max_rate: float=EDGAR_MAX_RATE, pool_size: int=10,
+                 cache: ResponseCache=None, retry_policy: RetryPolicy=None,
+                 circuit_breaker: CircuitBreaker=None,
+                 base_url: str=EDGAR_BASE_URL):
+        """Constructor for the EDGAR session.
+
+        Keyword Arguments:
+            user_agent {str} -- User-Agent header sent with each request
+                                (default: {DEFAULT_USER_AGENT}).
+            max_rate {float} -- Maximum requests per second; capped at
+                                `EDGAR_MAX_RATE` (default: {EDGAR_MAX_RATE}).
+            pool_size {int} -- Number of connections kept alive per host
+                               (default: {10}).
+            cache {ResponseCache} -- Persistent response cache; caching is
+                                     disabled if None (default: {None}).
+            retry_policy {RetryPolicy} -- Policy for retrying failed
+                                          requests; the default policy if
+                                          None (default: {None}).
+            circuit_breaker {CircuitBreaker} -- Per-host circuit breaker; the
+                                                default breaker if None
+                                                (default: {None}).
+            base_url {str} -- Base URL to which EDGAR requests are sent
+                              (default: {EDGAR_BASE_URL}).
+        """
+
+        if max_rate > EDGAR_MAX_RATE:
+            logging.warning('Request rate {0}/s exceeds the EDGAR limit; '
+                            'capping at {1}/s'.format(max_rate,
+                                                      EDGAR_MAX_RATE))
+            max_rate = EDGAR_MAX_RATE
+
+        self.user_agent = user_agent
+        self.cache = cache
+        self.limiter = RateLimiter(rate=max_rate)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.base_url = base_url
+
+        # Pooled HTTP session with keep-alive connections
+        self.session = Session()
+        adapter = adapters.HTTPAdapter(pool_connections=pool_size,
+                                       pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
+    def get(self, url: str, params: dict=None, endpoint: str=None,
+            **kwargs) -> Response:
+        """Function to make a rate-limited GET request, retrying it on
+        throttling, transient errors and connection failures.
+
+        If the session has a cache and an endpoint is given, fresh cached
+        responses are returned without making a request, and stale ones are
+        revalidated with a conditional request.
+
+        Arguments:
+            url {str} -- Target URL.
+
+        Keyword Arguments:
+            params {dict} -- Query parameters (default: {None}).
+            endpoint {str} -- Name of the endpoint (e.g. 'filings'), used to
+                              select the cache TTL; responses are not cached
+                              if None (default: {None}).
+            **kwargs -- Passed through to `requests.Session.get`.
+
+        Raises:
+            CircuitOpenError -- Raised if the circuit breaker for the host is
+                                open.
+            exceptions.RequestException -- Raised if the request still fails
+                                           to connect after all retries.
+
+        Returns:
+            Response -- Response to the request; the last response if all
+                        retries failed.
+        """
+
+        # Sending EDGAR requests to the configured base URL
+        url = rebaseURL(url=url, base_url=self.base_url)
+
+        # Streamed responses are never cached
+        if self.cache is None or endpoint is None or kwargs.get('stream'):
+            return self.__send(url=url, params=params, endpoint=endpoint,
+                               **kwargs)
+
+        key = ResponseCache.key(url=url, params=params)
+        cached, fresh = self.cache.lookup(key=key)
+
+        if fresh:
+            if instrumentation.enabled():
+                instrumentation.emit(instrumentation.RequestEvent(
+                    endpoint=endpoint, url=cached.url, status=200,
+                    bytes=len(cached.content), latency=0.0, retries=0,
+                    wait=0.0, from_cache=True))
+            return cached
+
+        # Revalidating stale entry with a conditional request
+        headers = dict(kwargs.pop('headers', None) or dict())
+        if cached is not None:
+            if 'ETag' in cached.headers:
+                headers['If-None-Match'] = cached.headers['ETag']
+            if 'Last-Modified' in cached.headers:
+                headers['If-Modified-Since'] = cached.headers['Last-Modified']
+
+        r = self.__send(url=url, params=params, endpoint=endpoint,
+                        headers=headers, **kwargs)
+
+        if r.status_code == 304 and cached is not None:
+            self.cache.refresh(key=key)
+            return cached
+
+        if r.ok:
+            self.cache.store(key=key, endpoint=endpoint, response=r)
+
+        return r
+
+    def __send(self, url: str, params: dict, endpoint: str,
+               **kwargs) -> Response:
+        """Function to make a rate-limited GET request, retrying it according
+        to the session's retry policy.
+
+        Arguments:
+            url {str} -- Target URL.
+            params {dict} -- Query parameters.
+            endpoint {str} -- Name of the endpoint.
+            **kwargs -- Passed through to `requests.Session.get`.
+
+        Raises:
+            CircuitOpenError -- Raised if the circuit breaker for the host is
+                                open.
+            exceptions.RequestException -- Raised if the request still fails
+                                           to connect after all retries.
+
+        Returns:
+            Response -- Response to the request.
+        """
+
+        host = urlsplit(url).netloc
+        attempt = 0
+        throttles, throttled = 0, 0.0
+
+        while True:
+            if not self.circuit_breaker.allow(host=host):
+                raise CircuitOpenError('Circuit open for host {0}'
+                                       .format(host))
+
+            r = None
+            try:
+                r = self.__sendOnce(url=url, params=params, endpoint=endpoint,
+                                    retries=attempt + throttles, **kwargs)
+            except (exceptions.ConnectionError, exceptions.Timeout) as e:
+                error = e
+            else:
+                if self.retry_policy.isThrottled(response=r):
+                    delay = self.retry_policy.throttleDelay(
+                        throttles=throttles, waited=throttled, response=r)
+
+                    # Waited too long on throttling; returning the response
+                    if delay is None:
+                        return r
+
+                    logging.warning('Request to {0} throttled ({1}); pausing '
+                                    'requests for {2:.2f}s'
+                                    .format(url, r.status_code, delay))
+                    r.close()
+
+                    # Pausing all requests to EDGAR, not just this one; the
+                    # host is up, so the circuit breaker is left as is
+                    self.limiter.pause(duration=delay)
+                    throttles += 1
+                    throttled += delay
+                    continue
+
+                if not self.retry_policy.isRetryable(response=r):
+                    self.circuit_breaker.recordSuccess(host=host)
+                    return r
+
+            self.circuit_breaker.recordFailure(host=host)
+            delay = self.retry_policy.delay(attempt=attempt, response=r)
+
+            # Retries exhausted; returning the failed response, if any
+            if delay is None:
+                if r is None:
+                    raise error
+                return r
+
+            logging.warning('Request to {0} failed ({1}); retrying in '
+                            '{2:.2f}s'.format(url, r.status_code if r
+                                              is not None else repr(error),
+                                              delay))
+
+            if r is not None:
+                r.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def __sendOnce(self, url: str, params: dict, endpoint: str,
+                   retries: int, **kwargs) -> Response:
+        """Function to make a single rate-limited GET request, reporting it
+        to instrumentation hooks.
+
+        Arguments:
+            url {str} -- Target URL.
+            params {dict} -- Query parameters.
+            endpoint {str} -- Name of the endpoint.
+            retries {int} -- Number of previous attempts of this request.
+            **kwargs -- Passed through to `requests.Session.get`.
+
+        Returns:
+            Response -- Response to the request.
+        """
+
+        wait = self.limiter.acquire()
+        start = time.perf_counter()
+
+        r = self.session.get(url=url, params=params, **kwargs)
+
+        if instrumentation.enabled():
+            # Streamed bodies have not been read yet
+            if kwargs.get('stream'):
+                size = int(r.headers.get('Content-Length', 0))
+            else:
+                size = len(r.content)
+            instrumentation.emit(instrumentation.RequestEvent(
+                endpoint=endpoint, url=r.url, status=r.status_code,
+                bytes=size, latency=time.perf_counter() - start,
+                retries=retries, wait=wait, from_cache=False))
+
+        return r
+
+    def close(self):
+        """Function to close all pooled connections.
+        """
+
+        self.session.close()
+
+
+# Shared session used by all downloaders; created lazily
+_session = None
+_session_lock = threading.Lock()
+
+
+def getSession() -> EdgarSession:
+    """Function to get the shared EDGAR session, creating it with the default
+    configuration if it does not yet exist.
+
+    Returns:
+        EdgarSession -- Shared EDGAR session.
+    """
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = EdgarSession()
+
+    return _session
+
+
+def setSession(session: EdgarSession):
+    """Function to replace the shared EDGAR session used by all downloaders.
+    Passing `None` restores the default session on next use.
+
+    Arguments:
+        session {EdgarSession} -- New shared session.
+    """
+
+    global _session
+
+    with _session_lock:
+        old_session, _session = _session, session
+
+    if old_session is not None and old_session is not session:
+        old_session.close()
+
+
+def configureSession(**kwargs) -> EdgarSession:
+    """Function to create a new shared EDGAR session with the given
+    configuration. See `EdgarSession` for the accepted keyword arguments.
+
+    Returns:
+        EdgarSession -- Newly configured shared session.
+    """
+
+    session = EdgarSession(**kwargs)
+    setSession(session=session)
+
+    return session
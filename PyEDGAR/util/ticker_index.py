@@ -0,0 +1,256 @@
+from .session import getSession
+
+from requests import exceptions
+import json
+import logging
+import os
+import threading
+
+
+# URL of the SEC bulk ticker to CIK mapping
+TICKERS_URL = 'https://www.sec.gov/files/company_tickers.json'
+
+
+class TickerIndex(object):
+    """In-memory index of tickers to Central Index Keys (CIKs), built from
+    the SEC's bulk ticker mapping (`company_tickers.json` format).
+
+    CIKs are held as integers in hash maps, so that forward (ticker to CIK)
+    and reverse (CIK to tickers) lookups take constant time.
+    """
+
+    def __init__(self, entries: list):
+        """Constructor for the ticker index.
+
+        Arguments:
+            entries {list} -- List of `(ticker, cik, title)` tuples, with the
+                              CIK as an integer.
+        """
+
+        self.__ciks = dict()  # Ticker to CIK
+        self.__tickers = dict()  # CIK to tickers
+        self.__titles = dict()  # CIK to company title
+
+        for ticker, cik, title in entries:
+            self.__ciks[self.normalize(ticker)] = cik
+            self.__tickers[cik] = self.__tickers.get(cik, ()) + (ticker,)
+            self.__titles[cik] = title
+
+    @staticmethod
+    def normalize(ticker: str) -> str:
+        """Function to normalize a ticker for lookup, e.g. 'brk.b' to 'BRK-B'.
+
+        Arguments:
+            ticker {str} -- Ticker to be normalized.
+
+        Returns:
+            str -- Normalized ticker.
+        """
+
+        return ticker.strip().upper().replace('.', '-')
+
+    @classmethod
+    def fromJSON(cls, data: dict) -> 'TickerIndex':
+        """Function to build a ticker index from the parsed SEC bulk ticker
+        mapping, i.e. a dictionary of entries with the keys `cik_str`,
+        `ticker` and `title`.
+
+        Arguments:
+            data {dict} -- Parsed `company_tickers.json` mapping.
+
+        Returns:
+            TickerIndex -- Ticker index.
+        """
+
+        return cls(entries=[(e['ticker'], int(e['cik_str']), e['title'])
+                            for e in data.values()])
+
+    @classmethod
+    def load(cls, path: str) -> 'TickerIndex':
+        """Function to load a ticker index from a file in
+        `company_tickers.json` format.
+
+        Arguments:
+            path {str} -- Path to the ticker mapping file.
+
+        Returns:
+            TickerIndex -- Ticker index.
+        """
+
+        with open(os.path.expanduser(path), 'r') as f:
+            return cls.fromJSON(data=json.load(f))
+
+    @classmethod
+    def download(cls) -> 'TickerIndex':
+        """Function to download the SEC bulk ticker mapping and build a ticker
+        index from it.
+
+        Raises:
+            exceptions.RequestException -- Raised if the request fails.
+
+        Returns:
+            TickerIndex -- Ticker index.
+        """
+
+        r = getSession().get(url=TICKERS_URL, endpoint='tickers')
+
+        # Handling failed request
+        if not r.ok:
+            logging.warning('Request failed: Ticker mapping download with '
+                            'error {0}'.format(r.status_code))
+            raise exceptions.RequestException('Request failed')
+
+        return cls.fromJSON(data=r.json())
+
+    def save(self, path: str):
+        """Function to save the ticker index to a file, in
+        `company_tickers.json` format.
+
+        Arguments:
+            path {str} -- Path to the ticker mapping file.
+        """
+
+        data = dict()
+        for ticker, cik in self.__ciks.items():
+            data[str(len(data))] = {'cik_str': cik, 'ticker': ticker,
+                                    'title': self.__titles[cik]}
+
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Writing atomically, so that readers never see a partial file
+        with open(path + '.tmp', 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(path + '.tmp', path)
+
+    def getCIK(self, ticker: str) -> str:
+        """Function to get the CIK for a given ticker.
+
+        Arguments:
+            ticker {str} -- Ticker to be matched.
+
+        Raises:
+            LookupError -- Raised if the ticker is not in the index.
+
+        Returns:
+            str -- Corresponding CIK of the ticker, zero-padded to 10 digits.
+        """
+
+        cik = self.__ciks.get(self.normalize(ticker))
+
+        if cik is None:
+            raise LookupError('CIK match not found')
+
+        return '{0:010d}'.format(cik)
+
+    def getTickers(self, cik: str) -> list:
+        """Function to get the tickers for a given CIK.
+
+        Arguments:
+            cik {str} -- Target CIK.
+
+        Returns:
+            list -- List of tickers; empty if the CIK is not in the index.
+        """
+
+        return list(self.__tickers.get(int(cik), ()))
+
+    def __contains__(self, ticker: str) -> bool:
+        return self.normalize(ticker) in self.__ciks
+
+    def __len__(self) -> int:
+        return len(self.__ciks)
+
+
+# Shared ticker index used by `getCIK`; None until loaded
+_index = None
+_index_lock = threading.Lock()
+
+
+def getTickerIndex() -> TickerIndex:
+    """Function to get the shared ticker index.
+
+    Returns:
+        TickerIndex -- Shared ticker index, or None if it is not loaded.
+    """
+
+    return _index
+
+
+def setTickerIndex(index: TickerIndex):
+    """Function to replace the shared ticker index. Passing `None` disables
+    index lookups in `getCIK`.
+
+    Arguments:
+        index {TickerIndex} -- New shared ticker index.
+    """
+
+    global _index
+
+    with _index_lock:
+        _index = index
+
+
+def loadTickerIndex(path: str=None) -> TickerIndex:
+    """Function to load the shared ticker index used by `getCIK`. The index is
+    read from `path` if it exists; otherwise it is downloaded from the SEC
+    (and saved to `path`, if given).
+
+    Keyword Arguments:
+        path {str} -- Path to a local ticker mapping file (default: {None}).
+
+    Returns:
+        TickerIndex -- Shared ticker index.
+    """
+
+    if path is not None and os.path.exists(os.path.expanduser(path)):
+        index = TickerIndex.load(path=path)
+        setTickerIndex(index=index)
+        return index
+
+    return refreshTickerIndex(path=path)
+
+
+def refreshTickerIndex(path: str=None) -> TickerIndex:
+    """Function to download the latest SEC ticker mapping and replace the
+    shared ticker index with it.
+
+    Keyword Arguments:
+        path {str} -- Path to save the ticker mapping to (default: {None}).
+
+    Returns:
+        TickerIndex -- Shared ticker index.
+    """
+
+    logging.info('Refreshing ticker index')
+
+    index = TickerIndex.download()
+    if path is not None:
+        index.save(path=path)
+    setTickerIndex(index=index)
+
+    return index
+
+
+def getTickers(cik: str) -> list:
+    """Function to get the tickers for a given CIK from the shared ticker
+    index.
+
+    Arguments:
+        cik {str} -- Target CIK.
+
+    Raises:
+        LookupError -- Raised if the shared ticker index is not loaded.
+
+    Returns:
+        list -- List of tickers; empty if the CIK is not in the index.
+    """
+
+    index = getTickerIndex()
+
+    if index is None:
+        raise LookupError('Ticker index is not loaded')
+
+    return index.getTickers(cik=cik)
@@ -0,0 +1,3 @@
+from .instance import getFacts
+from .instance import parseInstance
+from .facts import FactTable
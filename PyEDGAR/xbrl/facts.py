@@ -0,0 +1,179 @@
+from array import array
+from collections import namedtuple
+from typing import Iterator
+import math
+
+
+# Context of a fact; dates are formatted YYYY-MM-DD, empty if not applicable
+Context = namedtuple('Context', [
+    'entity',  # Entity identifier (e.g. CIK)
+    'start',  # Start date of a duration period
+    'end',  # End date of a duration period, or date of an instant
+    'dimensions'  # Tuple of (dimension, member) pairs, sorted by dimension
+])
+
+# Output fields of fact records, in order
+FIELDS = ('concept', 'entity', 'start', 'end', 'unit', 'value', 'dimensions')
+
+
+class FactTable(object):
+    """Compact columnar table of XBRL facts.
+
+    Concepts, contexts and units are stored once each, and referenced from
+    each fact by code in `array` columns; numeric values are stored in a
+    `double` array (NaN for non-numeric and nil facts). Non-numeric values
+    are kept in a separate list, if parsed. Iterating yields a dictionary per
+    fact, with the fields of `FIELDS`.
+    """
+
+    def __init__(self, columns: dict, concepts: list, contexts: list,
+                 units: list):
+        """Constructor for the fact table.
+
+        Arguments:
+            columns {dict} -- Dictionary of equal length columns: 'concept'
+                              and 'context' arrays of codes, a 'unit' array
+                              of codes (-1 for no unit), a 'value' array of
+                              numeric values, and a 'text' list of
+                              non-numeric values (or None).
+            concepts {list} -- Concept names (e.g. 'us-gaap:Assets')
+                               corresponding to each concept code.
+            contexts {list} -- `Context` corresponding to each context code.
+            units {list} -- Unit names (e.g. 'USD' or 'USD/shares')
+                            corresponding to each unit code.
+        """
+
+        self.columns = columns
+        self.concepts = list(concepts)
+        self.contexts = list(contexts)
+        self.units = list(units)
+
+    def __len__(self) -> int:
+        return len(self.columns['concept'])
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self.__record(i)
+
+    def __getitem__(self, i: int) -> dict:
+        """Function to get a single fact by position.
+
+        Arguments:
+            i {int} -- Position of the fact.
+
+        Returns:
+            dict -- Dictionary of fact information.
+        """
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Fact index out of range')
+
+        return self.__record(i)
+
+    def __repr__(self) -> str:
+        return '<FactTable: {0} facts, {1} concepts, {2} contexts>'.format(
+            len(self), len(self.concepts), len(self.contexts))
+
+    def filterConcept(self, concept: str) -> 'FactTable':
+        """Function to select facts by concept.
+
+        Arguments:
+            concept {str} -- Target concept, with its prefix (e.g.
+                             'us-gaap:Assets').
+
+        Returns:
+            FactTable -- Table of the matching facts.
+        """
+
+        try:
+            code = self.concepts.index(concept)
+        except ValueError:
+            code = -1
+
+        rows = [i for i, c in enumerate(self.columns['concept'])
+                if c == code]
+
+        columns = dict()
+        for k, v in self.columns.items():
+            if v is None:
+                columns[k] = None
+            elif isinstance(v, array):
+                columns[k] = array(v.typecode, (v[i] for i in rows))
+            else:
+                columns[k] = [v[i] for i in rows]
+
+        return FactTable(columns=columns, concepts=self.concepts,
+                         contexts=self.contexts, units=self.units)
+
+    def toPandas(self) -> 'pandas.DataFrame':
+        """Function to export the facts as a pandas DataFrame, with concepts
+        and units as categorical columns.
+
+        Raises:
+            ImportError -- Raised if pandas is not installed.
+
+        Returns:
+            pandas.DataFrame -- DataFrame of facts.
+        """
+
+        import pandas as pd
+
+        contexts = [self.contexts[c] for c in self.columns['context']]
+
+        data = {
+            'concept': pd.Categorical.from_codes(
+                codes=list(self.columns['concept']),
+                categories=self.concepts),
+            'entity': [c.entity for c in contexts],
+            'start': [c.start for c in contexts],
+            'end': [c.end for c in contexts],
+            'unit': pd.Categorical.from_codes(
+                codes=list(self.columns['unit']), categories=self.units),
+            'value': [self.__value(i) for i in range(len(self))],
+            'dimensions': [dict(c.dimensions) for c in contexts]
+        }
+
+        return pd.DataFrame(data, columns=list(FIELDS))
+
+    def __value(self, i: int):
+        """Function to get the value of the fact at a given position.
+
+        Arguments:
+            i {int} -- Position of the fact.
+
+        Returns:
+            float or str -- Numeric value, non-numeric value, or None if the
+                            fact is nil or its text was not parsed.
+        """
+
+        value = self.columns['value'][i]
+
+        if not math.isnan(value):
+            return value
+        if self.columns['text'] is not None:
+            return self.columns['text'][i]
+
+        return None
+
+    def __record(self, i: int) -> dict:
+        """Function to rebuild the fact dictionary at a given position.
+
+        Arguments:
+            i {int} -- Position of the fact.
+
+        Returns:
+            dict -- Dictionary of fact information.
+        """
+
+        context = self.contexts[self.columns['context'][i]]
+        unit = self.columns['unit'][i]
+
+        return {'concept': self.concepts[self.columns['concept'][i]],
+                'entity': context.entity,
+                'start': context.start,
+                'end': context.end,
+                'unit': self.units[unit] if unit >= 0 else None,
+                'value': self.__value(i),
+                'dimensions': dict(context.dimensions)}
@@ -0,0 +1,68 @@
+from ..util.session import getSession
+from .facts import FactTable
+from .parser import __parseInstance
+
+from requests import exceptions
+import logging
+
+
+def parseInstance(source, include_text: bool=True) -> FactTable:
+    """Function to parse an XBRL instance document (e.g. the '_htm.xml'
+    document of a filing) into a columnar table of facts.
+    
+    Arguments:
+        source -- Path or binary file object of the instance document.
+    
+    Keyword Arguments:
+        include_text {bool} -- Flag to keep the values of non-numeric facts,
+                               such as text blocks (default: {True}).
+    
+    Raises:
+        ElementTree.ParseError -- Raised if the document is not well-formed
+                                  XML.
+        ValueError -- Raised if a fact refers to an undefined context.
+    
+    Returns:
+        FactTable -- Table of facts, in document order.
+    """
+
+    return __parseInstance(source=source, include_text=include_text)
+
+
+def getFacts(url: str, include_text: bool=True) -> FactTable:
+    """Function to download and parse an XBRL instance document from EDGAR.
+    The document is parsed as it is streamed, and never held in memory as a
+    whole.
+    
+    Arguments:
+        url {str} -- URL of the instance document.
+    
+    Keyword Arguments:
+        include_text {bool} -- Flag to keep the values of non-numeric facts,
+                               such as text blocks (default: {True}).
+    
+    Raises:
+        exceptions.RequestException -- Raised if the download fails.
+        ElementTree.ParseError -- Raised if the document is not well-formed
+                                  XML.
+    
+    Returns:
+        FactTable -- Table of facts, in document order.
+    """
+
+    logging.info('Getting XBRL facts from {0}'.format(url))
+
+    r = getSession().get(url=url, endpoint='xbrl', stream=True)
+
+    try:
+        if not r.ok:
+            logging.warning('Request failed: XBRL download from {0}, error '
+                            '{1}'.format(url, r.status_code))
+            raise exceptions.RequestException('Request failed')
+
+        # Undoing any transfer encoding
+        r.raw.decode_content = True
+
+        return __parseInstance(source=r.raw, include_text=include_text)
+    finally:
+        r.close()
@@ -0,0 +1,228 @@
+from ..util import instrumentation
+from .facts import Context, FactTable
+
+from array import array
+from xml.etree import ElementTree
+
+
+# XBRL instance namespace
+XBRLI_NS = 'http://www.xbrl.org/2003/instance'
+
+# Tags of unit elements
+MEASURE_TAG = '{{{0}}}measure'.format(XBRLI_NS)
+DIVIDE_TAG = '{{{0}}}divide'.format(XBRLI_NS)
+NUMERATOR_TAG = '{{{0}}}unitNumerator'.format(XBRLI_NS)
+DENOMINATOR_TAG = '{{{0}}}unitDenominator'.format(XBRLI_NS)
+
+# XML Schema instance namespace, for nil facts
+XSI_NIL = '{http://www.w3.org/2001/XMLSchema-instance}nil'
+
+# Namespaces of instance elements that are never facts
+NON_FACT_NAMESPACES = ('http://www.xbrl.org/2003/instance',
+                       'http://www.xbrl.org/2003/linkbase')
+
+
+def __parseInstance(source, include_text: bool=True) -> FactTable:
+    """Function to parse an XBRL instance document into a columnar table of
+    facts, in a single incremental pass.
+
+    Each top-level element is discarded as soon as it has been read, so that
+    memory use is bounded by the size of the table rather than of the
+    document. Contexts and units may appear before or after the facts
+    referring to them.
+    
+    Arguments:
+        source -- Path or binary file object of the instance document.
+    
+    Keyword Arguments:
+        include_text {bool} -- Flag to keep the values of non-numeric facts
+                               (e.g. text blocks); otherwise only numeric
+                               values are kept (default: {True}).
+    
+    Raises:
+        ElementTree.ParseError -- Raised if the document is not well-formed
+                                  XML.
+        ValueError -- Raised if a fact refers to an undefined context.
+    
+    Returns:
+        FactTable -- Table of facts, in document order.
+    """
+
+    with instrumentation.measureParse(stage='xbrl') as parse:
+        # Fact columns
+        concept_codes = array('I')
+        context_codes = array('I')
+        unit_codes = array('i')
+        values = array('d')
+        texts = list() if include_text else None
+
+        # Codes of concepts, context IDs and unit IDs, by first reference
+        concept_index = dict()
+        context_index = dict()
+        unit_index = dict()
+        # Definitions of contexts and units, by ID
+        contexts = dict()
+        units = dict()
+
+        # Namespace URI to prefix, for concept names
+        prefixes = dict()
+
+        depth = 0
+        root = None
+
+        for event, element in ElementTree.iterparse(
+                source, events=('start', 'end', 'start-ns')):
+            if event == 'start-ns':
+                prefix, uri = element
+                prefixes.setdefault(uri, prefix)
+                continue
+
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+
+            # Only reading top-level elements, once complete
+            if depth != 1:
+                continue
+
+            namespace, _, name = element.tag[1:].partition('}')
+
+            if namespace == XBRLI_NS and name == 'context':
+                contexts[element.get('id')] = __parseContext(context=element)
+            elif namespace == XBRLI_NS and name == 'unit':
+                units[element.get('id')] = __parseUnit(unit=element)
+            elif namespace not in NON_FACT_NAMESPACES and \
+                element.get('contextRef') is not None:
+                concept = element.tag
+                if concept not in concept_index:
+                    concept_index[concept] = len(concept_index)
+                concept_codes.append(concept_index[concept])
+
+                context_ref = element.get('contextRef')
+                if context_ref not in context_index:
+                    context_index[context_ref] = len(context_index)
+                context_codes.append(context_index[context_ref])
+
+                unit_ref = element.get('unitRef')
+                if unit_ref is None:
+                    unit_codes.append(-1)
+                else:
+                    if unit_ref not in unit_index:
+                        unit_index[unit_ref] = len(unit_index)
+                    unit_codes.append(unit_index[unit_ref])
+
+                # Numeric facts have a unit; nil facts have no value
+                value = float('nan')
+                if unit_ref is not None and element.get(XSI_NIL) != 'true':
+                    try:
+                        value = float(element.text)
+                    except (TypeError, ValueError):
+                        pass
+                values.append(value)
+
+                if texts is not None:
+                    texts.append(None if unit_ref is not None
+                                 else ''.join(element.itertext()))
+
+            # Discarding element, and its reference from the root
+            element.clear()
+            root.clear()
+
+        # Resolving references
+        for context_ref in context_index:
+            if context_ref not in contexts:
+                raise ValueError('Undefined context {0}'.format(context_ref))
+
+        concepts = list()
+        for tag in concept_index:
+            namespace, _, name = tag[1:].partition('}')
+            prefix = prefixes.get(namespace)
+            concepts += ['{0}:{1}'.format(prefix, name) if prefix else name]
+
+        table = FactTable(columns={'concept': concept_codes,
+                                   'context': context_codes,
+                                   'unit': unit_codes,
+                                   'value': values,
+                                   'text': texts},
+                          concepts=concepts,
+                          contexts=[contexts[c] for c in context_index],
+                          units=[units.get(u, u) for u in unit_index])
+
+        parse.entries = len(table)
+
+    return table
+
+
+def __parseContext(context: ElementTree.Element) -> Context:
+    """Function to parse an XBRL context element.
+    
+    Arguments:
+        context {ElementTree.Element} -- Context element.
+    
+    Returns:
+        Context -- Entity, period and dimensions of the context.
+    """
+
+    entity = start = end = ''
+    dimensions = list()
+
+    for child in context.iter():
+        name = child.tag.rpartition('}')[2]
+
+        if name == 'identifier':
+            entity = (child.text or '').strip()
+        elif name == 'startDate':
+            start = (child.text or '').strip()
+        elif name in ('endDate', 'instant'):
+            end = (child.text or '').strip()
+        elif name == 'explicitMember':
+            dimensions += [(child.get('dimension'),
+                            (child.text or '').strip())]
+        elif name == 'typedMember':
+            dimensions += [(child.get('dimension'),
+                            ''.join(child.itertext()).strip())]
+
+    return Context(entity=entity, start=start, end=end,
+                   dimensions=tuple(sorted(dimensions)))
+
+
+def __parseUnit(unit: ElementTree.Element) -> str:
+    """Function to parse an XBRL unit element into a unit name, e.g. 'USD'
+    or 'USD/shares'. Measure prefixes are dropped.
+    
+    Arguments:
+        unit {ElementTree.Element} -- Unit element.
+    
+    Returns:
+        str -- Unit name.
+    """
+
+    divide = unit.find(DIVIDE_TAG)
+
+    if divide is None:
+        return __measures(element=unit)
+
+    return '{0}/{1}'.format(__measures(element=divide.find(NUMERATOR_TAG)),
+                            __measures(element=divide.find(DENOMINATOR_TAG)))
+
+
+def __measures(element: ElementTree.Element) -> str:
+    """Function to get the product of the measures within an element, e.g.
+    'USD' or 'USD*shares'.
+    
+    Arguments:
+        element {ElementTree.Element} -- Element containing measures.
+    
+    Returns:
+        str -- Measure names without prefixes, joined by '*'.
+    """
+
+    if element is None:
+        return ''
+
+    return '*'.join((m.text or '').strip().rpartition(':')[2]
+                    for m in element.iter(MEASURE_TAG))
@@ -0,0 +1,58 @@
+"""Records the EDGAR responses used by the benchmark suite.
+
+Fetches a listings page and the bulk ticker mapping from sec.gov through
+PyEDGAR's shared session, and saves them to the fixtures directory, replacing
+the existing recordings. The company page is shared with the test suite,
+whose assertions depend on it, and is not recorded again.
+
+Usage:
+    python benchmarks/record.py [--cik 0000320193] [--user-agent "..."]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Importing PyEDGAR from this repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+import PyEDGAR
+from run import FIXTURES_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record EDGAR fixtures.')
+    parser.add_argument('--cik', default='0000320193',
+                        help='CIK of the filer whose listings are recorded')
+    parser.add_argument('--user-agent',
+                        default=PyEDGAR.util.session.DEFAULT_USER_AGENT,
+                        help='User-Agent sent to sec.gov')
+    args = parser.parse_args()
+
+    PyEDGAR.util.configureSession(user_agent=args.user_agent)
+
+    download_filings = getattr(PyEDGAR.filings.downloader, '__makeRequest')
+
+    fixtures = {
+        'filings_page.xml': download_filings(cik=args.cik, start_idx=0,
+                                             count=100)
+    }
+
+    # Keeping a sample of the bulk ticker mapping
+    r = PyEDGAR.util.getSession().get(url=PyEDGAR.util.ticker_index
+                                      .TICKERS_URL)
+    r.raise_for_status()
+    sample = dict(list(r.json().items())[:100])
+    fixtures['company_tickers.json'] = json.dumps(sample,
+                                                  separators=(',', ':'))
+
+    for name, content in fixtures.items():
+        with open(os.path.join(FIXTURES_DIR, name), 'w') as f:
+            f.write(content)
+        print('Recorded {0}'.format(name))
+
+
+if __name__ == '__main__':
+    main()
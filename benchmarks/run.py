@@ -0,0 +1,253 @@
+"""Offline benchmark suite for PyEDGAR.
+
+Measures the listings and company page parsers, and the full `getAllFilings`,
+`getInfo` and `getCIK` pipelines over HTTP against a local stand-in for EDGAR
+(see `PyEDGAR.testing`) serving recorded responses. Results, including peak
+memory, are written as JSON so that runs can be compared between versions.
+
+Usage:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare baseline.json
+    python benchmarks/run.py --base-url http://127.0.0.1:8080
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+# Importing PyEDGAR from this repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+import PyEDGAR
+from PyEDGAR.testing import EdgarStandIn, StandInServer
+
+
+# Directory of recorded EDGAR responses
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'fixtures')
+
+# Recorded company page, shared with the test suite
+COMPANY_PAGE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests',
+    'fixtures', 'company_page.html')
+
+# Number of filings of the benchmarked filers, by size
+FILER_SIZES = {'small': 40, 'large': 600, 'xlarge': 5000}
+
+# CIKs of the benchmarked filers, by size
+FILER_CIKS = {'small': '0000000040', 'large': '0000000600',
+              'xlarge': '0000005000'}
+
+
+def __configureSession(base_url: str):
+    """Function to configure the shared EDGAR session to send requests to a
+    stand-in server, without rate limiting.
+
+    Arguments:
+        base_url {str} -- Base URL of the stand-in server.
+    """
+
+    session = PyEDGAR.util.configureSession(base_url=base_url)
+    # Rate limiting would dominate the pipeline timings
+    session.limiter = PyEDGAR.util.session.RateLimiter(rate=1e9, burst=10**9)
+
+
+def __buildBenchmarks(standin: EdgarStandIn) -> dict:
+    """Function to build the benchmarks.
+
+    Arguments:
+        standin {EdgarStandIn} -- Generator of the parsed pages.
+
+    Returns:
+        dict -- Dictionary mapping benchmark name to a function to be timed.
+    """
+
+    parse_filings = getattr(PyEDGAR.filings.parser, '__parseHTML')
+    parse_company = getattr(PyEDGAR.company.parser, '__parseHTML')
+
+    with open(COMPANY_PAGE_PATH) as f:
+        company_page = f.read()
+    with open(os.path.join(FIXTURES_DIR, 'company_tickers.json')) as f:
+        tickers = json.load(f)
+    # Ticker mapping the size of the SEC's, built from the recorded entries
+    tickers_large = {str(i): dict(tickers[str(i % len(tickers))],
+                                  ticker='T{0}'.format(i))
+                     for i in range(12000)}
+
+    benchmarks = dict()
+
+    for size, total in FILER_SIZES.items():
+        pages = [standin.listingsPage(cik=FILER_CIKS[size], start=i,
+                                      count=100)
+                 for i in range(0, total, 100)]
+        for engine in ('etree', 'bs4'):
+            benchmarks['parse_filings_{0}_{1}'.format(engine, size)] = (
+                lambda pages=pages, engine=engine:
+                parse_filings(pages_html=pages, engine=engine))
+        benchmarks['pipeline_getAllFilings_{0}'.format(size)] = (
+            lambda cik=FILER_CIKS[size]: PyEDGAR.filings.getAllFilings(cik))
+
+    for engine in ('regex', 'bs4'):
+        benchmarks['parse_company_{0}'.format(engine)] = (
+            lambda engine=engine:
+            parse_company(page_html=company_page, engine=engine))
+
+    benchmarks['pipeline_getInfo'] = (
+        lambda: PyEDGAR.company.getInfo(cik='0000034088'))
+    benchmarks['pipeline_getCIK'] = (
+        lambda: PyEDGAR.util.getCIK(ticker='XOM', use_index=False))
+    benchmarks['build_ticker_index'] = (
+        lambda: PyEDGAR.util.TickerIndex.fromJSON(data=tickers_large))
+
+    return benchmarks
+
+
+def __measure(func, repeat: int) -> dict:
+    """Function to measure the run time and peak memory of a function.
+
+    Arguments:
+        func {Callable} -- Function to be measured.
+        repeat {int} -- Number of timed runs.
+
+    Returns:
+        dict -- Dictionary of timings (in seconds) and peak memory (in
+                bytes).
+    """
+
+    # Warm-up run, also used to measure peak memory
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times += [time.perf_counter() - start]
+
+    return {'min': min(times),
+            'mean': statistics.mean(times),
+            'stdev': statistics.stdev(times) if repeat > 1 else 0.0,
+            'repeat': repeat,
+            'peak_memory': peak}
+
+
+def __environment() -> dict:
+    """Function to describe the environment the benchmarks ran in.
+
+    Returns:
+        dict -- Dictionary of environment attributes.
+    """
+
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {'commit': commit,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+
+
+def __compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Function to print a comparison of results against a baseline run.
+
+    Arguments:
+        results {dict} -- Results of this run.
+        baseline {dict} -- Results of the baseline run.
+        threshold {float} -- Slowdown ratio above which a benchmark is
+                             reported as a regression.
+
+    Returns:
+        bool -- True if any benchmark regressed, False otherwise.
+    """
+
+    regressed = False
+
+    print('{0:<36} {1:>10} {2:>10} {3:>8}'.format('benchmark', 'baseline',
+                                                   'current', 'ratio'))
+    for name, result in results['results'].items():
+        if name not in baseline['results']:
+            continue
+        old = baseline['results'][name]['min']
+        ratio = result['min'] / old if old else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = ' REGRESSION'
+            regressed = True
+        print('{0:<36} {1:>10.5f} {2:>10.5f} {3:>8.2f}{4}'.format(
+            name, old, result['min'], ratio, flag))
+
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run PyEDGAR benchmarks.')
+    parser.add_argument('--output', help='path to write JSON results to')
+    parser.add_argument('--compare', help='path of baseline JSON results')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='slowdown ratio reported as a regression')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timed runs per benchmark')
+    parser.add_argument('--filter', default='',
+                        help='only run benchmarks containing this string')
+    parser.add_argument('--base-url',
+                        help='base URL of a running stand-in server, e.g. '
+                             'one with added latency; a local one serving '
+                             'the recorded responses is started otherwise')
+    args = parser.parse_args()
+
+    # The 'bs4' listings engine warns about parsing XML as HTML
+    warnings.simplefilter('ignore')
+
+    standin = EdgarStandIn(filers={FILER_CIKS[k]: v
+                                   for k, v in FILER_SIZES.items()},
+                           fixtures_dir=FIXTURES_DIR,
+                           company_page=COMPANY_PAGE_PATH)
+    server = None
+    if args.base_url is None:
+        server = StandInServer(standin=standin).start()
+    __configureSession(base_url=args.base_url or server.base_url)
+
+    results = {'environment': __environment(), 'results': dict()}
+
+    try:
+        for name, func in __buildBenchmarks(standin=standin).items():
+            if args.filter not in name:
+                continue
+            results['results'][name] = __measure(func=func,
+                                                 repeat=args.repeat)
+            print('{0:<36} {1:>10.5f}s {2:>12,d} B'.format(
+                name, results['results'][name]['min'],
+                results['results'][name]['peak_memory']), file=sys.stderr)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if __compare(results=results, baseline=baseline,
+                     threshold=args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+from context import PyEDGAR
+from PyEDGAR.testing import makeFilings, makeListingsPage
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import asyncio
+import io
+import threading
+from urllib.parse import urlencode
+
+
+class FakeSession(object):
+    """Stand-in for `EdgarSession` that serves synthetic atom listings pages
+    for a single filer, and records the requests made.
+    """
+
+    def __init__(self, cik: str, total: int):
+        self.cik = cik
+        self.filings = makeFilings(cik=cik, total=total)
+        self.requests = list()
+        self.__lock = threading.Lock()
+
+    def get(self, url: str, params: dict=None, **kwargs) -> Response:
+        with self.__lock:
+            self.requests += [dict(params or {})]
+
+        r = Response()
+        r.url = url + '?' + urlencode(params)
+
+        # Unknown filers are not found
+        if params.get('CIK') != self.cik:
+            r.status_code = 404
+            r._content = b''
+            return r
+
+        r.status_code = 200
+        r._content = makeListingsPage(
+            cik=self.cik, filings=self.filings, start=int(params['start']),
+            count=int(params['count']), filing_type=params.get('type', ''),
+            before=params.get('dateb', '')).encode()
+        r.encoding = 'utf-8'
+
+        return r
+
+    def close(self):
+        pass
+
+
+class AsyncFakeSession(FakeSession):
+    """Stand-in for `AsyncEdgarSession` that serves synthetic atom listings
+    pages after a delay, and records the requests made.
+    """
+
+    def __init__(self, cik: str, total: int, delay: float=0.0):
+        super().__init__(cik=cik, total=total)
+        self.delay = delay
+
+    async def get(self, url: str, params: dict=None, **kwargs) -> Response:
+        await asyncio.sleep(self.delay)
+        return FakeSession.get(self, url=url, params=params, **kwargs)
+
+    async def close(self):
+        pass
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter that answers requests with a handler function instead
+    of the network, for mounting on a `requests.Session`.
+    """
+
+    def __init__(self, handler):
+        """Constructor for the fake adapter.
+
+        Arguments:
+            handler {Callable} -- Function taking the `PreparedRequest` and
+                                  returning a tuple of the status code, the
+                                  body and a dict of headers.
+        """
+
+        super().__init__()
+        self.handler = handler
+        self.requests = list()
+
+    def send(self, request, **kwargs) -> Response:
+        self.requests += [request]
+        status, body, headers = self.handler(request)
+
+        r = Response()
+        r.status_code = status
+        r.url = request.url
+        r.request = request
+        r.headers = CaseInsensitiveDict(headers)
+        r._content = body
+        r.raw = io.BytesIO(body)  # For streamed responses
+        r.encoding = 'utf-8'
+
+        return r
+
+    def close(self):
+        pass
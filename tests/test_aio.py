@@ -0,0 +1,153 @@
+from context import PyEDGAR
+from fakes import AsyncFakeSession, FakeSession
+from PyEDGAR.testing import EdgarStandIn, StandInServer
+
+import asyncio
+import gc
+import logging
+import time
+import unittest
+
+
+class TestAio(unittest.TestCase):
+    """Test the `aio` module against synthetic listings pages.
+    """
+
+    def setUp(self):
+        # Installing the same fake filer for blocking and async calls
+        self.session = AsyncFakeSession(cik='0000320193', total=550)
+        PyEDGAR.util.setSession(FakeSession(cik='0000320193', total=550))
+        PyEDGAR.aio.setSession(self.session)
+
+    def tearDown(self):
+        PyEDGAR.util.setSession(None)
+        PyEDGAR.aio.setSession(None)
+
+
+    def test_asyncFilings(self):
+        """Test `getAllFilings` and `getCompanyProfile` in the `aio` module.
+
+        Verifies that serial and concurrent async pagination return the same
+        filings as the blocking `getAllFilings`, and that the async company
+        profile matches the blocking one.
+        """
+
+        # Test variables
+        cik = self.session.cik
+
+        async def run():
+            return await asyncio.gather(
+                PyEDGAR.aio.getAllFilings(cik=cik),
+                PyEDGAR.aio.getAllFilings(cik=cik, max_workers=4),
+                PyEDGAR.aio.getCompanyProfile(cik=cik))
+
+        serial, concurrent, profile = asyncio.run(run())
+
+        # Verifying results are identical to blocking calls
+        expected = PyEDGAR.filings.getAllFilings(cik=cik)
+        self.assertEqual(len(serial), 550)
+        self.assertEqual(serial, expected)
+        self.assertEqual(concurrent, expected)
+        self.assertEqual(profile,
+                         PyEDGAR.company.getCompanyProfile(cik=cik))
+
+
+    def test_asyncCancellation(self):
+        """Test cancelling an async `getAllFilings` call.
+
+        This test serves pages after 50ms, with 4 pages requested
+        concurrently. Verifies that cancelling the call raises
+        `CancelledError`, and that no further pages are requested after it.
+        """
+
+        # Test variables
+        self.session.delay = 0.05
+
+        async def run():
+            task = asyncio.ensure_future(PyEDGAR.aio.getAllFilings(
+                cik=self.session.cik, max_workers=4))
+            await asyncio.sleep(0.08)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            requested = len(self.session.requests)
+            await asyncio.sleep(0.1)
+            return requested
+
+        requested = asyncio.run(run())
+
+        # Verifying the in-flight window was dropped
+        self.assertLess(requested, 6)
+        self.assertEqual(len(self.session.requests), requested)
+
+
+    def test_asyncRateLimiter(self):
+        """Test the `AsyncRateLimiter` in the `aio` module.
+
+        Verifies that 6 concurrent acquisitions at 50 tokens per second take
+        at least 0.1 seconds, and that a cancelled waiter does not consume a
+        token.
+        """
+
+        # Test variables
+        limiter = PyEDGAR.aio.AsyncRateLimiter(rate=50)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*[limiter.acquire() for _ in range(6)])
+            elapsed = time.monotonic() - start
+
+            # Cancelling a waiter; the next waiter gets the token in time
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0.005)
+            waiter.cancel()
+            wait = await limiter.acquire()
+
+            return elapsed, wait
+
+        elapsed, wait = asyncio.run(run())
+
+        # Verifying the rate was respected
+        self.assertGreaterEqual(elapsed, 0.099)
+        self.assertLess(wait, 0.02)
+
+
+    @unittest.skipIf(PyEDGAR.aio.session.aiohttp is None,
+                     'aiohttp is not installed')
+    def test_asyncStandIn(self):
+        """Test the aiohttp transport against the stand-in server.
+
+        This test fetches the filings of a synthetic filer in two successive
+        event loops, with the shared async session. Verifies that both calls
+        return the same filings as the blocking `getAllFilings`, and that no
+        client session is left unclosed.
+        """
+
+        # Test variables
+        cik = '0000000042'
+        standin = EdgarStandIn(filers={cik: 250}, default_filings=None)
+
+        with StandInServer(standin=standin) as server:
+            PyEDGAR.util.configureSession(base_url=server.base_url)
+            session = PyEDGAR.aio.configureSession(base_url=server.base_url)
+            session.limiter = PyEDGAR.aio.AsyncRateLimiter(rate=1000)
+
+            with self.assertLogs('asyncio', level='ERROR') as logs:
+                first = asyncio.run(PyEDGAR.aio.getAllFilings(
+                    cik=cik, max_workers=4))
+                second = asyncio.run(PyEDGAR.aio.getAllFilings(cik=cik))
+                # Collecting sessions that were not closed
+                gc.collect()
+                logging.getLogger('asyncio').error('Done')
+
+            expected = PyEDGAR.filings.getAllFilings(cik=cik)
+
+        # Verifying results, and that only the marker was logged
+        self.assertEqual(len(first), 250)
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertEqual(logs.output, ['ERROR:asyncio:Done'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+
+from requests import Response
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+
+class TestCache(unittest.TestCase):
+    """Test the `cache` in the `util` module.
+    """
+
+    def setUp(self):
+        # Temporary cache database
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_cacheHit(self):
+        """Test that fresh responses are served from the cache.
+
+        This test makes the same request twice through a cached session.
+        Verifies that only one request reaches the transport.
+        """
+
+        # Session with a fake transport
+        cache = PyEDGAR.util.ResponseCache(path=self.path)
+        session = PyEDGAR.util.session.EdgarSession(cache=cache)
+        adapter = FakeAdapter(lambda r: (200, b'page', dict()))
+        session.session.mount('https://', adapter)
+
+        # Making requests
+        params = {'CIK': '0000320193', 'action': 'getcompany'}
+        first = session.get('https://www.sec.gov/cgi-bin/browse-edgar',
+                            params=params, endpoint='info')
+        second = session.get('https://www.sec.gov/cgi-bin/browse-edgar',
+                             params=params, endpoint='info')
+
+        # Verifying the second response came from the cache
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(first.text, second.text)
+
+
+    def test_cacheRevalidation(self):
+        """Test that stale responses are revalidated with their ETag.
+
+        This test caches a response with a TTL of zero, then requests it
+        again from a server answering 304 Not Modified. Verifies that the
+        conditional request is sent, and the cached body is returned.
+        """
+
+        # Session with a fake transport answering 304 to conditional requests
+        def handler(request):
+            if request.headers.get('If-None-Match') == '"v1"':
+                return 304, b'', dict()
+            return 200, b'page', {'ETag': '"v1"'}
+
+        cache = PyEDGAR.util.ResponseCache(path=self.path, ttls={'info': 0})
+        session = PyEDGAR.util.session.EdgarSession(cache=cache)
+        adapter = FakeAdapter(handler)
+        session.session.mount('https://', adapter)
+
+        # Making requests
+        url = 'https://www.sec.gov/cgi-bin/browse-edgar'
+        session.get(url, params={'CIK': '1'}, endpoint='info')
+        r = session.get(url, params={'CIK': '1'}, endpoint='info')
+
+        # Verifying revalidation
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.text, 'page')
+
+
+    def test_cacheEviction(self):
+        """Test that the least recently used entries are evicted.
+
+        This test stores three incompressible bodies in a cache sized to hold
+        two. Verifies that the first entry is evicted.
+        """
+
+        # Cache sized for two entries
+        cache = PyEDGAR.util.ResponseCache(path=self.path, max_size=2500)
+
+        # Storing entries
+        for i in range(3):
+            r = Response()
+            r.status_code = 200
+            r.url = str(i)
+            r._content = os.urandom(1000)
+            cache.store(key=str(i), endpoint='info', response=r)
+
+        # Verifying eviction
+        self.assertIsNone(cache.lookup(key='0')[0])
+        self.assertIsNotNone(cache.lookup(key='2')[0])
+        self.assertLessEqual(cache.size(), 2500)
+
+
+    def test_cacheAccessTimes(self):
+        """Test that access times of cache hits are buffered, and used for
+        eviction.
+
+        This test stores two incompressible bodies in a cache sized to hold
+        two, looks up the first, and stores a third. Verifies that the lookup
+        does not write to the database, and that the second entry, now the
+        least recently used, is evicted.
+        """
+
+        # Cache sized for two entries
+        cache = PyEDGAR.util.ResponseCache(path=self.path, max_size=2500)
+
+        def store(key: str):
+            r = Response()
+            r.status_code = 200
+            r.url = key
+            r._content = os.urandom(1000)
+            cache.store(key=key, endpoint='info', response=r)
+
+        # Storing entries, and looking up the first
+        store('0')
+        store('1')
+        with sqlite3.connect(self.path) as conn:
+            query = 'SELECT accessed FROM responses WHERE key = ?'
+            accessed = conn.execute(query, ('0',)).fetchone()[0]
+            cache.lookup(key='0')
+            self.assertEqual(conn.execute(query, ('0',)).fetchone()[0],
+                             accessed)
+        store('2')
+
+        # Verifying eviction of the least recently used entry
+        self.assertIsNotNone(cache.lookup(key='0')[0])
+        self.assertIsNone(cache.lookup(key='1')[0])
+        cache.close()
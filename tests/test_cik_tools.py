@@ -1,5 +1,7 @@
 from context import PyEDGAR
 
+import os
+import tempfile
 import unittest
 
 
@@ -23,3 +25,57 @@ class TestCIKTools(unittest.TestCase):
 
         # Asserting equal
         self.assertEqual(candidate_cik, expected_cik)
+
+
+class TestTickerIndex(unittest.TestCase):
+    """Test the `ticker_index` in the `util` module.
+    """
+
+    def setUp(self):
+        # Test variables, in SEC bulk ticker mapping format
+        data = {'0': {'cik_str': 320193, 'ticker': 'AAPL',
+                      'title': 'Apple Inc.'},
+                '1': {'cik_str': 1067983, 'ticker': 'BRK-B',
+                      'title': 'BERKSHIRE HATHAWAY INC'},
+                '2': {'cik_str': 1067983, 'ticker': 'BRK-A',
+                      'title': 'BERKSHIRE HATHAWAY INC'}}
+        self.index = PyEDGAR.util.TickerIndex.fromJSON(data=data)
+        PyEDGAR.util.setTickerIndex(self.index)
+
+    def tearDown(self):
+        PyEDGAR.util.setTickerIndex(None)
+
+
+    def test_indexLookup(self):
+        """Test forward and reverse lookups in the ticker index.
+
+        Verifies that 'AAPL' and 'brk.b' resolve through `getCIK` without a
+        request, and that CIK '0001067983' has two tickers.
+        """
+
+        # Verifying forward lookups
+        self.assertEqual(PyEDGAR.util.getCIK(ticker='AAPL'), '0000320193')
+        self.assertEqual(PyEDGAR.util.getCIK(ticker='brk.b'), '0001067983')
+
+        # Verifying reverse lookup
+        self.assertEqual(sorted(PyEDGAR.util.getTickers(cik='0001067983')),
+                         ['BRK-A', 'BRK-B'])
+
+
+    def test_indexSaveLoad(self):
+        """Test saving and loading the ticker index.
+
+        Verifies that an index saved to disk and loaded back resolves the
+        same tickers.
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'company_tickers.json')
+
+            # Saving and loading index
+            self.index.save(path=path)
+            loaded = PyEDGAR.util.loadTickerIndex(path=path)
+
+        # Verifying lookups
+        self.assertEqual(len(loaded), 3)
+        self.assertEqual(loaded.getCIK(ticker='BRK-A'), '0001067983')
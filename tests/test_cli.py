@@ -0,0 +1,178 @@
+from context import PyEDGAR
+from fakes import FakeSession
+
+from unittest import mock
+import PyEDGAR.cli
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+class TestCLI(unittest.TestCase):
+    """Test the `cli` module.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+        # Inputs of a known and an unknown filer
+        self.input = os.path.join(self.dir, 'ciks.txt')
+        with open(self.input, 'w') as f:
+            f.write('320193\n0000000001\n')
+
+        # Installing a fake session serving 250 synthetic filings, which the
+        # exporter must not replace
+        self.session = FakeSession(cik='0000320193', total=250)
+        PyEDGAR.util.setSession(self.session)
+        self.patch = mock.patch.object(PyEDGAR.cli, 'configureSession')
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        PyEDGAR.util.setSession(None)
+        shutil.rmtree(self.dir)
+
+
+    def test_exportJSONL(self):
+        """Test JSONL export, and resuming from the checkpoint.
+
+        This test exports the filings of a known and an unknown filer, twice.
+        Verifies that the first run fails for the unknown filer only, that
+        the known filer's 250 filings are written, and that the second run
+        does not fetch the known filer again.
+        """
+
+        # Test variables
+        output = os.path.join(self.dir, 'out.jsonl')
+        argv = [self.input, '-o', output, '--fetch', 'filings']
+
+        # Exporting; failing for the unknown filer
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=argv)
+
+        with open(output) as f:
+            results = [json.loads(line) for line in f]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['cik'], '0000320193')
+        self.assertEqual(len(results[0]['filings']), 250)
+        with open(output + '.checkpoint') as f:
+            self.assertEqual(f.read(), '320193\n')
+
+        # Resuming; only the unknown filer is fetched again
+        self.session.requests.clear()
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=argv)
+        self.assertEqual(set(r['CIK'] for r in self.session.requests),
+                         {'0000000001'})
+
+
+    def test_exportComplete(self):
+        """Test a JSONL export in which all inputs succeed, and recovering
+        results written but not checkpointed.
+
+        This test exports the company information and filings of the known
+        filer, then empties the checkpoint and leaves an incomplete line in
+        the output, as an interruption would, and exports again. Verifies
+        that the first run exits normally, and that the second run does not
+        fetch the filer again, and leaves its result in the output once.
+        """
+
+        # Test variables
+        with open(self.input, 'w') as f:
+            f.write('320193\n')
+        output = os.path.join(self.dir, 'out.jsonl')
+        argv = [self.input, '-o', output]
+
+        # Exporting; exiting normally
+        PyEDGAR.cli.main(argv=argv)
+
+        with open(output) as f:
+            results = [json.loads(line) for line in f]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['info']['name'], 'SYNTHETIC CORP 320193')
+        self.assertEqual(len(results[0]['filings']), 250)
+
+        # Interrupting after writing, before checkpointing
+        open(output + '.checkpoint', 'w').close()
+        with open(output, 'a') as f:
+            f.write('{"input": "0000000001", "ci')
+
+        # Resuming; the written result is recovered
+        self.session.requests.clear()
+        PyEDGAR.cli.main(argv=argv)
+        self.assertEqual(self.session.requests, list())
+        with open(output) as f:
+            self.assertEqual([json.loads(line) for line in f], results)
+        with open(output + '.checkpoint') as f:
+            self.assertEqual(f.read(), '320193\n')
+
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_exportParquet(self):
+        """Test Parquet export with filing type filters.
+
+        This test exports the 10-K filings (including amendments) of the
+        known filer as Parquet. Verifies that one row is written per
+        matching filing.
+        """
+
+        # Test variables
+        output = os.path.join(self.dir, 'out.parquet')
+        expected = [f for f in self.session.filings
+                    if f['type'].startswith('10-K')]
+
+        # Exporting
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=[self.input, '-o', output, '--fetch',
+                                   'filings', '--types', '10-K'])
+
+        # Verifying rows
+        table = pq.read_table(output)
+        self.assertEqual(table.num_rows, len(expected))
+        self.assertEqual(set(table.column('type').to_pylist()),
+                         {'10-K', '10-K/A'})
+
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_restartParquet(self):
+        """Test restarting a Parquet export.
+
+        This test exports the filings of the known filer as Parquet, then
+        exports them again into the same dataset, without and with
+        `--restart`. Verifies that the run without a checkpoint is refused,
+        and that the restarted dataset holds each filing once.
+        """
+
+        # Test variables
+        output = os.path.join(self.dir, 'out.parquet')
+        argv = [self.input, '-o', output, '--fetch', 'filings']
+
+        # Exporting, then losing the checkpoint
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=argv)
+        os.remove(output + '.checkpoint')
+
+        # Exporting into the existing dataset; refused
+        self.session.requests.clear()
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=argv)
+        self.assertEqual(self.session.requests, list())
+
+        # Restarting; replacing the previous part files
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=argv + ['--restart'])
+        with self.assertRaises(SystemExit):
+            PyEDGAR.cli.main(argv=argv + ['--restart'])
+
+        # Verifying rows
+        table = pq.read_table(output)
+        self.assertEqual(table.num_rows, 250)
+        accessions = table.column('accession-number').to_pylist()
+        self.assertEqual(len(set(accessions)), 250)
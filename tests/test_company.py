@@ -1,5 +1,7 @@
 from context import PyEDGAR
+from fakes import FakeAdapter, FakeSession
 
+import os
 import unittest
 
 class TestEdgarCompany(unittest.TestCase):
@@ -143,3 +145,114 @@ class TestEdgarCompany(unittest.TestCase):
 
         # Check for equality
         self.assertTrue(all(check_equal))
+
+
+class TestEdgarCompanyParser(unittest.TestCase):
+    """Test the company page parsing engines in the `company` module.
+    """
+
+    def test_parserEngines(self):
+        """Test that the 'regex' and 'bs4' parsing engines agree.
+
+        This test parses a recorded company page, and a variant with an
+        escaped company name and a formatted phone number. Verifies that both
+        engines return identical company information.
+        """
+
+        # Test variables
+        parse = getattr(PyEDGAR.company.parser, '__parseHTML')
+        path = os.path.join(os.path.dirname(__file__), 'fixtures',
+                            'company_page.html')
+        with open(path) as f:
+            page = f.read()
+        variant = page.replace('EXXON MOBIL CORP <', 'AT&amp;T INC. <') \
+                      .replace('9729406000', '(972) 940-6000')
+
+        for page_html in (page, variant):
+            # Parsing with each engine
+            regex_info = parse(page_html=page_html, engine='regex')
+            bs4_info = parse(page_html=page_html, engine='bs4')
+
+            # Verifying results are identical
+            self.assertEqual(regex_info, bs4_info)
+
+        # Verifying variant was parsed
+        self.assertEqual(regex_info['name'], 'AT&T INC.')
+        self.assertEqual(regex_info['addresses'][1]['phone'], '9729406000')
+
+
+    def test_infoPipeline(self):
+        """Test parsing company pages in a process pool with `getInfoBatch`.
+
+        This test serves the recorded company page through a fake transport.
+        Verifies that with 2 parsing processes, the information of 3 CIKs is
+        returned in order, with each CIK reattached.
+        """
+
+        # Test variables
+        ciks = ['0000034088', '0000000001', '0000000002']
+        path = os.path.join(os.path.dirname(__file__), 'fixtures',
+                            'company_page.html')
+        with open(path, 'rb') as f:
+            page = f.read()
+        session = PyEDGAR.util.configureSession()
+        session.limiter = PyEDGAR.util.session.RateLimiter(rate=1000)
+        session.session.mount('https://', FakeAdapter(
+            lambda request: (200, page, dict())))
+
+        try:
+            # Getting company information in a batch
+            results = list(PyEDGAR.company.getInfoBatch(ciks=ciks,
+                                                        parse_workers=2))
+        finally:
+            PyEDGAR.util.setSession(None)
+
+        # Verifying results
+        self.assertEqual([cik for cik, _ in results], ciks)
+        self.assertEqual([info['cik'] for _, info in results], ciks)
+        self.assertEqual(results[0][1]['name'], 'EXXON MOBIL CORP')
+
+
+    def test_companyProfile(self):
+        """Test getting company information and filings together with
+        `getCompanyProfile`.
+
+        This test serves 250 synthetic filings, with company information on
+        each listings page. Verifies that the company information matches
+        the structure of `getInfo`, that all filings are returned, and that
+        only the listings pages are requested.
+        """
+
+        # Test variables
+        session = FakeSession(cik='0000000042', total=250)
+        PyEDGAR.util.setSession(session)
+
+        try:
+            # Getting company profile
+            profile = PyEDGAR.company.getCompanyProfile(cik=session.cik)
+        finally:
+            PyEDGAR.util.setSession(None)
+
+        # Expected result
+        expected_info = {
+            'addresses': [{'type': 'Mailing Address',
+                           'street_address': '42 MAIN ST SUITE 200 '
+                                             'SPRINGFIELD IL 62701'},
+                          {'type': 'Business Address',
+                           'phone': '2175550100',
+                           'street_address': '42 MAIN ST SPRINGFIELD IL '
+                                             '62701'}],
+            'name': 'SYNTHETIC CORP 42',
+            'former_names': [{'former_name': 'SYNTHETIC COMPUTER CORP 42',
+                              'filings_through': '2007-01-04'}],
+            'metadata': {'sic': '3571',
+                         'sic_type': 'ELECTRONIC COMPUTERS',
+                         'location': 'IL',
+                         'incorporation_state': 'DE',
+                         'fiscal_year_end': '12-31'},
+            'cik': session.cik}
+
+        # Verifying results
+        self.assertEqual(profile['info'], expected_info)
+        self.assertEqual(len(profile['filings']), 250)
+        self.assertEqual(len(session.requests), 3)
@@ -0,0 +1,161 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+from PyEDGAR.testing import makeFilings, makeListingsPage
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TestDocuments(unittest.TestCase):
+    """Test the `documents` in the `filings` module.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        # Listings of 3 synthetic filings
+        parse = getattr(PyEDGAR.filings.parser, '__parseHTML')
+        page = makeListingsPage(cik='0000320193',
+                                filings=makeFilings(cik='0000320193', total=3),
+                                start=0, count=100)
+        self.filings = parse(pages_html=[page])
+
+        # Documents served by the fake transport, by URL
+        self.documents = {
+            f['url'].replace('-index.htm', '.txt'):
+            (f['accession-number'] * 5000).encode()
+            for f in self.filings}
+
+        def handler(request):
+            body = self.documents[request.url]
+            if 'Range' in request.headers:
+                start = int(request.headers['Range'][6:-1])
+                return 206, body[start:], {'Content-Length':
+                                           str(len(body) - start)}
+            return 200, body, {'Content-Length': str(len(body))}
+
+        self.adapter = FakeAdapter(handler)
+        session = PyEDGAR.util.configureSession()
+        session.limiter = PyEDGAR.util.session.RateLimiter(rate=1000)
+        session.session.mount('https://', self.adapter)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        PyEDGAR.util.setSession(None)
+
+
+    def test_downloadDocuments(self):
+        """Test that documents are downloaded, and skipped once complete.
+
+        This test downloads the documents of 3 filings, twice. Verifies that
+        all 3 are requested unencoded and saved with the served contents,
+        that progress is reported, and that the second run makes no
+        requests.
+        """
+
+        # Test variables
+        progress = list()
+
+        # Downloading documents
+        results = dict(PyEDGAR.filings.downloadDocuments(
+            filings=self.filings, directory=self.dir, chunk_size=4096,
+            progress=lambda url, done, total: progress.append(done == total)))
+
+        # Verifying documents were saved
+        self.assertEqual(len(results), 3)
+        for url, body in self.documents.items():
+            path = os.path.join(self.dir, '320193', url.rpartition('/')[2])
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), body)
+        self.assertEqual(progress.count(True), 3)
+        self.assertTrue(all(r.headers['Accept-Encoding'] == 'identity'
+                            for r in self.adapter.requests))
+
+        # Verifying complete documents are skipped
+        self.adapter.requests.clear()
+        list(PyEDGAR.filings.downloadDocuments(filings=self.filings,
+                                               directory=self.dir))
+        self.assertEqual(len(self.adapter.requests), 0)
+
+
+    def test_resumeDownload(self):
+        """Test that partial downloads are resumed.
+
+        This test leaves the first 1000 bytes of a document in its partial
+        file. Verifies that the rest is requested with a Range header, and
+        that the document is completed with the served contents.
+        """
+
+        # Test variables
+        url, body = next(iter(self.documents.items()))
+        path = os.path.join(self.dir, '320193', url.rpartition('/')[2])
+        os.makedirs(os.path.dirname(path))
+        with open(path + '.part', 'wb') as f:
+            f.write(body[:1000])
+
+        # Downloading documents
+        list(PyEDGAR.filings.downloadDocuments(filings=self.filings[:1],
+                                               directory=self.dir))
+
+        # Verifying download was resumed
+        self.assertEqual(self.adapter.requests[0].headers['Range'],
+                         'bytes=1000-')
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), body)
+        self.assertFalse(os.path.exists(path + '.part'))
+
+
+    def test_verifyDownload(self):
+        """Test skipping complete documents by size, and verifying them.
+
+        This test corrupts a downloaded document without changing its size.
+        Verifies that it is skipped by default, and downloaded again with
+        `verify` set.
+        """
+
+        # Test variables
+        url, body = next(iter(self.documents.items()))
+        path = os.path.join(self.dir, '320193', url.rpartition('/')[2])
+        list(PyEDGAR.filings.downloadDocuments(filings=self.filings[:1],
+                                               directory=self.dir))
+        with open(path, 'r+b') as f:
+            f.write(b'X')
+
+        # Downloading again, without and with verification
+        self.adapter.requests.clear()
+        list(PyEDGAR.filings.downloadDocuments(filings=self.filings[:1],
+                                               directory=self.dir))
+        self.assertEqual(len(self.adapter.requests), 0)
+        list(PyEDGAR.filings.downloadDocuments(filings=self.filings[:1],
+                                               directory=self.dir,
+                                               verify=True))
+
+        # Verifying the document was downloaded again
+        self.assertEqual(len(self.adapter.requests), 1)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), body)
+
+
+    def test_unverifiableDownload(self):
+        """Test downloading documents without a Content-Length.
+
+        This test serves a document without its size. Verifies that it is
+        saved without a checksum file, and downloaded again on the next run.
+        """
+
+        # Test variables
+        url, body = next(iter(self.documents.items()))
+        path = os.path.join(self.dir, '320193', url.rpartition('/')[2])
+        self.adapter.handler = lambda request: (200, body, dict())
+
+        # Downloading document twice
+        for _ in range(2):
+            list(PyEDGAR.filings.downloadDocuments(filings=self.filings[:1],
+                                                   directory=self.dir))
+
+        # Verifying document was saved, but not as complete
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), body)
+        self.assertFalse(os.path.exists(path + '.sha256'))
+        self.assertEqual(len(self.adapter.requests), 2)
@@ -1,5 +1,8 @@
 from context import PyEDGAR
+from fakes import FakeSession
+from PyEDGAR.testing import makeFilings, makeListingsPage
 
+from itertools import takewhile
 import unittest
 
 
@@ -22,3 +25,249 @@ class TestEdgarFilings(unittest.TestCase):
 
         # Verifying over 550 filings were retrieved
         self.assertGreater(len(candidate_filings), 550)
+
+
+class TestEdgarFilingsOffline(unittest.TestCase):
+    """Test the `filings` module against synthetic listings pages.
+    """
+
+    def setUp(self):
+        # Installing a fake session serving 550 synthetic filings
+        self.session = FakeSession(cik='0000320193', total=550)
+        PyEDGAR.util.setSession(self.session)
+
+    def tearDown(self):
+        PyEDGAR.util.setSession(None)
+
+
+    def test_concurrentPagination(self):
+        """Test concurrent pagination in `getAllFilings`.
+
+        Verifies that fetching pages with 4 workers returns the same ordered
+        filings as fetching them serially.
+        """
+
+        # Getting filings serially and concurrently
+        serial = PyEDGAR.filings.getAllFilings(cik=self.session.cik)
+        concurrent = PyEDGAR.filings.getAllFilings(cik=self.session.cik,
+                                                   max_workers=4)
+
+        # Verifying results are identical
+        self.assertEqual(len(serial), 550)
+        self.assertEqual(serial, concurrent)
+
+
+    def test_batchFilings(self):
+        """Test getting filings for many companies with `getAllFilingsBatch`.
+
+        Verifies that the known CIK returns its 550 filings, and that the
+        unknown CIK returns an exception without aborting the batch.
+        """
+
+        # Getting filings in a batch
+        results = dict(PyEDGAR.filings.getAllFilingsBatch(
+            ciks=[self.session.cik, '0000000000']))
+
+        # Verifying results
+        self.assertEqual(len(results[self.session.cik]), 550)
+        self.assertIsInstance(results['0000000000'], Exception)
+
+
+    def test_batchFilingsPipeline(self):
+        """Test parsing filings in a process pool with `getAllFilingsBatch`.
+
+        Verifies that with 2 parsing processes, results are returned in the
+        order of the CIKs, that the known CIK returns the same filings as
+        `getAllFilings`, and that the unknown CIK returns an exception.
+        """
+
+        # Test variables
+        ciks = ['0000000000', self.session.cik, '0000000001']
+
+        # Getting filings in a batch
+        results = list(PyEDGAR.filings.getAllFilingsBatch(
+            ciks=ciks, parse_workers=2))
+
+        # Verifying results
+        self.assertEqual([cik for cik, _ in results], ciks)
+        self.assertEqual(results[1][1],
+                         PyEDGAR.filings.getAllFilings(cik=self.session.cik))
+        self.assertIsInstance(results[0][1], Exception)
+        self.assertIsInstance(results[2][1], Exception)
+
+
+    def test_newFilings(self):
+        """Test getting only new filings with `getNewFilings`.
+
+        This test uses the accession number of the 150th newest filing.
+        Verifies that the 149 newer filings are returned, and that only the
+        first two pages are requested.
+        """
+
+        # Newest known filing
+        all_filings = PyEDGAR.filings.getAllFilings(cik=self.session.cik)
+        last_accession = all_filings[149]['accession-number']
+        self.session.requests.clear()
+
+        # Getting new filings
+        new_filings = PyEDGAR.filings.getNewFilings(
+            cik=self.session.cik, last_accession=last_accession)
+
+        # Verifying new filings, and that pagination stopped early
+        self.assertEqual(new_filings, all_filings[:149])
+        self.assertEqual(len(self.session.requests), 2)
+
+
+    def test_newFilingsBatch(self):
+        """Test getting new filings for many companies with
+        `getNewFilingsBatch`.
+
+        This test uses the accession number of the 150th newest filing, and
+        the date of the 300th newest filing, both alone and in dictionaries.
+        Verifies that the 149 newer filings are returned for the accession
+        number, and the filings up to the first older than the date for the
+        date.
+        """
+
+        # Test variables
+        all_filings = PyEDGAR.filings.getAllFilings(cik=self.session.cik)
+        last_accession = all_filings[149]['accession-number']
+        since = all_filings[299]['date']
+        expected = list(takewhile(lambda f: f['date'] >= since,
+                                  all_filings))
+
+        for last_known, new in (
+                (last_accession, all_filings[:149]),
+                ({'accession': last_accession}, all_filings[:149]),
+                (since, expected),
+                ({'since': since}, expected)):
+            # Getting new filings in a batch
+            results = dict(PyEDGAR.filings.getNewFilingsBatch(
+                last_known={self.session.cik: last_known}))
+
+            # Verifying new filings
+            self.assertEqual(results[self.session.cik], new)
+
+
+    def test_iterFilings(self):
+        """Test lazily iterating filings with `iterFilings`.
+
+        Verifies that taking the first 10 filings only requests the first
+        page, and that the full iteration matches `getAllFilings`.
+        """
+
+        # Taking the first 10 filings
+        iterator = PyEDGAR.filings.iterFilings(cik=self.session.cik)
+        first = [next(iterator) for _ in range(10)]
+
+        # Verifying only one page was requested
+        self.assertEqual(len(self.session.requests), 1)
+
+        # Verifying the full iteration matches
+        all_filings = PyEDGAR.filings.getAllFilings(cik=self.session.cik)
+        self.assertEqual(first + list(iterator), all_filings)
+
+
+    def test_filingsByType(self):
+        """Test getting filings by type and date with `getFilingByType`.
+
+        Verifies that the results match filtering all filings locally, and
+        that the type and date filters are sent to the server.
+        """
+
+        # Expected results, filtered locally
+        all_filings = PyEDGAR.filings.getAllFilings(cik=self.session.cik)
+        since, before = all_filings[300]['date'], all_filings[100]['date']
+        expected = [f for f in all_filings if f['type'] == '10-K'
+                    and since <= f['date'] <= before]
+        self.session.requests.clear()
+
+        # Getting filings by type
+        candidate = PyEDGAR.filings.getFilingByType(
+            cik=self.session.cik, filing_type='10-K', exact=True, since=since,
+            before=before)
+
+        # Verifying results, and that filters were sent to the server
+        self.assertEqual(candidate, expected)
+        self.assertEqual(self.session.requests[0]['type'], '10-K')
+        self.assertEqual(self.session.requests[0]['dateb'],
+                         before.replace('-', ''))
+
+
+class TestEdgarFilingsParser(unittest.TestCase):
+    """Test the listings parsing engines in the `filings` module.
+    """
+
+    def test_parserEngines(self):
+        """Test that the 'etree' and 'bs4' parsing engines agree.
+
+        This test parses two synthetic listings pages, one of which has an
+        entry with an item description and an entry missing optional fields.
+        Verifies that both engines return identical filings.
+        """
+
+        # Test variables
+        parse = getattr(PyEDGAR.filings.parser, '__parseHTML')
+        filings = makeFilings(cik='0000320193', total=150)
+        pages = [makeListingsPage(cik='0000320193', filings=filings, start=i,
+                                  count=100) for i in (0, 100)]
+        # Adding an item description, and removing optional fields
+        pages[1] = pages[1].replace(
+            '<act>34</act>',
+            '<items-desc>Item 2.02 &amp; 9.01</items-desc>', 1)
+        pages[1] = pages[1].replace('<size>11 MB</size>', '', 1)
+
+        # Parsing with each engine
+        etree_filings = parse(pages_html=pages, engine='etree')
+        bs4_filings = parse(pages_html=pages, engine='bs4')
+
+        # Verifying results are identical
+        self.assertEqual(len(etree_filings), 150)
+        self.assertEqual(etree_filings, bs4_filings)
+        self.assertEqual(etree_filings[100]['description'], 'Item 2.02 & 9.01')
+        self.assertEqual(etree_filings[100]['size'], '')
+
+
+
+    @unittest.skipIf(PyEDGAR.filings.container.np is None,
+                     'NumPy is not installed')
+    def test_columnarFilings(self):
+        """Test the columnar `Filings` container.
+
+        This test builds a container from 150 synthetic filings, two of which
+        have non-integer sizes. Verifies that iterating the container returns
+        the original filings, that no column holds Python objects, and that
+        vectorized filtering matches filtering the filings locally.
+        """
+
+        # Test variables
+        parse = getattr(PyEDGAR.filings.parser, '__parseHTML')
+        filings = makeFilings(cik='0000320193', total=150)
+        pages = [makeListingsPage(cik='0000320193', filings=filings, start=0,
+                                  count=150)]
+        filings_parsed = parse(pages_html=pages)
+        # Adding non-integer sizes
+        filings_parsed[1]['size'] = '1.5 MB'
+        filings_parsed[2]['size'] = '20.25 KB'
+
+        # Building container
+        container = PyEDGAR.filings.Filings.fromRecords(filings_parsed)
+
+        # Verifying round trip
+        self.assertEqual(list(container), filings_parsed)
+        self.assertEqual(container.size[0], 11 * 1024 ** 2)
+        self.assertEqual(container.size[1], 1536 * 1024)
+        self.assertEqual(container.size[2], 20736)
+
+        # Verifying columns are compact
+        self.assertEqual(container.columns['accession-number'].dtype, 'S20')
+        self.assertFalse(any(v.dtype == object
+                             for v in container.columns.values()))
+        self.assertEqual(container.dictionaries['name'], ['Synthetic filing'])
+
+        # Verifying filtering
+        expected = [f for f in filings_parsed if f['type'] == '10-K'
+                    and f['date'] >= '2000-01-01']
+        candidate = container.filterType('10-K', exact=True) \
+            .filterDate(since='2000-01-01')
+        self.assertEqual(list(candidate), expected)
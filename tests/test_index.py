@@ -0,0 +1,124 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+
+# Path of the recorded 'form' index file
+FORM_INDEX_PATH = os.path.join(os.path.dirname(__file__), 'fixtures',
+                               'form.idx')
+
+# Contents of a 'master' index file
+MASTER_INDEX = '''Description:           Master Index of EDGAR Dissemination Feed
+Last Data Received:    December 31, 2023
+Comments:              webmaster@sec.gov
+Anonymous FTP:         ftp://ftp.sec.gov/edgar/
+ 
+ 
+ 
+ 
+CIK|Company Name|Form Type|Date Filed|Filename
+--------------------------------------------------------------------------------
+320193|APPLE INC|10-K|2023-11-03|edgar/data/320193/0000320193-23-000106.txt
+34088|EXXON MOBIL CORP|10-Q|2023-11-03|edgar/data/34088/0000034088-23-000062.txt
+34088|EXXON MOBIL CORP|8-K|2023-10-27|edgar/data/34088/0000034088-23-000057.txt
+'''
+
+
+class TestFullIndex(unittest.TestCase):
+    """Test the `index` module.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        PyEDGAR.util.setSession(None)
+
+
+    def test_formIndex(self):
+        """Test parsing of a fixed-width 'form' index file.
+
+        This test parses the recorded 'form' index file. Verifies that all
+        5 filings are read, that form types and company names containing
+        spaces and Latin-1 characters are split correctly, and that the
+        records have the fields of `getAllFilings`.
+        """
+
+        # Test variables
+        filings = list(PyEDGAR.index.iterIndex(source=FORM_INDEX_PATH))
+        listing_fields = set(PyEDGAR.filings.parser.REQUIRED_FIELDS) | \
+            set(PyEDGAR.filings.parser.OPTIONAL_FIELDS)
+
+        # Verifying all filings were read
+        self.assertEqual(len(filings), 5)
+
+        # Verifying fields of the first filing
+        self.assertEqual(filings[0]['accession-number'],
+                         '0000320193-23-000106')
+        self.assertEqual(filings[0]['type'], '10-K')
+        self.assertEqual(filings[0]['date'], '2023-11-03')
+        self.assertEqual(filings[0]['cik'], '0000320193')
+        self.assertEqual(filings[0]['company'], 'APPLE INC')
+        self.assertEqual(filings[0]['url'],
+                         'https://www.sec.gov/Archives/edgar/data/320193/'
+                         '000032019323000106/0000320193-23-000106-index.htm')
+        self.assertTrue(listing_fields <= set(filings[0]))
+
+        # Verifying columns containing spaces
+        self.assertEqual(filings[4]['type'], 'SC 13G')
+        self.assertEqual(filings[4]['company'], 'NESTL\xc9 HOLDINGS INC')
+
+
+    def test_masterIndexGzip(self):
+        """Test parsing of a gzipped 'master' index file, with type filters.
+
+        This test writes a gzipped 'master' index file with 3 filings.
+        Verifies that all 3 are read, and that filtering by '10' includes 2
+        and filtering exactly by '8-K' includes 1.
+        """
+
+        # Test variables
+        path = os.path.join(self.dir, 'master.gz')
+        with gzip.open(path, 'wb') as f:
+            f.write(MASTER_INDEX.encode('latin-1'))
+
+        # Verifying filings and type filters
+        self.assertEqual(len(list(PyEDGAR.index.iterIndex(source=path))), 3)
+        self.assertEqual(len(list(PyEDGAR.index.iterIndex(
+            source=path, filing_type='10'))), 2)
+        filings = list(PyEDGAR.index.iterIndex(source=path,
+                                               filing_type='8-K', exact=True))
+        self.assertEqual(len(filings), 1)
+        self.assertEqual(filings[0]['cik'], '0000034088')
+        self.assertEqual(filings[0]['company'], 'EXXON MOBIL CORP')
+
+
+    def test_fullIndexDownload(self):
+        """Test streaming of a quarterly full-index file from EDGAR.
+
+        This test serves a gzipped 'master' index file through a fake
+        transport. Verifies that the quarterly index URL is requested, and
+        that all 3 filings are read.
+        """
+
+        # Test variables
+        body = gzip.compress(MASTER_INDEX.encode('latin-1'))
+        adapter = FakeAdapter(lambda request: (200, body, dict()))
+        session = PyEDGAR.util.configureSession()
+        session.session.mount('https://', adapter)
+
+        # Getting index
+        filings = PyEDGAR.index.getFullIndex(year=2023, quarter=4,
+                                             index_type='master')
+
+        # Verifying request and filings
+        self.assertEqual(adapter.requests[0].url,
+                         'https://www.sec.gov/Archives/edgar/full-index/2023/'
+                         'QTR4/master.gz')
+        self.assertEqual(len(filings), 3)
@@ -0,0 +1,150 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+from PyEDGAR.testing import makeFilings, makeListingsPage
+
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+import time
+import unittest
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test the `instrumentation` in the `util` module.
+    """
+
+    def setUp(self):
+        # Session serving 250 synthetic filings through a fake transport
+        filings = makeFilings(cik='0000320193', total=250)
+
+        def handler(request):
+            params = parse_qs(urlsplit(request.url).query)
+            page = makeListingsPage(cik='0000320193', filings=filings,
+                                    start=int(params['start'][0]),
+                                    count=int(params['count'][0]))
+            return 200, page.encode(), dict()
+
+        session = PyEDGAR.util.configureSession()
+        session.limiter = PyEDGAR.util.session.RateLimiter(rate=1000)
+        session.session.mount('https://', FakeAdapter(handler))
+
+        # Registering hooks
+        self.counters = PyEDGAR.util.instrumentation.Counters()
+        self.histogram = PyEDGAR.util.instrumentation.Histogram()
+        PyEDGAR.util.addHook(self.counters)
+        PyEDGAR.util.addHook(self.histogram)
+
+    def tearDown(self):
+        PyEDGAR.util.removeHook(self.counters)
+        PyEDGAR.util.removeHook(self.histogram)
+        PyEDGAR.util.setSession(None)
+
+
+    def test_requestAndParseEvents(self):
+        """Test that requests and parse stages are reported to hooks.
+
+        This test gets 250 filings, spread over three listings pages.
+        Verifies that three requests and three parsed pages with 250 entries
+        are counted, and that request latencies are recorded.
+        """
+
+        # Getting filings
+        PyEDGAR.filings.getAllFilings(cik='0000320193')
+
+        # Verifying counts
+        counts = self.counters.snapshot()
+        self.assertEqual(counts['requests.filings'], 3)
+        self.assertEqual(counts['status.200'], 3)
+        self.assertEqual(counts['parse.filings.pages'], 3)
+        self.assertEqual(counts['parse.filings.entries'], 250)
+
+        # Verifying latencies
+        self.assertEqual(self.histogram.summary()['count'], 3)
+
+
+    def test_disabled(self):
+        """Test that removed hooks no longer receive events.
+
+        Verifies that no events are counted after the hooks are removed.
+        """
+
+        # Removing hooks and getting filings
+        PyEDGAR.util.removeHook(self.counters)
+        PyEDGAR.util.removeHook(self.histogram)
+        PyEDGAR.filings.getAllFilings(cik='0000320193')
+
+        # Verifying nothing was counted
+        self.assertFalse(PyEDGAR.util.instrumentation.enabled())
+        self.assertEqual(self.counters.snapshot(), dict())
+
+
+    def test_hookAddedDuringParse(self):
+        """Test that hooks added while a parse is running do not break it.
+
+        This test adds the hooks while the first of three listings pages is
+        being parsed. Verifies that all 250 filings are parsed, and that the
+        parse, which started without hooks, is not reported.
+        """
+
+        # Test variables
+        pages = [makeListingsPage(cik='0000320193',
+                                  filings=makeFilings(cik='0000320193',
+                                                      total=250),
+                                  start=start, count=100)
+                 for start in (0, 100, 200)]
+        parse = getattr(PyEDGAR.filings.parser, '__parseHTML')
+        parse_page = getattr(PyEDGAR.filings.parser, '__parsePageFilingsXML')
+
+        def addHooks(**kwargs):
+            PyEDGAR.util.addHook(self.counters)
+            return parse_page(**kwargs)
+
+        # Removing hooks, then adding them again during the parse
+        PyEDGAR.util.removeHook(self.counters)
+        PyEDGAR.util.removeHook(self.histogram)
+        with mock.patch.object(PyEDGAR.filings.parser,
+                               '__parsePageFilingsXML', addHooks):
+            filings = parse(pages_html=pages)
+
+        # Verifying the parse completed, unreported
+        self.assertEqual(len(filings), 250)
+        self.assertNotIn('parse.filings.pages', self.counters.snapshot())
+
+
+    def test_measureParse(self):
+        """Test `measureParse` with a parsing generator.
+
+        This test measures a generator yielding 3 entries to a consumer that
+        busy waits between them. Verifies that one parse event is reported
+        with 3 entries, and that the consumer's time counts towards its wall
+        time but not its CPU time.
+        """
+
+        # Test variables
+        measureParse = PyEDGAR.util.instrumentation.measureParse
+        events = list()
+        hook = events.append
+
+        def parse():
+            with measureParse(stage='test', pages=2) as counter:
+                for entry in range(3):
+                    counter.entries += 1
+                    counter.suspend()
+                    yield entry
+                    counter.resume()
+
+        # Consuming entries, busy waiting between them
+        PyEDGAR.util.addHook(hook)
+        try:
+            for _ in parse():
+                end = time.perf_counter() + 0.02
+                while time.perf_counter() < end:
+                    pass
+        finally:
+            PyEDGAR.util.removeHook(hook)
+
+        # Verifying event
+        self.assertEqual(len(events), 1)
+        self.assertEqual((events[0].stage, events[0].pages,
+                          events[0].entries), ('test', 2, 3))
+        self.assertGreaterEqual(events[0].wall_time, 0.06)
+        self.assertLess(events[0].cpu_time, 0.02)
@@ -0,0 +1,110 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+from PyEDGAR.testing import makeFilings, makeListingsPage
+
+import os
+import unittest
+
+
+class TestManifest(unittest.TestCase):
+    """Test the filing manifests in the `filings` module.
+    """
+
+    def setUp(self):
+        # Listings of 5 synthetic filings
+        parse = getattr(PyEDGAR.filings.parser, '__parseHTML')
+        page = makeListingsPage(cik='0000000077',
+                                filings=makeFilings(cik='0000000077', total=5),
+                                start=0, count=100)
+        self.filings = parse(pages_html=[page])
+
+        # Recorded filing index page, served for every filing
+        path = os.path.join(os.path.dirname(__file__), 'fixtures',
+                            'filing_index.html')
+        with open(path, 'rb') as f:
+            page = f.read()
+
+        self.adapter = FakeAdapter(lambda request: (200, page, dict()))
+        PyEDGAR.util.configureMemo()
+        session = PyEDGAR.util.configureSession()
+        session.limiter = PyEDGAR.util.session.RateLimiter(rate=1000)
+        session.session.mount('https://', self.adapter)
+
+    def tearDown(self):
+        PyEDGAR.util.setMemo(None)
+        PyEDGAR.util.setSession(None)
+
+
+    def test_parseIndexPage(self):
+        """Test parsing a recorded filing index page.
+
+        Verifies that the form, dates and all 6 documents are extracted,
+        with inline XBRL viewer links resolved to the document URL.
+        """
+
+        # Getting manifest
+        manifest = PyEDGAR.filings.getManifest(filing=self.filings[0])
+
+        # Verifying filing information
+        self.assertEqual(manifest['accession-number'],
+                         self.filings[0]['accession-number'])
+        self.assertEqual(manifest['form'], '10-K')
+        self.assertEqual(manifest['filing_date'], '2019-10-31')
+        self.assertEqual(manifest['period'], '2019-09-28')
+
+        # Verifying documents
+        documents = manifest['documents']
+        self.assertEqual([d['type'] for d in documents],
+                         ['10-K', 'EX-4.1', 'EX-21.1', '', 'EX-101.SCH',
+                          'XML'])
+        self.assertEqual(documents[0], {
+            'seq': '1',
+            'description': '10-K',
+            'document': 'a10-k20199282019.htm',
+            'type': '10-K',
+            'size': 1838069,
+            'url': 'https://www.sec.gov/Archives/edgar/data/320193/'
+                   '000032019319000119/a10-k20199282019.htm'})
+        self.assertEqual(documents[2]['description'],
+                         'EXHIBIT 21.1 & SUBSIDIARIES')
+
+
+    def test_batchManifests(self):
+        """Test getting manifests with `getManifests`, and their memoization.
+
+        This test requests the manifests of 5 filings, one of them twice,
+        and then all 5 again, with memoization enabled. Verifies that each
+        manifest is returned under its accession number, that each index page
+        is requested once, and that modifying a manifest does not affect the
+        memoized one.
+        """
+
+        # Getting manifests, with a duplicate filing
+        results = list(PyEDGAR.filings.getManifests(
+            filings=self.filings + self.filings[:1], max_workers=3))
+
+        # Verifying results
+        self.assertEqual(len(results), 6)
+        for accession_number, manifest in results:
+            self.assertEqual(manifest['accession-number'], accession_number)
+            self.assertEqual(len(manifest['documents']), 6)
+        self.assertEqual(sorted(r.url for r in self.adapter.requests),
+                         sorted(f['url'] for f in self.filings))
+
+        # Getting manifests again, after modifying one; memoized
+        results[0][1]['documents'].clear()
+        self.adapter.requests.clear()
+        results = dict(PyEDGAR.filings.getManifests(filings=self.filings))
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(len(m['documents']) == 6
+                            for m in results.values()))
+        self.assertEqual(self.adapter.requests, [])
+
+        # Verifying manifests are not memoized once memoization is disabled
+        PyEDGAR.util.setMemo(None)
+        PyEDGAR.filings.getManifest(filing=self.filings[0])
+        self.assertEqual(len(self.adapter.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
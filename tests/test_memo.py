@@ -0,0 +1,228 @@
+from context import PyEDGAR
+from fakes import FakeSession
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
+import unittest
+
+
+class TestMemo(unittest.TestCase):
+    """Test the `memo` in the `util` module.
+    """
+
+    def setUp(self):
+        self.memo = PyEDGAR.util.configureMemo(max_size=2, ttl=60)
+
+    def tearDown(self):
+        PyEDGAR.util.setMemo(None)
+        PyEDGAR.util.setSession(None)
+
+
+    def test_singleFlight(self):
+        """Test that concurrent calls for the same key share one call.
+
+        This test calls a slow memoized function from 8 threads at once.
+        Verifies that the function runs once, that 7 calls waited for it, and
+        that all callers get equal results, each their own copy.
+        """
+
+        # Test variables
+        calls = list()
+        barrier = threading.Barrier(8)
+
+        @PyEDGAR.util.memo.memoized
+        def fetch(cik: str) -> dict:
+            calls.append(cik)
+            time.sleep(0.2)
+            return {'cik': cik}
+
+        def call(_):
+            barrier.wait()
+            return fetch('0000320193')
+
+        # Calling concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(call, range(8)))
+
+        # Verifying calls were coalesced
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(len(set(id(r) for r in results)), 8)
+        stats = self.memo.stats()
+        self.assertEqual((stats['misses'], stats['coalesced']), (1, 7))
+
+
+    def test_lruAndErrors(self):
+        """Test LRU eviction, keying by bound arguments, and errors.
+
+        This test calls a memoized function with a cache of 2 results.
+        Verifies that positional and keyword calls share a key, that the
+        least recently used result is evicted, and that exceptions are not
+        cached.
+        """
+
+        # Test variables
+        calls = list()
+
+        @PyEDGAR.util.memo.memoized
+        def fetch(cik: str, engine: str='regex') -> str:
+            calls.append(cik)
+            if cik == 'bad':
+                raise LookupError('Not found')
+            return cik
+
+        # Calling with the same bound arguments
+        fetch('a')
+        fetch(cik='a', engine='regex')
+        self.assertEqual(calls, ['a'])
+
+        # Evicting the least recently used result
+        fetch('b')
+        fetch('a')
+        fetch('c')
+        fetch('a')
+        fetch('b')
+        self.assertEqual(calls, ['a', 'b', 'c', 'b'])
+        self.assertEqual(self.memo.stats()['evictions'], 2)
+
+        # Verifying exceptions are not cached
+        for _ in range(2):
+            with self.assertRaises(LookupError):
+                fetch('bad')
+        self.assertEqual(calls.count('bad'), 2)
+
+
+    def test_async(self):
+        """Test that concurrent coroutines for the same key share one call.
+
+        This test gathers 5 calls of a memoized coroutine function. Verifies
+        that it runs once.
+        """
+
+        # Test variables
+        calls = list()
+
+        @PyEDGAR.util.memo.memoized
+        async def fetch(cik: str) -> str:
+            calls.append(cik)
+            await asyncio.sleep(0.05)
+            return cik
+
+        async def main():
+            return await asyncio.gather(*[fetch('a') for _ in range(5)])
+
+        # Calling concurrently
+        results = asyncio.run(main())
+
+        # Verifying calls were coalesced
+        self.assertEqual(results, ['a'] * 5)
+        self.assertEqual(len(calls), 1)
+
+
+    def test_asyncCancellation(self):
+        """Test cancelling the coroutine computing a coalesced call.
+
+        This test starts a memoized coroutine function, and a second call
+        waiting for it, then cancels the first call. Verifies that the first
+        call raises `CancelledError`, and that the waiting call computes and
+        returns the result in its place.
+        """
+
+        # Test variables
+        calls = list()
+
+        @PyEDGAR.util.memo.memoized
+        async def fetch(cik: str) -> str:
+            calls.append(cik)
+            await asyncio.sleep(0.05)
+            return cik
+
+        async def main():
+            first = asyncio.ensure_future(fetch('a'))
+            await asyncio.sleep(0.01)
+            second = asyncio.ensure_future(fetch('a'))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return await second
+
+        # Calling concurrently, cancelling the first call
+        result = asyncio.run(main())
+
+        # Verifying the waiting call took over
+        self.assertEqual(result, 'a')
+        self.assertEqual(calls, ['a', 'a'])
+
+
+    def test_copyResult(self):
+        """Test copying memoized results.
+
+        Verifies that lists and dictionaries are copied, and that the strings
+        they hold are shared.
+        """
+
+        # Test variables
+        result = [{'cik': '0000320193', 'names': ['APPLE INC']}]
+
+        # Copying result
+        copied = PyEDGAR.util.memo.copyResult(result)
+
+        # Verifying containers were copied and strings shared
+        self.assertEqual(copied, result)
+        self.assertIsNot(copied[0], result[0])
+        self.assertIsNot(copied[0]['names'], result[0]['names'])
+        self.assertIs(copied[0]['cik'], result[0]['cik'])
+
+
+    def test_memoizedFilings(self):
+        """Test that `getAllFilings` is memoized when enabled.
+
+        Verifies that getting the filings of a CIK twice requests its
+        listings pages once, that modifying the first result does not affect
+        the second, and that no results are memoized once memoization is
+        disabled.
+        """
+
+        # Test variables
+        session = FakeSession(cik='0000320193', total=250)
+        PyEDGAR.util.setSession(session)
+
+        # Getting filings twice, modifying the first result
+        first = PyEDGAR.filings.getAllFilings(cik='0000320193')
+        first.pop()
+        first[0]['type'] = 'modified'
+        second = PyEDGAR.filings.getAllFilings(cik='0000320193')
+
+        # Verifying pages were requested once, and results are independent
+        self.assertEqual(len(session.requests), 3)
+        self.assertEqual(len(second), 250)
+        self.assertNotEqual(second[0]['type'], 'modified')
+
+        # Verifying memoization can be disabled
+        PyEDGAR.util.setMemo(None)
+        PyEDGAR.filings.getAllFilings(cik='0000320193')
+        self.assertEqual(len(session.requests), 6)
+
+
+    def test_newFilingsNotMemoized(self):
+        """Test that `getNewFilings` is not memoized.
+
+        Verifies that getting new filings twice requests the first listings
+        page twice, so that filings made in between are not missed.
+        """
+
+        # Test variables
+        session = FakeSession(cik='0000320193', total=250)
+        PyEDGAR.util.setSession(session)
+        last_accession = session.filings[10]['accession']
+
+        # Getting new filings twice
+        for _ in range(2):
+            PyEDGAR.filings.getNewFilings(cik='0000320193',
+                                          last_accession=last_accession)
+
+        # Verifying both calls were requested
+        self.assertEqual(len(session.requests), 2)
@@ -0,0 +1,118 @@
+from context import PyEDGAR
+from PyEDGAR.testing import EdgarStandIn, StandInServer
+
+import unittest
+
+
+class TestStandInServer(unittest.TestCase):
+    """Test the EDGAR stand-in server in the `testing` module.
+    """
+
+    def setUp(self):
+        self.standin = EdgarStandIn(filers={'0000000042': 250,
+                                            '0000000043': 2500},
+                                    tickers={'EXMP': '0000000042'},
+                                    default_filings=None)
+
+    def tearDown(self):
+        PyEDGAR.util.setSession(None)
+
+    def __configureSession(self, server: StandInServer, **kwargs):
+        session = PyEDGAR.util.configureSession(base_url=server.base_url,
+                                                **kwargs)
+        session.limiter = PyEDGAR.util.session.RateLimiter(rate=1000)
+        return session
+
+
+    def test_standInEndpoints(self):
+        """Test the stand-in server with all downloaders.
+
+        Verifies that ticker searches, company pages and paginated, filtered
+        listings are served, and parsed consistently by PyEDGAR.
+        """
+
+        with StandInServer(standin=self.standin) as server:
+            self.__configureSession(server=server)
+
+            cik = PyEDGAR.util.getCIK(ticker='EXMP')
+            info = PyEDGAR.company.getInfo(cik=cik)
+            filings = PyEDGAR.filings.getAllFilings(cik=cik, max_workers=2)
+            annual = PyEDGAR.filings.getFilingByType(cik=cik,
+                                                     filing_type='10-K')
+            profile = PyEDGAR.company.getCompanyProfile(cik=cik)
+
+            with self.assertRaises(LookupError):
+                PyEDGAR.util.getCIK(ticker='NONE')
+
+        # Verifying results
+        self.assertEqual(cik, '0000000042')
+        self.assertEqual(info['name'], 'SYNTHETIC CORP 42')
+        self.assertEqual(info['metadata'], profile['info']['metadata'])
+        self.assertEqual(info['former_names'],
+                         profile['info']['former_names'])
+        self.assertEqual(len(filings), 250)
+        self.assertEqual(profile['filings'], filings)
+        self.assertEqual(annual, [f for f in filings
+                                  if f['type'].startswith('10-K')])
+        self.assertEqual(sorted(filings, key=lambda f: f['date'],
+                                reverse=True), filings)
+
+
+    def test_standInFailures(self):
+        """Test error injection and throttling of the stand-in server.
+
+        This test fails every 4th request and throttles every 5th, while
+        fetching 25 listings pages with 3 workers. Verifies that retried
+        requests still return all filings, and that errors and throttling
+        were observed.
+        """
+
+        # Test variables; fewer errors than retries can be injected in all,
+        # and throttling does not count towards retries
+        policy = PyEDGAR.util.RetryPolicy(max_retries=100, backoff_base=0.01)
+        breaker = PyEDGAR.util.CircuitBreaker(failure_threshold=100)
+
+        with StandInServer(standin=self.standin, error_every=4,
+                           throttle_every=5, retry_after=0.01) as server:
+            self.__configureSession(server=server, retry_policy=policy,
+                                    circuit_breaker=breaker)
+
+            filings = PyEDGAR.filings.getAllFilings(cik='0000000043',
+                                                    max_workers=3)
+            stats = server.stats()
+
+        # Verifying results
+        self.assertEqual(len(filings), 2500)
+        self.assertEqual(len(set(f['accession-number'] for f in filings)),
+                         2500)
+        self.assertEqual(stats['status.500'], stats['requests'] // 4
+                         - stats['requests'] // 20)
+        self.assertEqual(stats['status.429'], stats['requests'] // 5)
+
+
+    def test_standInThrottling(self):
+        """Test the default session against the throttling of the stand-in
+        server.
+
+        This test throttles requests above 10 per second, without errors,
+        while fetching 25 listings pages with 8 workers and the default
+        retry policy. Verifies that all filings are returned, and that
+        throttling was observed.
+        """
+
+        with StandInServer(standin=self.standin, max_rate=10,
+                           retry_after=0.1) as server:
+            self.__configureSession(server=server)
+
+            filings = PyEDGAR.filings.getAllFilings(cik='0000000043',
+                                                    max_workers=8)
+            stats = server.stats()
+
+        # Verifying results
+        self.assertEqual(len(filings), 2500)
+        self.assertGreater(stats.get('status.429', 0), 0)
+        self.assertNotIn('status.500', stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
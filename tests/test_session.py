@@ -0,0 +1,158 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+
+import time
+import unittest
+
+
+class TestSession(unittest.TestCase):
+    """Test the `session` in the `util` module.
+    """
+
+    def test_rateLimit(self):
+        """Test that the rate limiter spaces out requests.
+
+        This test acquires 6 tokens from a limiter with a rate of 10 tokens
+        per second. Verifies that it takes at least 0.5 seconds.
+        """
+
+        # Test variables
+        limiter = PyEDGAR.util.session.RateLimiter(rate=10)
+
+        # Acquiring tokens
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Verifying requests were spaced out
+        self.assertGreaterEqual(elapsed, 0.45)
+
+
+    def test_rateCap(self):
+        """Test that the session rate is capped at the EDGAR limit.
+
+        This test configures a session with a rate of 50 requests per second.
+        Verifies that the rate is capped at 10 requests per second.
+        """
+
+        # Creating session
+        session = PyEDGAR.util.session.EdgarSession(max_rate=50)
+
+        # Verifying rate was capped
+        self.assertEqual(session.limiter.rate, 10)
+
+
+    def test_retryAfter(self):
+        """Test that throttled requests are retried after the delay requested
+        by the server.
+
+        This test answers the first two requests with 429 and a Retry-After
+        of 0.2 seconds, and the third with 200. Verifies that the response
+        succeeds after 3 requests, spaced out by the Retry-After delay.
+        """
+
+        # Test variables
+        statuses = [429, 429, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            return status, b'ok', {'Retry-After': '0.2'}
+
+        session = PyEDGAR.util.session.EdgarSession()
+        adapter = FakeAdapter(handler)
+        session.session.mount('https://', adapter)
+
+        # Making request
+        start = time.monotonic()
+        r = session.get(url='https://www.sec.gov/cgi-bin/browse-edgar')
+        elapsed = time.monotonic() - start
+
+        # Verifying request was retried after the requested delay
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(len(adapter.requests), 3)
+        self.assertGreaterEqual(elapsed, 0.35)
+
+
+    def test_throttleBudget(self):
+        """Test that throttling does not count as failures.
+
+        This test answers the first 12 requests with 429 and a Retry-After
+        of 0.01 seconds, and the next with 200, with a retry policy of 2
+        retries and a circuit breaker opening after 3 failures. Verifies that
+        the response succeeds after 13 requests, and that the circuit stays
+        closed.
+        """
+
+        # Test variables
+        statuses = [429] * 12 + [200]
+        policy = PyEDGAR.util.RetryPolicy(max_retries=2, backoff_base=0.01)
+        breaker = PyEDGAR.util.CircuitBreaker(failure_threshold=3)
+
+        def handler(request):
+            return statuses.pop(0), b'ok', {'Retry-After': '0.01'}
+
+        session = PyEDGAR.util.session.EdgarSession(retry_policy=policy,
+                                                    circuit_breaker=breaker)
+        adapter = FakeAdapter(handler)
+        session.session.mount('https://', adapter)
+
+        # Making request
+        r = session.get(url='https://www.sec.gov/cgi-bin/browse-edgar')
+
+        # Verifying request outlasted the throttling
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(len(adapter.requests), 13)
+        self.assertTrue(breaker.allow(host='www.sec.gov'))
+
+
+    def test_throttleWaitMax(self):
+        """Test that throttled requests are given up after the longest
+        throttling wait.
+
+        This test answers all requests with 429 and a Retry-After of 0.1
+        seconds, with a longest throttling wait of 0.25 seconds. Verifies
+        that the 429 response is returned after 3 requests.
+        """
+
+        # Test variables
+        policy = PyEDGAR.util.RetryPolicy(throttle_wait_max=0.25)
+
+        session = PyEDGAR.util.session.EdgarSession(retry_policy=policy)
+        adapter = FakeAdapter(lambda request: (429, b'',
+                                               {'Retry-After': '0.1'}))
+        session.session.mount('https://', adapter)
+
+        # Making request
+        r = session.get(url='https://www.sec.gov/cgi-bin/browse-edgar')
+
+        # Verifying throttling response was returned
+        self.assertEqual(r.status_code, 429)
+        self.assertEqual(len(adapter.requests), 3)
+
+
+    def test_circuitBreaker(self):
+        """Test that the circuit breaker stops requests to a failing host.
+
+        This test answers all requests with 500, with a circuit breaker
+        opening after 3 failures and a retry policy of 5 retries. Verifies
+        that the request fails with `CircuitOpenError` after 3 requests, and
+        that requests to other hosts are unaffected.
+        """
+
+        # Test variables
+        policy = PyEDGAR.util.RetryPolicy(max_retries=5, backoff_base=0.01)
+        breaker = PyEDGAR.util.CircuitBreaker(failure_threshold=3)
+
+        session = PyEDGAR.util.session.EdgarSession(retry_policy=policy,
+                                                    circuit_breaker=breaker)
+        adapter = FakeAdapter(lambda request: (500, b'', dict()))
+        session.session.mount('https://', adapter)
+
+        # Verifying circuit opened after 3 failures
+        with self.assertRaises(PyEDGAR.util.retry.CircuitOpenError):
+            session.get(url='https://www.sec.gov/cgi-bin/browse-edgar')
+        self.assertEqual(len(adapter.requests), 3)
+
+        # Verifying other hosts are unaffected
+        self.assertTrue(breaker.allow(host='data.sec.gov'))
@@ -0,0 +1,96 @@
+from context import PyEDGAR
+from PyEDGAR.testing import makeFilings, makeListingsPage
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TestFilingsStore(unittest.TestCase):
+    """Test the `store` module.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.store = PyEDGAR.store.FilingsStore(
+            path=os.path.join(self.dir, 'filings.db'))
+
+        # Listings of 2500 synthetic filings, over two years, for each of 2
+        # companies
+        parse = getattr(PyEDGAR.filings.parser, '__parseHTML')
+        self.filings = dict()
+        for cik in ('0000034088', '0000320193'):
+            page = makeListingsPage(cik=cik,
+                                    filings=makeFilings(cik=cik, total=2500),
+                                    start=0, count=2500)
+            self.filings[cik] = parse(pages_html=[page])
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.dir)
+
+
+    def test_upsert(self):
+        """Test that storing filings is idempotent.
+
+        This test stores the filings of 2 companies, then the filings of one
+        of them again, with a changed description. Verifies that 5000 filings
+        are stored, and that the description was updated.
+        """
+
+        # Storing filings
+        for cik, filings in self.filings.items():
+            self.store.upsertFilings(filings=filings, cik=cik)
+        filings = [dict(f, description='Updated')
+                   for f in self.filings['0000034088']]
+        self.store.upsertFilings(filings=filings, cik='0000034088')
+
+        # Verifying filings were updated in place
+        self.assertEqual(len(self.store), 5000)
+        newest = max(filings, key=lambda f: (f['date'],
+                                             f['accession-number']))
+        stored = self.store.query(cik='0000034088', limit=1)[0]
+        self.assertEqual(stored['cik'], '0000034088')
+        self.assertEqual({k: v for k, v in stored.items() if k != 'cik'},
+                         newest)
+
+
+    def test_query(self):
+        """Test querying filings by form type, year and SIC code.
+
+        This test stores the filings of 2 companies, and the information of
+        one of them (SIC code 2911). Verifies that querying for 10-K filings
+        in 2018 by SIC code 2911 returns the matching filings of that company
+        only, and that exact type matching excludes amendments.
+        """
+
+        # Test variables
+        with open(os.path.join(os.path.dirname(__file__), 'fixtures',
+                               'company_page.html')) as f:
+            parse = getattr(PyEDGAR.company.parser, '__parseHTML')
+            info = dict(parse(page_html=f.read()), cik='0000034088')
+
+        # Storing filings and company information
+        for cik, filings in self.filings.items():
+            self.store.upsertFilings(filings=filings, cik=cik)
+        self.store.upsertInfo(info=info)
+
+        # Expected filings, newest first
+        expected = sorted([f for f in self.filings['0000034088']
+                           if f['type'].startswith('10-K')
+                           and f['date'].startswith('2018')],
+                          key=lambda f: (f['date'], f['accession-number']),
+                          reverse=True)
+
+        # Verifying query results
+        filings = self.store.query(filing_type='10-K', year=2018, sic='2911')
+        self.assertGreater(len(expected), 0)
+        self.assertEqual([f['accession-number'] for f in filings],
+                         [f['accession-number'] for f in expected])
+        exact = self.store.query(filing_type='10-K', exact=True, year=2018,
+                                 sic='2911')
+        self.assertEqual(len(exact), len([f for f in expected
+                                          if f['type'] == '10-K']))
+        self.assertEqual(self.store.getInfo(cik='0000034088')['name'],
+                         'EXXON MOBIL CORP')
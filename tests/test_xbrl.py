@@ -0,0 +1,94 @@
+from context import PyEDGAR
+from fakes import FakeAdapter
+
+import math
+import os
+import unittest
+
+
+# Path of the XBRL instance document fixture
+INSTANCE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures',
+                             'instance.xml')
+
+
+class TestXBRL(unittest.TestCase):
+    """Test the `xbrl` module.
+    """
+
+    def tearDown(self):
+        PyEDGAR.util.setSession(None)
+
+
+    def test_parseInstance(self):
+        """Test parsing of an XBRL instance document.
+
+        This test parses an instance document with 6 facts, some referring
+        to contexts and units defined after them. Verifies that periods,
+        units, dimensions, nil facts and non-numeric facts are resolved.
+        """
+
+        # Test variables
+        facts = PyEDGAR.xbrl.parseInstance(source=INSTANCE_PATH)
+
+        # Verifying all facts were read
+        self.assertEqual(len(facts), 6)
+        self.assertEqual(facts[0]['concept'], 'dei:DocumentType')
+        self.assertEqual(facts[0]['value'], '10-K')
+        self.assertIsNone(facts[0]['unit'])
+
+        # Verifying duration, and dimensions
+        revenues = list(facts.filterConcept(concept='us-gaap:Revenues'))
+        self.assertEqual(len(revenues), 2)
+        self.assertEqual(revenues[0]['value'], 383285000000.0)
+        self.assertEqual((revenues[0]['start'], revenues[0]['end']),
+                         ('2022-09-25', '2023-09-30'))
+        self.assertEqual(revenues[0]['dimensions'], dict())
+        self.assertEqual(revenues[1]['dimensions'],
+                         {'srt:ProductOrServiceAxis': 'aapl:IPhoneMember'})
+
+        # Verifying units, instants and nil facts
+        self.assertEqual(facts[3]['unit'], 'USD/shares')
+        self.assertEqual((facts[4]['start'], facts[4]['end']),
+                         ('', '2023-09-30'))
+        self.assertEqual(facts[4]['entity'], '0000320193')
+        self.assertIsNone(facts[5]['value'])
+
+
+    def test_numericOnly(self):
+        """Test that non-numeric values are dropped if not requested.
+
+        This test parses the instance document without text. Verifies that
+        the non-numeric fact has no value, and that numeric values are kept.
+        """
+
+        # Test variables
+        facts = PyEDGAR.xbrl.parseInstance(source=INSTANCE_PATH,
+                                           include_text=False)
+
+        # Verifying values
+        self.assertIsNone(facts[0]['value'])
+        self.assertTrue(math.isnan(facts.columns['value'][0]))
+        self.assertEqual(facts[3]['value'], 6.16)
+
+
+    def test_getFacts(self):
+        """Test streaming of an XBRL instance document from EDGAR.
+
+        This test serves the instance document through a fake transport.
+        Verifies that all 6 facts are read.
+        """
+
+        # Test variables
+        with open(INSTANCE_PATH, 'rb') as f:
+            body = f.read()
+        session = PyEDGAR.util.configureSession()
+        session.session.mount('https://', FakeAdapter(
+            lambda request: (200, body, dict())))
+
+        # Getting facts
+        facts = PyEDGAR.xbrl.getFacts(url='https://www.sec.gov/Archives/edgar/'
+                                      'data/320193/000032019323000106/'
+                                      'aapl-20230930_htm.xml')
+
+        # Verifying facts were read
+        self.assertEqual(len(facts), 6)